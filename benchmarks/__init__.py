@@ -0,0 +1,3 @@
+"""
+Benchmarks of `edu_xlsx` on synthetic timetables, run with `python -m benchmarks`
+"""
@@ -0,0 +1,112 @@
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import gettempdir
+from json import dumps as json_dumps, loads as json_loads
+
+import sys
+
+from typing import List, Dict, Any
+
+
+argument_parser: ArgumentParser = ArgumentParser(prog="benchmarks", description="Times load, parse and save of synthetic timetables")
+argument_parser.add_argument("--classes", nargs="+", default=[10, 100, 500, 2000], type=int, required=False, help="Workbook sizes, classes count")
+argument_parser.add_argument("--timetable-numbers", nargs="+", default=["1", "2"], choices=["1", "2"], required=False)
+argument_parser.add_argument("--engine", nargs="+", default=["openpyxl", "ooxml"], choices=["openpyxl", "ooxml"], required=False)
+argument_parser.add_argument("--read-only", action="store_true", default=False)
+argument_parser.add_argument("--models", nargs="+", default=["pydantic", "light"], choices=["pydantic", "light"], required=False)
+argument_parser.add_argument("--store", default="objects", choices=["objects", "columnar"], required=False)
+argument_parser.add_argument("--json-encoder", default="json", choices=["auto", "orjson", "ujson", "json"], required=False)
+argument_parser.add_argument("--repeat", default=3, type=int, required=False)
+argument_parser.add_argument("--seed", default=0, type=int, required=False)
+argument_parser.add_argument("--workbooks-dir", default=str(Path(gettempdir()) / "edu_xlsx_benchmarks"), required=False, help="Generated workbooks are kept here between runs")
+argument_parser.add_argument("--output", default=None, required=False, help="Results .JSON file")
+argument_parser.add_argument("--baseline", default=None, required=False, help="Results .JSON of an earlier run to compare with")
+argument_parser.add_argument("--max-ratio", default=1.25, type=float, required=False, help="Phase slower than baseline by more times is a regression")
+
+
+def main() -> None:
+    arguments: Namespace = argument_parser.parse_args()
+
+    from benchmarks.generator import ensure_workbook
+    from benchmarks.runner import PHASES, run_benchmark, get_environment, find_regressions
+
+    results: List[Dict[str, Any]] = []
+
+    for timetable_number in arguments.timetable_numbers:
+        for classes_count in arguments.classes:
+            workbook_filepath: Path = ensure_workbook(
+                workbooks_dir = Path(arguments.workbooks_dir),
+                timetable_number = timetable_number,
+                classes_count = classes_count,
+                seed = arguments.seed
+            )
+
+            for engine in arguments.engine:
+                for models in arguments.models:
+                    result: Dict[str, Any] = run_benchmark(
+                        workbook_filepath = workbook_filepath,
+                        timetable_number = timetable_number,
+                        classes_count = classes_count,
+                        parser_options = dict(
+                            engine = engine,
+                            read_only = arguments.read_only,
+                            models = models,
+                            store = arguments.store
+                        ),
+                        json_encoder = arguments.json_encoder,
+                        repeat = arguments.repeat
+                    )
+
+                    results.append(result)
+
+                    print(
+                        "timetable {timetable_number}, {classes} classes ({cards} cards), {engine}/{models}: {phases}".format(
+                            timetable_number = timetable_number,
+                            classes = classes_count,
+                            cards = result["cards"],
+                            engine = engine,
+                            models = models,
+                            phases = ", ".join([
+                                "{phase} {seconds:.3f}s {peak_memory:.1f}MiB".format(
+                                    phase = phase,
+                                    seconds = result["seconds"][phase],
+                                    peak_memory = result["peak_memory_bytes"][phase] / 1024 / 1024
+                                )
+                                for phase in PHASES
+                            ])
+                        )
+                    )
+
+    if arguments.output:
+        Path(arguments.output).write_text(
+            json_dumps(
+                obj = dict(
+                    environment = get_environment(),
+                    results = results
+                ),
+                ensure_ascii = False,
+                indent = 2
+            ),
+            encoding = "utf-8"
+        )
+
+    if arguments.baseline:
+        regressions: List[Dict[str, Any]] = find_regressions(
+            results = results,
+            baseline_results = json_loads(Path(arguments.baseline).read_bytes())["results"],
+            max_ratio = arguments.max_ratio
+        )
+
+        for regression in regressions:
+            print(
+                "Regression in {phase} of {case}: {seconds:.3f}s vs {baseline_seconds:.3f}s ({ratio:.2f}x)".format(
+                    **regression
+                )
+            )
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
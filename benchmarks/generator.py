@@ -0,0 +1,196 @@
+from pathlib import Path
+from random import Random
+
+from edu_xlsx.utils import import_datas_module
+
+from typing import List, Any, Union, BinaryIO
+
+
+DAYS_NAMES: List[str] = [
+    "Понедельник",
+    "Вторник",
+    "Среда",
+    "Четверг",
+    "Пятница"
+]
+
+CLASS_LETTERS: str = "АӘБВГҒДЕЖЗИКҚЛМН"
+
+SUBJECTS_NAMES: List[str] = [
+    "Алгебра",
+    "Геометрия",
+    "Физика",
+    "Химия",
+    "Биология",
+    "География",
+    "Информатика",
+    "Қазақ тілі",
+    "Қазақ әдебиеті",
+    "Орыс тілі",
+    "Орыс әдебиеті",
+    "Шетел тілі",
+    "Қазақстан тарихы",
+    "Дүниежүзі тарихы",
+    "Дене шынықтыру",
+    "Көркем еңбек",
+    "Музыка",
+    "Құқық негіздері",
+    "Графика және жобалау",
+    "3Д модельдеу"
+]
+
+# Lessons split between two teachers, as the groups of a class
+SPLIT_SUBJECTS_NAMES: List[str] = [
+    "Шетел тілі",
+    "Информатика",
+    "Көркем еңбек"
+]
+
+
+def get_class_name(i: int) -> str:
+    # "8 А", ..., "11 Н", then "8 А2" and so on
+    grades_count: int = 4
+    letters_count: int = len(CLASS_LETTERS)
+
+    cycle, rest = divmod(i, grades_count * letters_count)
+    grade, letter_index = divmod(rest, letters_count)
+
+    return "{grade} {letter}{suffix}".format(
+        grade = 8 + grade,
+        letter = CLASS_LETTERS[letter_index],
+        suffix = (
+            cycle + 1
+            if cycle
+            else
+            ""
+        )
+    )
+
+
+def generate_sheet_rows(timetable_number: str, classes_count: int, fill_ratio: float=0.8, seed: int=0) -> List[List[Any]]:
+    """
+    Rows in the layout the parser expects: 4 header rows, then a 4-row block per class
+    (subjects, classes, classrooms, teachers) with class names in column "A"
+    and `periods count × 5 days` lesson columns
+    """
+
+    random: Random = Random(seed)
+
+    periods_count: int = len(import_datas_module(
+        timetable_number = timetable_number
+    ).periods)
+
+    columns_count: int = periods_count * len(DAYS_NAMES)
+
+    teachers_names: List[str] = [
+        "Мұғалім{0} {1}.{2}.".format(i, CLASS_LETTERS[i % len(CLASS_LETTERS)], CLASS_LETTERS[i * 7 % len(CLASS_LETTERS)])
+        for i in range(max(classes_count * 2, 10))
+    ]
+
+    classrooms_count: int = max(classes_count, 10)
+
+    days_row: List[Any] = [None] * (columns_count + 1)
+
+    for i, day_name in enumerate(DAYS_NAMES):
+        days_row[1 + i * periods_count] = day_name
+
+    rows: List[List[Any]] = [
+        [],
+        [],
+        days_row,
+        ["Класс"] + [
+            "{}.".format(column % periods_count + 1)
+            for column in range(columns_count)
+        ]
+    ]
+
+    for i in range(classes_count):
+        class_name: str = get_class_name(i)
+
+        subjects_row: List[Any] = [class_name]
+        classes_row: List[Any] = [None]
+        classrooms_row: List[Any] = [None]
+        teachers_row: List[Any] = [None]
+
+        for _ in range(columns_count):
+            if random.random() >= fill_ratio:
+                subjects_row.append(None)
+                classes_row.append(None)
+                classrooms_row.append(None)
+                teachers_row.append(None)
+                continue
+
+            subject_name: str = random.choice(SUBJECTS_NAMES)
+
+            subjects_row.append(subject_name)
+            classes_row.append(class_name)
+
+            if subject_name in SPLIT_SUBJECTS_NAMES:
+                # Same cell formats as real timetables: "318 ,319 ", "315, 522"
+                classrooms_row.append("{0} ,{1} ".format(
+                    random.randrange(100, 100 + classrooms_count),
+                    random.randrange(100, 100 + classrooms_count)
+                ))
+
+                teachers_row.append(", ".join(random.sample(teachers_names, 2)))
+
+            else:
+                classrooms_row.append(random.randrange(100, 100 + classrooms_count))
+                teachers_row.append(random.choice(teachers_names))
+
+        rows.extend([subjects_row, classes_row, classrooms_row, teachers_row])
+
+    return rows
+
+
+def generate_workbook(output: Union[str, Path, BinaryIO], timetable_number: str, classes_count: int, fill_ratio: float=0.8, seed: int=0) -> None:
+    from openpyxl import Workbook
+
+    workbook: Workbook = Workbook(
+        write_only = True
+    )
+
+    sheet = workbook.create_sheet()
+
+    for row in generate_sheet_rows(
+        timetable_number = timetable_number,
+        classes_count = classes_count,
+        fill_ratio = fill_ratio,
+        seed = seed
+    ):
+        sheet.append(row)
+
+    workbook.save(output)
+
+
+def get_workbook_filepath(workbooks_dir: Path, timetable_number: str, classes_count: int, seed: int=0) -> Path:
+    # Name ends with the timetable number, as the CLI expects
+    return workbooks_dir / "synthetic_{classes_count}_seed{seed}_{timetable_number}.xlsx".format(
+        classes_count = classes_count,
+        seed = seed,
+        timetable_number = timetable_number
+    )
+
+
+def ensure_workbook(workbooks_dir: Path, timetable_number: str, classes_count: int, seed: int=0) -> Path:
+    workbook_filepath: Path = get_workbook_filepath(
+        workbooks_dir = workbooks_dir,
+        timetable_number = timetable_number,
+        classes_count = classes_count,
+        seed = seed
+    )
+
+    if not workbook_filepath.exists():
+        workbooks_dir.mkdir(
+            parents = True,
+            exist_ok = True
+        )
+
+        generate_workbook(
+            output = workbook_filepath,
+            timetable_number = timetable_number,
+            classes_count = classes_count,
+            seed = seed
+        )
+
+    return workbook_filepath
@@ -0,0 +1,153 @@
+"""
+Load test of a running `python -m edu_xlsx serve`, run with `python -m benchmarks.load_test`
+"""
+
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import gettempdir
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError, URLError
+from json import dumps as json_dumps, loads as json_loads
+from time import perf_counter
+
+from typing import List, Dict, Tuple
+
+
+argument_parser: ArgumentParser = ArgumentParser(prog="benchmarks.load_test", description="Sends concurrent conversions to a local edu_xlsx service")
+argument_parser.add_argument("--url", default="http://127.0.0.1:8080", required=False)
+argument_parser.add_argument("--workbook", default=None, required=False, help=".XLSX to upload, a synthetic one by default")
+argument_parser.add_argument("--classes", default=100, type=int, required=False, help="Synthetic workbook size, classes count")
+argument_parser.add_argument("--timetable-number", default="1", choices=["1", "2"], required=False)
+argument_parser.add_argument("--requests", default=200, type=int, required=False)
+argument_parser.add_argument("--concurrency", default=8, type=int, required=False)
+argument_parser.add_argument("--timeout", default=120.0, type=float, required=False)
+argument_parser.add_argument("--workbooks-dir", default=str(Path(gettempdir()) / "edu_xlsx_benchmarks"), required=False)
+
+
+def send_request(url: str, xlsx_data: bytes, timeout: float) -> Tuple[int, float]:
+    """
+    Returns the response status (0 when the connection failed) and seconds
+    """
+
+    request: Request = Request(
+        url = url,
+        data = xlsx_data,
+        headers = {
+            "Content-Type": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+        },
+        method = "POST"
+    )
+
+    start_time: float = perf_counter()
+
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            response.read()
+            status: int = response.status
+
+    except HTTPError as exception:
+        status = exception.code
+
+    except (URLError, OSError):
+        status = 0
+
+    return status, perf_counter() - start_time
+
+
+def main() -> None:
+    arguments: Namespace = argument_parser.parse_args()
+
+    from edu_xlsx.metrics import get_percentiles
+
+    if arguments.workbook:
+        workbook_filepath: Path = Path(arguments.workbook)
+
+    else:
+        from benchmarks.generator import ensure_workbook
+
+        workbook_filepath = ensure_workbook(
+            workbooks_dir = Path(arguments.workbooks_dir),
+            timetable_number = arguments.timetable_number,
+            classes_count = arguments.classes,
+            seed = 0
+        )
+
+    xlsx_data: bytes = workbook_filepath.read_bytes()
+
+    convert_url: str = "{url}/convert?timetable_number={timetable_number}".format(
+        url = arguments.url.rstrip("/"),
+        timetable_number = arguments.timetable_number
+    )
+
+    start_time: float = perf_counter()
+
+    with ThreadPoolExecutor(max_workers=arguments.concurrency) as executor:
+        responses: List[Tuple[int, float]] = list(executor.map(
+            lambda _: send_request(
+                url = convert_url,
+                xlsx_data = xlsx_data,
+                timeout = arguments.timeout
+            ),
+            range(arguments.requests)
+        ))
+
+    total_seconds: float = perf_counter() - start_time
+
+    statuses: Dict[int, int] = {}
+
+    for status, _ in responses:
+        statuses[status] = statuses.get(status, 0) + 1
+
+    succeeded_seconds: List[float] = [
+        seconds
+        for status, seconds in responses
+        if status == 200
+    ]
+
+    print(
+        "{requests} requests of {size} KiB, concurrency {concurrency}: {total_seconds:.2f}s, {rate:.1f} requests/s".format(
+            requests = arguments.requests,
+            size = len(xlsx_data) // 1024,
+            concurrency = arguments.concurrency,
+            total_seconds = total_seconds,
+            rate = arguments.requests / total_seconds
+        )
+    )
+
+    print(
+        "Statuses: {statuses}".format(
+            statuses = ", ".join([
+                "{0}: {1}".format(status or "connection failed", count)
+                for status, count in sorted(statuses.items())
+            ])
+        )
+    )
+
+    print(
+        "Latency of succeeded: {percentiles}".format(
+            percentiles = ", ".join([
+                "{0} {1:.1f}ms".format(name, seconds * 1000)
+                for name, seconds in get_percentiles(succeeded_seconds).items()
+            ])
+        )
+    )
+
+    try:
+        with urlopen("{url}/health".format(url=arguments.url.rstrip("/")), timeout=arguments.timeout) as response:
+            health: dict = json_loads(response.read())
+
+    except (URLError, OSError):
+        return
+
+    print("Service:")
+
+    print(json_dumps(
+        obj = health,
+        ensure_ascii = False,
+        indent = 2
+    ))
+
+
+if __name__ == "__main__":
+    main()
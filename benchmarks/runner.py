@@ -0,0 +1,164 @@
+from pathlib import Path
+from io import BytesIO
+from time import perf_counter
+from platform import python_version, platform
+
+import gc
+import tracemalloc
+
+from edu_xlsx.parser import XLSXParser
+
+from typing import List, Dict, Tuple, Callable, Any, Optional
+
+
+PHASES: Tuple[str, ...] = (
+    "load",
+    "parse",
+    "save"
+)
+
+
+def run_phases(workbook_filepath: Path, timetable_number: str, parser_options: Dict[str, Any], json_encoder: str, trace_memory: bool=False) -> Dict[str, Any]:
+    """
+    Runs load (workbook opening), parse and save (to memory) once,
+    with `trace_memory` records each phase's peak of allocated memory instead of its time
+    """
+
+    result: Dict[str, Any] = {}
+
+    xlsx_parser: XLSXParser = XLSXParser(
+        xlsx_filepath = workbook_filepath,
+        timetable_number = timetable_number,
+        **parser_options
+    )
+
+    json_file: BytesIO = BytesIO()
+
+    phases_functions: Dict[str, Callable[[], None]] = dict(
+        load = lambda: (xlsx_parser._open_sheet(), xlsx_parser._load_datas()),
+        parse = xlsx_parser.parse,
+        save = lambda: xlsx_parser.save(
+            json_filepath = json_file,
+            json_encoder = json_encoder
+        )
+    )
+
+    gc.collect()
+
+    for phase in PHASES:
+        if trace_memory:
+            tracemalloc.start()
+
+            phases_functions[phase]()
+
+            result[phase] = tracemalloc.get_traced_memory()[1]
+
+            tracemalloc.stop()
+
+        else:
+            start_time: float = perf_counter()
+
+            phases_functions[phase]()
+
+            result[phase] = perf_counter() - start_time
+
+    xlsx_parser.close()
+
+    result["cards"] = len(xlsx_parser._cards)
+    result["output_bytes"] = len(json_file.getvalue())
+
+    return result
+
+
+def run_benchmark(workbook_filepath: Path, timetable_number: str, classes_count: int, parser_options: Dict[str, Any], json_encoder: str, repeat: int=3) -> Dict[str, Any]:
+    """
+    Best time of `repeat` runs for every phase and peak memory of one more traced run
+    """
+
+    timings: List[Dict[str, Any]] = [
+        run_phases(
+            workbook_filepath = workbook_filepath,
+            timetable_number = timetable_number,
+            parser_options = parser_options,
+            json_encoder = json_encoder
+        )
+        for _ in range(repeat)
+    ]
+
+    memory: Dict[str, Any] = run_phases(
+        workbook_filepath = workbook_filepath,
+        timetable_number = timetable_number,
+        parser_options = parser_options,
+        json_encoder = json_encoder,
+        trace_memory = True
+    )
+
+    return dict(
+        timetable_number = timetable_number,
+        classes = classes_count,
+        cards = timings[0]["cards"],
+        output_bytes = timings[0]["output_bytes"],
+        json_encoder = json_encoder,
+        **parser_options,
+        seconds = {
+            phase: min([
+                timing[phase]
+                for timing in timings
+            ])
+            for phase in PHASES
+        },
+        peak_memory_bytes = {
+            phase: memory[phase]
+            for phase in PHASES
+        }
+    )
+
+
+def get_environment() -> Dict[str, str]:
+    from edu_xlsx import __version__
+
+    return dict(
+        edu_xlsx = __version__,
+        python = python_version(),
+        platform = platform()
+    )
+
+
+def get_result_key(result: Dict[str, Any]) -> Tuple[Any, ...]:
+    return tuple([
+        result.get(field)
+        for field in ("timetable_number", "classes", "engine", "read_only", "models", "store", "json_encoder")
+    ])
+
+
+def find_regressions(results: List[Dict[str, Any]], baseline_results: List[Dict[str, Any]], max_ratio: float) -> List[Dict[str, Any]]:
+    """
+    Phases slower than the same baseline case by more than `max_ratio` times
+    """
+
+    baseline_results_from_key: Dict[Tuple[Any, ...], Dict[str, Any]] = {
+        get_result_key(baseline_result): baseline_result
+        for baseline_result in baseline_results
+    }
+
+    regressions: List[Dict[str, Any]] = []
+
+    for result in results:
+        baseline_result: Optional[Dict[str, Any]] = baseline_results_from_key.get(get_result_key(result))
+
+        if baseline_result is None:
+            continue
+
+        for phase in PHASES:
+            ratio: float = result["seconds"][phase] / max(baseline_result["seconds"][phase], 1e-9)
+
+            if ratio > max_ratio:
+                regressions.append(dict(
+                    case = get_result_key(result),
+                    phase = phase,
+                    seconds = result["seconds"][phase],
+                    baseline_seconds = baseline_result["seconds"][phase],
+                    ratio = ratio
+                ))
+
+    return regressions
@@ -1,4 +1,22 @@
-from .parser import XLSXParser
-
-
-__version__ = "1.1.dev2"
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .parser import XLSXParser
+
+
+__version__ = "1.1.dev2"
+
+
+def __getattr__(name: str) -> Any:
+    # Parser (with openpyxl and pydantic) is imported on first access, so `import edu_xlsx` stays fast
+    if name == "XLSXParser":
+        from .parser import XLSXParser
+
+        return XLSXParser
+
+    raise AttributeError(
+        "module {module_name!r} has no attribute {name!r}".format(
+            module_name = __name__,
+            name = name
+        )
+    )
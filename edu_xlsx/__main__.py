@@ -1,44 +1,483 @@
-from argparse import ArgumentParser, Namespace
-from pathlib import Path
-
-
-argument_parser: ArgumentParser = ArgumentParser()
-argument_parser.add_argument("input")
-argument_parser.add_argument("output")
-argument_parser.add_argument("--indent", default=None, type=int, required=False)
-argument_parser.add_argument("--use-temp", action="store_true", default=False)
-
-arguments: Namespace = argument_parser.parse_args()
-arguments.input = Path(arguments.input)
-arguments.output = Path(arguments.output)
-
-
-if arguments.use_temp:
-    from edu_xlsx.temp_parser import TempXLSXParser as XLSXParser
-else:
-    from edu_xlsx import XLSXParser
-
-
-print(
-    "Parsing from \"{xlsx_filepath}\" ...".format(
-        xlsx_filepath = arguments.input.resolve()
-    )
-)
-
-xlsx_parser: XLSXParser = XLSXParser(
-    xlsx_filepath = arguments.input,
-    timetable_number = arguments.input.name.split(".")[-2].split("_")[-1]
-)
-
-xlsx_parser.parse()
-
-xlsx_parser.save(
-    json_filepath = arguments.output,
-    json_indent = arguments.indent
-)
-
-print(
-    "Successfully saved to \"{json_filepath}\"!".format(
-        json_filepath = arguments.output.resolve()
-    )
-)
+from argparse import ArgumentParser, Namespace
+from pathlib import Path
+
+import sys
+
+from typing import List, Dict, Tuple, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cProfile import Profile
+
+
+argument_parser: ArgumentParser = ArgumentParser()
+argument_parser.add_argument("input", nargs="+", help=".XLSX file, or in batch mode files, directories and glob patterns")
+argument_parser.add_argument("output", help=".JSON file, or in batch mode output directory")
+argument_parser.add_argument("--indent", default=None, type=int, required=False)
+argument_parser.add_argument("--use-temp", action="store_true", default=False)
+argument_parser.add_argument("--read-only", action="store_true", default=False)
+argument_parser.add_argument("--engine", default="openpyxl", choices=["openpyxl", "ooxml"], required=False)
+argument_parser.add_argument("--models", default="pydantic", choices=["pydantic", "light"], required=False)
+argument_parser.add_argument("--store", default="objects", choices=["objects", "columnar"], required=False, help="\"columnar\" keeps lessons and cards in compact arrays")
+argument_parser.add_argument("--colors", default="hash", choices=["hash", "random"], required=False, help="\"hash\" derives colors from names, so same input gives same output")
+argument_parser.add_argument("--json-encoder", default="auto", choices=["auto", "orjson", "ujson", "json"], required=False)
+argument_parser.add_argument("--no-cache", action="store_true", default=False)
+argument_parser.add_argument("--cache-dir", default=None, required=False)
+argument_parser.add_argument("--check", action="store_true", default=False, help="Fail without saving if a teacher or classroom is double-booked")
+argument_parser.add_argument("--profile", action="store_true", default=False, help="Print time of parser phases and parsed items counts")
+argument_parser.add_argument("--profile-memory", action="store_true", default=False, help="Also trace peak memory of parser phases, slows parsing down")
+argument_parser.add_argument("--profile-output", default=None, required=False, help="Dump cProfile stats of parsing and saving to this file")
+argument_parser.add_argument("--batch", action="store_true", default=False)
+argument_parser.add_argument("--output-template", default="{stem}.json", required=False, help="Batch output name, fields: {stem}, {name}, {parent}, {timetable_number}")
+argument_parser.add_argument("--workers", default=None, type=int, required=False, help="Batch or sheets worker processes, CPU count by default")
+argument_parser.add_argument("--sheets", nargs="+", default=None, required=False, help="Convert several sheets of the input: \"all\" or NAME=NUMBER and INDEX=NUMBER pairs, output is a directory")
+argument_parser.add_argument("--merge", action="store_true", default=False, help="With --sheets, save one .JSON of every sheet's response by sheet name")
+argument_parser.add_argument("--watch", action="store_true", default=False, help="Keep running and convert inputs again when their content changes")
+argument_parser.add_argument("--debounce", default=0.5, type=float, required=False, help="Watch mode waits this many seconds without changes before converting")
+argument_parser.add_argument("--poll-interval", default=1.0, type=float, required=False, help="Watch mode stat polling interval, where inotify is not used")
+argument_parser.add_argument("--polling", action="store_true", default=False, help="Watch mode uses stat polling even if inotify is available")
+
+diff_argument_parser: ArgumentParser = ArgumentParser(prog="edu_xlsx diff", description="Prints changes between two timetables as JSON")
+diff_argument_parser.add_argument("old", help="Old .XLSX or output .JSON file")
+diff_argument_parser.add_argument("new", help="New .XLSX or output .JSON file")
+diff_argument_parser.add_argument("--indent", default=None, type=int, required=False)
+
+serve_argument_parser: ArgumentParser = ArgumentParser(prog="edu_xlsx serve", description="Converts .XLSX uploaded to POST /convert, state and latencies at GET /health")
+serve_argument_parser.add_argument("--host", default="127.0.0.1", required=False)
+serve_argument_parser.add_argument("--port", default=8080, type=int, required=False)
+serve_argument_parser.add_argument("--workers", default=None, type=int, required=False, help="Worker processes, CPU count by default")
+serve_argument_parser.add_argument("--max-queue", default=16, type=int, required=False, help="Requests waiting for a worker, more are answered with 503")
+serve_argument_parser.add_argument("--max-body-size", default=20 * 1024 * 1024, type=int, required=False, help="Bigger uploads are answered with 413, bytes")
+serve_argument_parser.add_argument("--request-timeout", default=60.0, type=float, required=False, help="Seconds, slower conversions are answered with 504")
+serve_argument_parser.add_argument("--read-only", action="store_true", default=False)
+serve_argument_parser.add_argument("--engine", default="openpyxl", choices=["openpyxl", "ooxml"], required=False)
+serve_argument_parser.add_argument("--models", default="pydantic", choices=["pydantic", "light"], required=False)
+serve_argument_parser.add_argument("--colors", default="hash", choices=["hash", "random"], required=False)
+serve_argument_parser.add_argument("--json-encoder", default="auto", choices=["auto", "orjson", "ujson", "json"], required=False)
+serve_argument_parser.add_argument("--quiet", action="store_true", default=False, help="Don't log every request")
+
+
+def run_diff(arguments: Namespace) -> None:
+    from json import dumps as json_dumps
+
+    from edu_xlsx.diff import load_timetable, diff_timetables
+
+    print(json_dumps(
+        obj = diff_timetables(
+            old = load_timetable(arguments.old),
+            new = load_timetable(arguments.new)
+        ),
+        ensure_ascii = False,
+        indent = arguments.indent
+    ))
+
+
+def run_serve(arguments: Namespace) -> None:
+    from edu_xlsx.server import serve
+
+    try:
+        serve(
+            host = arguments.host,
+            port = arguments.port,
+            max_body_size = arguments.max_body_size,
+            log_requests = not arguments.quiet,
+            workers = arguments.workers,
+            max_queue = arguments.max_queue,
+            request_timeout = arguments.request_timeout,
+            json_encoder = arguments.json_encoder,
+            read_only = arguments.read_only,
+            engine = arguments.engine,
+            models = arguments.models,
+            colors = arguments.colors
+        )
+
+    except KeyboardInterrupt:
+        pass
+
+
+def get_convert_options(arguments: Namespace) -> Dict[str, Any]:
+    return dict(
+        use_temp = arguments.use_temp,
+        read_only = arguments.read_only,
+        engine = arguments.engine,
+        models = arguments.models,
+        colors = arguments.colors,
+        store = arguments.store,
+        json_encoder = arguments.json_encoder,
+        check = arguments.check,
+        indent = arguments.indent,
+        no_cache = arguments.no_cache,
+        cache_dir = arguments.cache_dir
+    )
+
+
+def get_batch_jobs(arguments: Namespace) -> List[Tuple[Path, Path]]:
+    from edu_xlsx.batch import collect_xlsx_filepaths, get_json_filepath
+
+    output_dir: Path = Path(arguments.output)
+
+    return [
+        (
+            xlsx_filepath,
+            get_json_filepath(
+                xlsx_filepath = xlsx_filepath,
+                output_dir = output_dir,
+                output_template = arguments.output_template
+            )
+        )
+        for xlsx_filepath in collect_xlsx_filepaths(
+            inputs = arguments.input
+        )
+    ]
+
+
+def run_watch(arguments: Namespace, is_batch: bool) -> None:
+    from time import strftime
+
+    from edu_xlsx.batch import build_summary_table
+    from edu_xlsx.watch import get_input_dirs, watch
+
+    def get_jobs() -> List[Tuple[Path, Path]]:
+        if is_batch:
+            return get_batch_jobs(arguments)
+
+        return [(Path(arguments.input[0]), Path(arguments.output))]
+
+    def print_results(results: List[Dict[str, Any]]) -> None:
+        print(
+            "[{time}] Converted {count} files:".format(
+                time = strftime("%H:%M:%S"),
+                count = len(results)
+            )
+        )
+
+        print(build_summary_table(
+            results = results
+        ))
+
+        sys.stdout.flush()
+
+    print("Watching for changes, press Ctrl+C to stop ...")
+
+    try:
+        watch(
+            get_jobs = get_jobs,
+            options = get_convert_options(arguments),
+            on_results = print_results,
+            input_dirs = get_input_dirs(arguments.input),
+            debounce = arguments.debounce,
+            poll_interval = arguments.poll_interval,
+            polling = arguments.polling
+        )
+
+    except KeyboardInterrupt:
+        pass
+
+
+def run_batch(arguments: Namespace) -> None:
+    from edu_xlsx.batch import convert_many, build_summary_table
+
+    output_dir: Path = Path(arguments.output)
+
+    jobs: List[Tuple[Path, Path]] = get_batch_jobs(arguments)
+
+    if not jobs:
+        print("No .XLSX files found!")
+        sys.exit(1)
+
+    print(
+        "Converting {count} files to \"{output_dir}\" ...".format(
+            count = len(jobs),
+            output_dir = output_dir.resolve()
+        )
+    )
+
+    results: List[Dict[str, Any]] = convert_many(
+        jobs = jobs,
+        options = get_convert_options(arguments),
+        workers = arguments.workers
+    )
+
+    print(build_summary_table(
+        results = results
+    ))
+
+    failed_count: int = len([
+        result
+        for result in results
+        if result["error"]
+    ])
+
+    if failed_count:
+        print(
+            "{failed_count} of {count} files failed!".format(
+                failed_count = failed_count,
+                count = len(results)
+            )
+        )
+
+        sys.exit(1)
+
+
+def run_sheets(arguments: Namespace) -> None:
+    from edu_xlsx.sheets import WorkbookParser, parse_sheets_config
+    from edu_xlsx.batch import get_timetable_number
+    from edu_xlsx.parser import ACCEPTABLE_TIMETABLE_NUMBERS
+    from edu_xlsx.cache import ParseCache
+
+    xlsx_filepath: Path = Path(arguments.input[0])
+    output: Path = Path(arguments.output)
+
+    # Sheets without a number in their names get the file's one ("school_1.xlsx")
+    timetable_number: Optional[str] = get_timetable_number(xlsx_filepath)
+
+    workbook_parser: WorkbookParser = WorkbookParser(
+        xlsx_filepath = xlsx_filepath,
+        sheets = parse_sheets_config(arguments.sheets),
+        timetable_number = (
+            timetable_number
+            if timetable_number in ACCEPTABLE_TIMETABLE_NUMBERS
+            else
+            None
+        ),
+        workers = arguments.workers,
+        read_only = arguments.read_only,
+        engine = arguments.engine,
+        models = arguments.models,
+        colors = arguments.colors,
+        store = arguments.store,
+        cache = (
+            None
+            if arguments.no_cache
+            else
+            ParseCache(
+                cache_dir = arguments.cache_dir
+            )
+        )
+    )
+
+    print(
+        "Parsing {count} sheets from \"{xlsx_filepath}\" ...".format(
+            count = len(workbook_parser.sheets),
+            xlsx_filepath = xlsx_filepath.resolve()
+        )
+    )
+
+    workbook_parser.parse()
+
+    if arguments.check:
+        from edu_xlsx.conflicts import find_conflicts, build_conflicts_table
+
+        conflicts_count: int = 0
+
+        for sheetname, xlsx_parser in workbook_parser.parsers.items():
+            conflicts: List[Dict[str, Any]] = find_conflicts(xlsx_parser)
+
+            if not conflicts:
+                continue
+
+            conflicts_count += len(conflicts)
+
+            print("Sheet {sheetname!r}:".format(
+                sheetname = sheetname
+            ))
+
+            print(build_conflicts_table(
+                conflicts = conflicts
+            ))
+
+        if conflicts_count:
+            print(
+                "Found {count} conflicts, not saved!".format(
+                    count = conflicts_count
+                )
+            )
+
+            sys.exit(1)
+
+    if arguments.merge:
+        workbook_parser.save_merged(
+            json_filepath = output,
+            json_indent = arguments.indent,
+            json_encoder = arguments.json_encoder
+        )
+
+        print(
+            "Successfully saved to \"{json_filepath}\"!".format(
+                json_filepath = output.resolve()
+            )
+        )
+
+        return
+
+    json_filepaths: Dict[str, Path] = workbook_parser.save(
+        output_dir = output,
+        json_indent = arguments.indent,
+        json_encoder = arguments.json_encoder
+    )
+
+    for sheetname, json_filepath in json_filepaths.items():
+        print(
+            "Successfully saved {sheetname!r} to \"{json_filepath}\"!".format(
+                sheetname = sheetname,
+                json_filepath = json_filepath.resolve()
+            )
+        )
+
+
+def run_single(arguments: Namespace) -> None:
+    arguments.input = Path(arguments.input[0])
+    arguments.output = Path(arguments.output)
+
+    if arguments.use_temp:
+        from edu_xlsx.temp_parser import TempXLSXParser as XLSXParser
+    else:
+        from edu_xlsx import XLSXParser
+
+    from edu_xlsx.cache import ParseCache
+    from edu_xlsx.batch import get_timetable_number
+    from edu_xlsx.metrics import ParseMetrics
+
+    print(
+        "Parsing from \"{xlsx_filepath}\" ...".format(
+            xlsx_filepath = arguments.input.resolve()
+        )
+    )
+
+    xlsx_parser: XLSXParser = XLSXParser(
+        xlsx_filepath = arguments.input,
+        timetable_number = get_timetable_number(arguments.input),
+        read_only = arguments.read_only,
+        engine = arguments.engine,
+        models = arguments.models,
+        colors = arguments.colors,
+        store = arguments.store,
+        cache = (
+            None
+            if arguments.no_cache
+            else
+            ParseCache(
+                cache_dir = arguments.cache_dir
+            )
+        ),
+        metrics = (
+            ParseMetrics(
+                trace_memory = arguments.profile_memory
+            )
+            if arguments.profile or arguments.profile_memory
+            else
+            None
+        )
+    )
+
+    profile: Optional[Profile] = None
+
+    if arguments.profile_output:
+        from cProfile import Profile
+
+        profile = Profile()
+        profile.enable()
+
+    xlsx_parser.parse()
+
+    if arguments.check:
+        from edu_xlsx.conflicts import find_conflicts, build_conflicts_table
+
+        conflicts: List[Dict[str, Any]] = find_conflicts(xlsx_parser)
+
+        if conflicts:
+            print(build_conflicts_table(
+                conflicts = conflicts
+            ))
+
+            print(
+                "Found {count} conflicts, not saved!".format(
+                    count = len(conflicts)
+                )
+            )
+
+            sys.exit(1)
+
+    xlsx_parser.save(
+        json_filepath = arguments.output,
+        json_indent = arguments.indent,
+        json_encoder = arguments.json_encoder
+    )
+
+    if profile is not None:
+        profile.disable()
+        profile.dump_stats(arguments.profile_output)
+
+    if xlsx_parser.metrics is not None:
+        from edu_xlsx.metrics import build_metrics_table
+
+        xlsx_parser.metrics.stop()
+
+        print(build_metrics_table(
+            metrics = xlsx_parser.metrics
+        ))
+
+        print(", ".join([
+            "{0}: {1}".format(name, count)
+            for name, count in xlsx_parser.metrics.counts.items()
+        ]))
+
+    print(
+        "Successfully saved to \"{json_filepath}\"!".format(
+            json_filepath = arguments.output.resolve()
+        )
+    )
+
+
+def main() -> None:
+    if sys.argv[1:2] == ["diff"]:
+        run_diff(
+            arguments = diff_argument_parser.parse_args(sys.argv[2:])
+        )
+
+        return
+
+    if sys.argv[1:2] == ["serve"]:
+        run_serve(
+            arguments = serve_argument_parser.parse_args(sys.argv[2:])
+        )
+
+        return
+
+    arguments: Namespace = argument_parser.parse_args()
+
+    from edu_xlsx.batch import is_batch_input
+
+    is_batch: bool = arguments.batch or len(arguments.input) > 1 or is_batch_input(arguments.input[0])
+
+    if arguments.sheets:
+        if is_batch or arguments.watch:
+            argument_parser.error("--sheets works with a single input file and without --watch")
+
+        # Sheets parsed in worker processes aren't measured
+        if arguments.profile or arguments.profile_memory or arguments.profile_output:
+            argument_parser.error("--sheets works without --profile, --profile-memory and --profile-output")
+
+        run_sheets(
+            arguments = arguments
+        )
+
+    elif arguments.watch:
+        run_watch(
+            arguments = arguments,
+            is_batch = is_batch
+        )
+
+    elif is_batch:
+        run_batch(
+            arguments = arguments
+        )
+
+    else:
+        run_single(
+            arguments = arguments
+        )
+
+
+# Worker processes may import this module again, they must not run the CLI
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+from pathlib import Path
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from pickle import dumps as pickle_dumps, loads as pickle_loads, HIGHEST_PROTOCOL
+
+import asyncio
+
+from .parser import XLSXParser, T_XLSX_INPUT
+from .encoders import JSON_ENCODER_AUTO
+
+from typing import List, Dict, Tuple, Any, Union, Optional, BinaryIO
+
+
+def parse_state(parser_kwargs: Dict[str, Any], state: Optional[Dict[str, Any]]=None, incremental: bool=False) -> Tuple[Dict[str, Any], List[int]]:
+    """
+    Parses on a separate parser and returns its registries and changed blocks.
+    Runs inside executors, with a process pool only picklable values go in and out.
+    `state` is modified, threads must get a copy
+    """
+
+    xlsx_parser: XLSXParser = XLSXParser(**parser_kwargs)
+
+    if state is not None:
+        xlsx_parser.set_state(
+            state = state
+        )
+
+    try:
+        xlsx_parser.parse(
+            incremental = incremental
+        )
+
+    finally:
+        xlsx_parser.close()
+
+    return xlsx_parser.get_state(), xlsx_parser.changed_sheet_blocks
+
+
+class AsyncXLSXParser:
+    """
+    `XLSXParser` for asyncio applications: loading, parsing and saving run in `executor`
+    (the loop's default thread pool if not given, or a `ProcessPoolExecutor`), so the event loop isn't blocked.
+    A `semaphore` shared by parsers limits how many of them work at once.
+    Cancelled `parse()` leaves the parser as it was: workers parse a copy of its state,
+    a queued job is dropped, a started one finishes in its worker and its result is thrown away.
+    File objects are read by the first `parse()` in the executor, `parser` is `None` until then
+    """
+
+    def __init__(self, xlsx_filepath: T_XLSX_INPUT, timetable_number: Union[int, str], executor: Optional[Executor]=None, semaphore: Optional[asyncio.Semaphore]=None, **kwargs: Any) -> None:
+        self.executor: Optional[Executor] = executor
+        self.semaphore: Optional[asyncio.Semaphore] = semaphore
+
+        self._xlsx_input: T_XLSX_INPUT = xlsx_filepath
+        self._timetable_number: Union[int, str] = timetable_number
+        self._kwargs: Dict[str, Any] = kwargs
+
+        self.parser: Optional[XLSXParser] = None
+
+        if not hasattr(xlsx_filepath, "read"):
+            self.parser = self._create_parser()
+
+    def _create_parser(self) -> XLSXParser:
+        return XLSXParser(
+            xlsx_filepath = self._xlsx_input,
+            timetable_number = self._timetable_number,
+            **self._kwargs
+        )
+
+    def _get_parser_kwargs(self, xlsx_parser: XLSXParser) -> Dict[str, Any]:
+        return dict(
+            # File objects are read once, workers get their data
+            xlsx_filepath = (
+                xlsx_parser.xlsx_filepath
+                if xlsx_parser.xlsx_data is None
+                else
+                xlsx_parser.xlsx_data
+            ),
+            timetable_number = xlsx_parser.timetable_number,
+            **self._kwargs
+        )
+
+    def _get_parsed_parser(self) -> XLSXParser:
+        if self.parser is None or not hasattr(self.parser, "_lessons"):
+            raise ValueError("Input .XLSX must be parsed first!")
+
+        return self.parser
+
+    def _get_local_executor(self) -> Optional[Executor]:
+        # Work on objects of this process can't go to a process pool
+        if isinstance(self.executor, ProcessPoolExecutor):
+            return None
+
+        return self.executor
+
+    async def _run(self, executor: Optional[Executor], function: Any, *args: Any) -> Any:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        if self.semaphore is None:
+            return await loop.run_in_executor(executor, function, *args)
+
+        async with self.semaphore:
+            return await loop.run_in_executor(executor, function, *args)
+
+    async def parse(self, incremental: bool=False) -> None:
+        if self.parser is None:
+            self.parser = await self._run(
+                self._get_local_executor(),
+                self._create_parser
+            )
+
+        xlsx_parser: XLSXParser = self.parser
+
+        state: Optional[Dict[str, Any]] = None
+
+        if incremental and hasattr(xlsx_parser, "_sheet_blocks"):
+            state = xlsx_parser.get_state()
+
+            # Process pools pickle it anyway, threads would change this parser's registries
+            if not isinstance(self.executor, ProcessPoolExecutor):
+                state = pickle_loads(pickle_dumps(state, HIGHEST_PROTOCOL))
+
+        parsed_state, changed_sheet_blocks = await self._run(
+            self.executor,
+            partial(
+                parse_state,
+                parser_kwargs = self._get_parser_kwargs(
+                    xlsx_parser = xlsx_parser
+                ),
+                state = state,
+                incremental = incremental
+            )
+        )
+
+        xlsx_parser.set_state(
+            state = parsed_state
+        )
+
+        xlsx_parser.changed_sheet_blocks = changed_sheet_blocks
+
+    async def save(self, json_filepath: Union[str, Path, BinaryIO], json_indent: Optional[int]=None, json_encoder: str=JSON_ENCODER_AUTO) -> None:
+        # Parsed registries live in this process, so a process pool is not used for saving
+        await self._run(
+            self._get_local_executor(),
+            self._get_parsed_parser().save,
+            json_filepath,
+            json_indent,
+            json_encoder
+        )
+
+
+async def parse_async(xlsx_filepath: T_XLSX_INPUT, timetable_number: Union[int, str], executor: Optional[Executor]=None, semaphore: Optional[asyncio.Semaphore]=None, **kwargs: Any) -> XLSXParser:
+    """
+    Parses without blocking the event loop, returns the parsed `XLSXParser`
+    """
+
+    async_xlsx_parser: AsyncXLSXParser = AsyncXLSXParser(
+        xlsx_filepath = xlsx_filepath,
+        timetable_number = timetable_number,
+        executor = executor,
+        semaphore = semaphore,
+        **kwargs
+    )
+
+    await async_xlsx_parser.parse()
+
+    return async_xlsx_parser._get_parsed_parser()
@@ -0,0 +1,301 @@
+from pathlib import Path
+from glob import glob, has_magic
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+
+import os
+
+from typing import List, Dict, Tuple, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from prettytable import PrettyTable
+
+    from .parser import XLSXParser
+
+
+DEFAULT_OUTPUT_TEMPLATE: str = "{stem}.json"
+
+XLSX_SUFFIX: str = ".xlsx"
+
+
+def get_timetable_number(xlsx_filepath: Path) -> str:
+    # "school_1.xlsx" -> "1", names without an extension ("Makefile") -> ""
+    name_parts: List[str] = xlsx_filepath.name.split(".")
+
+    if len(name_parts) < 2:
+        return ""
+
+    return name_parts[-2].split("_")[-1]
+
+
+def is_xlsx_filename(name: str) -> bool:
+    # Office lock files ("~$school_1.xlsx") are not workbooks
+    return name.lower().endswith(XLSX_SUFFIX) and not name.startswith("~$")
+
+
+def is_batch_input(input: str) -> bool:
+    return has_magic(input) or Path(input).is_dir()
+
+
+def collect_xlsx_filepaths(inputs: List[str]) -> List[Path]:
+    """
+    Expands directories and glob patterns to their .XLSX files, keeping the given order without duplicates.
+    Explicitly given files are kept as they are
+    """
+
+    xlsx_filepaths: Dict[Path, None] = {}
+
+    for input in inputs:
+        if has_magic(input):
+            paths: List[Path] = [
+                Path(path)
+                for path in sorted(glob(input, recursive=True))
+                if is_xlsx_filename(Path(path).name) or Path(path).is_dir()
+            ]
+
+        else:
+            paths = [Path(input)]
+
+        for path in paths:
+            if path.is_dir():
+                for xlsx_filepath in sorted(path.iterdir()):
+                    if is_xlsx_filename(xlsx_filepath.name) and xlsx_filepath.is_file():
+                        xlsx_filepaths[xlsx_filepath] = None
+
+            else:
+                xlsx_filepaths[path] = None
+
+    return list(xlsx_filepaths)
+
+
+def get_json_filepath(xlsx_filepath: Path, output_dir: Path, output_template: str) -> Path:
+    return output_dir / output_template.format(
+        stem = xlsx_filepath.stem,
+        name = xlsx_filepath.name,
+        parent = xlsx_filepath.parent.name,
+        timetable_number = get_timetable_number(xlsx_filepath)
+    )
+
+
+def find_output_conflicts(jobs: List[Tuple[Path, Path]]) -> Dict[int, str]:
+    """
+    Errors by job index of jobs sharing their output file with other jobs ("a/x.xlsx" and "b/x.xlsx"
+    with "{stem}.json" template), none of them is converted, as they would overwrite each other
+    """
+
+    jobs_counts: Dict[Path, int] = {}
+
+    for _, json_filepath in jobs:
+        json_filepath = json_filepath.resolve()
+        jobs_counts[json_filepath] = jobs_counts.get(json_filepath, 0) + 1
+
+    return {
+        i: "ValueError: Output \"{json_filepath}\" must be of one input, not {count}!".format(
+            json_filepath = json_filepath,
+            count = jobs_counts[json_filepath.resolve()]
+        )
+        for i, (_, json_filepath) in enumerate(jobs)
+        if jobs_counts[json_filepath.resolve()] > 1
+    }
+
+
+def get_failed_result(xlsx_filepath: Path, json_filepath: Path, error: str) -> Dict[str, Any]:
+    return dict(
+        input = xlsx_filepath,
+        output = json_filepath,
+        timetable_number = get_timetable_number(xlsx_filepath),
+        seconds = 0.0,
+        error = error
+    )
+
+
+def save_atomically(xlsx_parser: "XLSXParser", json_filepath: Path, json_indent: Optional[int]=None, json_encoder: str="auto") -> None:
+    """
+    Saves to a temporary file next to `json_filepath` and renames it, so readers never see a half-written .JSON
+    """
+
+    temp_filepath: Path = json_filepath.with_name(
+        ".{name}.{pid}.tmp".format(
+            name = json_filepath.name,
+            pid = os.getpid()
+        )
+    )
+
+    # Created like a usual file, permissions follow the umask
+    with os.fdopen(os.open(temp_filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666), "wb") as temp_file:
+        try:
+            xlsx_parser.save(
+                json_filepath = temp_file,
+                json_indent = json_indent,
+                json_encoder = json_encoder
+            )
+
+        except BaseException:
+            temp_file.close()
+            temp_filepath.unlink()
+            raise
+
+    os.replace(temp_filepath, json_filepath)
+
+
+def convert(xlsx_filepath: Path, json_filepath: Path, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parses and saves one workbook, never raises so a failed file doesn't stop the others.
+    Runs inside worker processes, so `options` holds only picklable values
+    """
+
+    result: Dict[str, Any] = dict(
+        input = xlsx_filepath,
+        output = json_filepath,
+        timetable_number = "",
+        seconds = 0.0,
+        error = None
+    )
+
+    start_time: float = perf_counter()
+
+    xlsx_parser: Optional["XLSXParser"] = None
+
+    try:
+        result["timetable_number"] = get_timetable_number(xlsx_filepath)
+
+        if options.get("use_temp"):
+            from .temp_parser import TempXLSXParser as XLSXParser
+        else:
+            from .parser import XLSXParser
+
+        from .cache import ParseCache
+
+        xlsx_parser = XLSXParser(
+            xlsx_filepath = xlsx_filepath,
+            timetable_number = result["timetable_number"],
+            read_only = options.get("read_only", False),
+            engine = options.get("engine", "openpyxl"),
+            models = options.get("models", "pydantic"),
+            colors = options.get("colors", "hash"),
+            store = options.get("store", "objects"),
+            cache = (
+                None
+                if options.get("no_cache")
+                else
+                ParseCache(
+                    cache_dir = options.get("cache_dir")
+                )
+            )
+        )
+
+        xlsx_parser.parse()
+
+        if options.get("check"):
+            from .conflicts import find_conflicts
+
+            conflicts_count: int = len(find_conflicts(xlsx_parser))
+
+            if conflicts_count:
+                raise ValueError(
+                    "Found {count} conflicts, not saved!".format(
+                        count = conflicts_count
+                    )
+                )
+
+        json_filepath.parent.mkdir(
+            parents = True,
+            exist_ok = True
+        )
+
+        save_atomically(
+            xlsx_parser = xlsx_parser,
+            json_filepath = json_filepath,
+            json_indent = options.get("indent"),
+            json_encoder = options.get("json_encoder", "auto")
+        )
+
+    except Exception as exception:
+        result["error"] = "{name}: {exception}".format(
+            name = exception.__class__.__name__,
+            exception = exception
+        )
+
+    finally:
+        # Failed checks and saves leave the workbook open too
+        if xlsx_parser is not None:
+            xlsx_parser.close()
+
+    result["seconds"] = perf_counter() - start_time
+
+    return result
+
+
+def convert_many(jobs: List[Tuple[Path, Path]], options: Dict[str, Any], workers: Optional[int]=None) -> List[Dict[str, Any]]:
+    """
+    Converts `(xlsx_filepath, json_filepath)` jobs on a process pool, results are in the jobs' order.
+    Jobs sharing an output file fail without converting
+    """
+
+    results: Dict[int, Dict[str, Any]] = {
+        i: get_failed_result(
+            xlsx_filepath = jobs[i][0],
+            json_filepath = jobs[i][1],
+            error = error
+        )
+        for i, error in find_output_conflicts(jobs).items()
+    }
+
+    pending_jobs: List[Tuple[int, Path, Path]] = [
+        (i, xlsx_filepath, json_filepath)
+        for i, (xlsx_filepath, json_filepath) in enumerate(jobs)
+        if i not in results
+    ]
+
+    if workers == 1 or len(pending_jobs) <= 1:
+        for i, xlsx_filepath, json_filepath in pending_jobs:
+            results[i] = convert(
+                xlsx_filepath = xlsx_filepath,
+                json_filepath = json_filepath,
+                options = options
+            )
+
+    else:
+        with ProcessPoolExecutor(
+            max_workers = workers
+        ) as executor:
+            futures_indexes = {
+                executor.submit(convert, xlsx_filepath, json_filepath, options): i
+                for i, xlsx_filepath, json_filepath in pending_jobs
+            }
+
+            for future in as_completed(futures_indexes):
+                results[futures_indexes[future]] = future.result()
+
+    return [
+        results[i]
+        for i in range(len(jobs))
+    ]
+
+
+def build_summary_table(results: List[Dict[str, Any]]) -> "PrettyTable":
+    from prettytable import PrettyTable
+
+    summary_table: PrettyTable = PrettyTable(
+        field_names = [
+            "Input",
+            "Timetable",
+            "Output",
+            "Time, s",
+            "Status"
+        ]
+    )
+
+    summary_table.align = "l"
+    summary_table.align["Time, s"] = "r"
+
+    for result in results:
+        summary_table.add_row([
+            str(result["input"]),
+            result["timetable_number"],
+            str(result["output"]),
+            "{:.3f}".format(result["seconds"]),
+            result["error"] or "OK"
+        ])
+
+    return summary_table
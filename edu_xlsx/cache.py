@@ -0,0 +1,153 @@
+from pathlib import Path
+from hashlib import sha256
+from pickle import dumps as pickle_dumps, loads as pickle_loads, HIGHEST_PROTOCOL
+from zlib import compress as zlib_compress, decompress as zlib_decompress
+from tempfile import NamedTemporaryFile
+from time import time
+
+import os
+
+from typing import List, Tuple, Any, Union, Optional
+
+
+CACHE_FILE_SUFFIX: str = ".cache"
+
+# Part of every key, bump it whenever parsing changes its output or the cached state layout,
+# development builds share a library version
+CACHE_FORMAT_VERSION: int = 2
+
+DEFAULT_CACHE_MAX_SIZE: int = 256 * 1024 * 1024
+DEFAULT_CACHE_MAX_AGE: int = 7 * 24 * 60 * 60
+
+
+def get_default_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "edu_xlsx"
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed timetables, keyed by the .XLSX content hash, timetable number,
+    parser options (models backend, colors), library version and `CACHE_FORMAT_VERSION`.
+    Entries are pickled parser registries compressed with zlib.
+    Least recently used entries are evicted once they are older than `max_age` seconds
+    or the cache grows bigger than `max_size` bytes.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]]=None, max_size: int=DEFAULT_CACHE_MAX_SIZE, max_age: int=DEFAULT_CACHE_MAX_AGE) -> None:
+        if cache_dir is None:
+            cache_dir = get_default_cache_dir()
+
+        elif not isinstance(cache_dir, Path):
+            cache_dir = Path(cache_dir)
+
+        self.cache_dir: Path = cache_dir
+        self.max_size: int = max_size
+        self.max_age: int = max_age
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def get_key(xlsx_data: bytes, timetable_number: str, parser_options: Tuple[str, ...]) -> str:
+        """
+        `parser_options` are the parser's settings that change the parsed registries
+        """
+
+        from . import __version__
+
+        key_hash = sha256(xlsx_data)
+
+        key_hash.update("\0{timetable_number}\0{parser_options}\0{version}\0{cache_format_version}".format(
+            timetable_number = timetable_number,
+            parser_options = "\0".join(parser_options),
+            version = __version__,
+            cache_format_version = CACHE_FORMAT_VERSION
+        ).encode("utf-8"))
+
+        return key_hash.hexdigest()
+
+    def _get_filepath(self, key: str) -> Path:
+        return self.cache_dir / (key + CACHE_FILE_SUFFIX)
+
+    def load(self, key: str) -> Optional[Any]:
+        filepath: Path = self._get_filepath(key)
+
+        try:
+            if time() - filepath.stat().st_mtime > self.max_age:
+                filepath.unlink()
+
+                self.misses += 1
+                return None
+
+            value: Any = pickle_loads(zlib_decompress(filepath.read_bytes()))
+
+            # Mark the entry as recently used for eviction
+            os.utime(filepath)
+
+        except Exception:
+            # Missing, expired or broken entry is just a miss
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        return value
+
+    def store(self, key: str, value: Any) -> None:
+        self.cache_dir.mkdir(
+            parents = True,
+            exist_ok = True
+        )
+
+        with NamedTemporaryFile(
+            dir = self.cache_dir,
+            suffix = ".tmp",
+            delete = False
+        ) as temp_file:
+            temp_file.write(zlib_compress(pickle_dumps(value, protocol=HIGHEST_PROTOCOL)))
+
+        # Readers never see a half-written entry
+        os.replace(temp_file.name, self._get_filepath(key))
+
+        self.evict()
+
+    def evict(self) -> None:
+        entries: List[Tuple[float, int, Path]] = []
+
+        now: float = time()
+
+        for filepath in self.cache_dir.glob("*" + CACHE_FILE_SUFFIX):
+            try:
+                stat_result: os.stat_result = filepath.stat()
+
+                if now - stat_result.st_mtime > self.max_age:
+                    filepath.unlink()
+                    continue
+
+            except OSError:
+                continue
+
+            entries.append((stat_result.st_mtime, stat_result.st_size, filepath))
+
+        total_size: int = sum([
+            size
+            for _, size, _ in entries
+        ])
+
+        for _, size, filepath in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+
+            try:
+                filepath.unlink()
+            except OSError:
+                continue
+
+            total_size -= size
+
+    def clear(self) -> None:
+        for filepath in self.cache_dir.glob("*" + CACHE_FILE_SUFFIX):
+            try:
+                filepath.unlink()
+            except OSError:
+                pass
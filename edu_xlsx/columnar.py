@@ -0,0 +1,268 @@
+from array import array
+from collections.abc import Mapping
+
+from typing import List, Dict, Tuple, Iterable, Iterator, Any, Union, Optional
+
+
+COLUMN_VALUE: str = "value"
+COLUMN_LIST: str = "list"
+COLUMN_LISTS: str = "lists"
+
+# Multi-valued fields of lessons and cards, the rest hold one value
+COLUMN_KINDS: Dict[str, str] = {
+    "teacherids": COLUMN_LIST,
+    "groupids": COLUMN_LIST,
+    "classids": COLUMN_LIST,
+    "classroomids": COLUMN_LIST,
+    "studentids": COLUMN_LIST,
+    "groupnames": COLUMN_LIST,
+    "classroomidss": COLUMN_LISTS
+}
+
+ARRAY_TYPECODE: str = "I"
+
+
+class InternTable:
+    """
+    Every distinct value (ID, days, period, constant strings) is stored once, columns keep its index
+    """
+
+    __slots__ = ("values", "_indexes")
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+        # Keyed with the type too, so `1` and `True` stay different values
+        self._indexes: Dict[Tuple[type, Any], int] = {}
+
+    def intern(self, value: Any) -> int:
+        key: Tuple[type, Any] = (value.__class__, value)
+
+        index: Optional[int] = self._indexes.get(key)
+
+        if index is None:
+            index = len(self.values)
+
+            self.values.append(value)
+            self._indexes[key] = index
+
+        return index
+
+    def find(self, value: Any) -> Optional[int]:
+        return self._indexes.get((value.__class__, value))
+
+    def __getstate__(self) -> List[Any]:
+        return self.values
+
+    def __setstate__(self, values: List[Any]) -> None:
+        self.values = []
+        self._indexes = {}
+
+        for value in values:
+            self.intern(value)
+
+
+class ColumnarRow:
+    """
+    Read-only view of one row, has the same attributes and `dict()` as a model
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ColumnarTable", index: int) -> None:
+        self._table: ColumnarTable = table
+        self._index: int = index
+
+    def __getattr__(self, field: str) -> Any:
+        if field.startswith("_") or field not in self._table.kinds:
+            raise AttributeError(field)
+
+        return self._table.get_value(field, self._index)
+
+    def __reduce__(self) -> Tuple[type, Tuple["ColumnarTable", int]]:
+        return (self.__class__, (self._table, self._index))
+
+    def __repr__(self) -> str:
+        return "{model_name}({fields})".format(
+            model_name = self._table.model_name,
+            fields = ", ".join([
+                "{0}={1!r}".format(field, value)
+                for field, value in self.dict().items()
+            ])
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ColumnarRow):
+            return NotImplemented
+
+        return self.dict() == other.dict()
+
+    def dict(self) -> Dict[str, Any]:
+        return self._table.get_dict(self._index)
+
+    to_dict = dict
+
+
+class ColumnarTable:
+    """
+    Rows stored as parallel arrays of interned values' indexes.
+    Multi-valued fields are ragged: an offsets array into one flat items array,
+    lists of lists have one more level of offsets.
+    Indexing gives `ColumnarRow` views, so it's used as a list of models
+    """
+
+    def __init__(self, model_name: str, fields: Tuple[str, ...], intern_table: InternTable) -> None:
+        self.model_name: str = model_name
+        self.fields: Tuple[str, ...] = fields
+        self.kinds: Dict[str, str] = {
+            field: COLUMN_KINDS.get(field, COLUMN_VALUE)
+            for field in fields
+        }
+
+        self.intern_table: InternTable = intern_table
+
+        self._columns: Dict[str, Tuple[array, ...]] = {}
+
+        for field, kind in self.kinds.items():
+            if kind == COLUMN_VALUE:
+                self._columns[field] = (array(ARRAY_TYPECODE), )
+
+            elif kind == COLUMN_LIST:
+                self._columns[field] = (array(ARRAY_TYPECODE, [0]), array(ARRAY_TYPECODE))
+
+            else:
+                self._columns[field] = (array(ARRAY_TYPECODE, [0]), array(ARRAY_TYPECODE, [0]), array(ARRAY_TYPECODE))
+
+        self._length: int = 0
+
+    def append(self, values: Dict[str, Any]) -> None:
+        intern = self.intern_table.intern
+
+        for field, kind in self.kinds.items():
+            value: Any = values[field]
+            columns: Tuple[array, ...] = self._columns[field]
+
+            if kind == COLUMN_VALUE:
+                columns[0].append(intern(value))
+
+            elif kind == COLUMN_LIST:
+                columns[1].extend([
+                    intern(item)
+                    for item in value
+                ])
+
+                columns[0].append(len(columns[1]))
+
+            else:
+                for items in value:
+                    columns[2].extend([
+                        intern(item)
+                        for item in items
+                    ])
+
+                    columns[1].append(len(columns[2]))
+
+                columns[0].append(len(columns[1]) - 1)
+
+        self._length += 1
+
+    def extend(self, items: Iterable[Any]) -> None:
+        for item in items:
+            self.append(item.dict())
+
+    def get_value(self, field: str, index: int) -> Any:
+        values: List[Any] = self.intern_table.values
+        columns: Tuple[array, ...] = self._columns[field]
+
+        if len(columns) == 1:
+            return values[columns[0][index]]
+
+        if len(columns) == 2:
+            offsets, items = columns
+
+            return [
+                values[item]
+                for item in items[offsets[index]:offsets[index + 1]]
+            ]
+
+        offsets, items_offsets, items = columns
+
+        return [
+            [
+                values[item]
+                for item in items[items_offsets[i]:items_offsets[i + 1]]
+            ]
+            for i in range(offsets[index], offsets[index + 1])
+        ]
+
+    def get_dict(self, index: int) -> Dict[str, Any]:
+        return {
+            field: self.get_value(field, index)
+            for field in self.fields
+        }
+
+    def get_index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("{model_name} index out of range".format(
+                model_name = self.model_name
+            ))
+
+        return index
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[ColumnarRow, List[ColumnarRow]]:
+        if isinstance(index, slice):
+            return [
+                ColumnarRow(self, i)
+                for i in range(*index.indices(self._length))
+            ]
+
+        return ColumnarRow(self, self.get_index(index))
+
+    def __iter__(self) -> Iterator[ColumnarRow]:
+        for i in range(self._length):
+            yield ColumnarRow(self, i)
+
+    def __repr__(self) -> str:
+        return "<{class_name} {model_name} rows={length}>".format(
+            class_name = self.__class__.__name__,
+            model_name = self.model_name,
+            length = self._length
+        )
+
+
+class ColumnarMapping(Mapping):
+    """
+    Rows of a `ColumnarTable` by a unique value field, without a dict per row
+    """
+
+    def __init__(self, table: ColumnarTable, field: str="id") -> None:
+        self._table: ColumnarTable = table
+        self._column: array = table._columns[field][0]
+
+        # Interned value's index -> row index + 1, 0 marks values of other fields
+        self._rows_from_value: array = array(ARRAY_TYPECODE, [0]) * len(table.intern_table.values)
+
+        for i, value_index in enumerate(self._column):
+            self._rows_from_value[value_index] = i + 1
+
+    def __getitem__(self, value: Any) -> ColumnarRow:
+        value_index: Optional[int] = self._table.intern_table.find(value)
+
+        if value_index is None or value_index >= len(self._rows_from_value) or not self._rows_from_value[value_index]:
+            raise KeyError(value)
+
+        return ColumnarRow(self._table, self._rows_from_value[value_index] - 1)
+
+    def __iter__(self) -> Iterator[Any]:
+        values: List[Any] = self._table.intern_table.values
+
+        for value_index in self._column:
+            yield values[value_index]
+
+    def __len__(self) -> int:
+        return len(self._table)
@@ -0,0 +1,111 @@
+from typing import List, Dict, Tuple, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from prettytable import PrettyTable
+
+    from .parser import XLSXParser
+    from .models import Lesson, Card
+
+
+CONFLICT_TEACHER: str = "teacher"
+CONFLICT_CLASSROOM: str = "classroom"
+
+
+# (resource kind, resource ID, days, period)
+T_CONFLICT_KEY = Tuple[str, str, str, str]
+
+
+def find_conflicts(xlsx_parser: "XLSXParser") -> List[Dict[str, Any]]:
+    """
+    Teachers and classrooms put in several cards during the same days and period.
+    Cards are bucketed by `(resource, days, period)` in one pass, every bucket
+    with more than one card is a conflict. A card goes to a bucket once, even if it
+    lists the same teacher or classroom twice
+    """
+
+    buckets: Dict[T_CONFLICT_KEY, List["Card"]] = {}
+
+    for card in xlsx_parser._cards:
+        lesson: "Lesson" = xlsx_parser._lessons_from_id[card.lessonid]
+
+        keys: List[T_CONFLICT_KEY] = [
+            (CONFLICT_TEACHER, teacherid, card.days, card.period)
+            for teacherid in lesson.teacherids
+            # Lesson without teachers has one empty ID
+            if teacherid
+        ]
+
+        keys.extend([
+            (CONFLICT_CLASSROOM, classroomid, card.days, card.period)
+            for classroomid in card.classroomids
+        ])
+
+        # Ordered deduplication keeps the conflicts order stable
+        for key in dict.fromkeys(keys):
+            if key in buckets:
+                buckets[key].append(card)
+            else:
+                buckets[key] = [card]
+
+    names_from_id: Dict[str, Dict[str, str]] = {
+        CONFLICT_TEACHER: {
+            teacher.id: teacher.short
+            for teacher in xlsx_parser._teachers
+        },
+        CONFLICT_CLASSROOM: {
+            classroom.id: classroom.name
+            for classroom in xlsx_parser._classrooms
+        }
+    }
+
+    conflicts: List[Dict[str, Any]] = []
+
+    for (kind, id, days, period), cards in buckets.items():
+        if len(cards) < 2:
+            continue
+
+        conflicts.append(dict(
+            kind = kind,
+            id = id,
+            name = names_from_id[kind].get(id, id),
+            days = days,
+            period = period,
+            cardids = [
+                card.id
+                for card in cards
+            ],
+            classes = [
+                xlsx_parser._classes_from_id[classid].name
+                for card in cards
+                for classid in xlsx_parser._lessons_from_id[card.lessonid].classids
+            ]
+        ))
+
+    return conflicts
+
+
+def build_conflicts_table(conflicts: List[Dict[str, Any]]) -> "PrettyTable":
+    from prettytable import PrettyTable
+
+    conflicts_table: PrettyTable = PrettyTable(
+        field_names = [
+            "Kind",
+            "Name",
+            "Days",
+            "Period",
+            "Classes"
+        ]
+    )
+
+    conflicts_table.align = "l"
+
+    for conflict in conflicts:
+        conflicts_table.add_row([
+            conflict["kind"],
+            conflict["name"],
+            conflict["days"],
+            conflict["period"],
+            ", ".join(conflict["classes"])
+        ])
+
+    return conflicts_table
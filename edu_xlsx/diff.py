@@ -0,0 +1,241 @@
+from pathlib import Path
+from json import loads as json_loads
+
+from typing import List, Dict, Tuple, Any, Union, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .parser import XLSXParser
+
+
+# (class name, days, period)
+T_CARD_KEY = Tuple[str, str, str]
+
+T_TIMETABLE_SOURCE = Union["XLSXParser", dict, str, Path]
+
+
+def _get_field(item: Any, field: str) -> Any:
+    # Rows of a loaded .JSON are dicts, parser registries hold models
+    if isinstance(item, dict):
+        return item[field]
+
+    return getattr(item, field)
+
+
+def load_timetable(filepath: Union[str, Path]) -> T_TIMETABLE_SOURCE:
+    """
+    Output .JSON is loaded as is, .XLSX is parsed with the timetable number from its name
+    """
+
+    if not isinstance(filepath, Path):
+        filepath = Path(filepath)
+
+    if filepath.suffix.lower() != ".xlsx":
+        return json_loads(filepath.read_bytes())
+
+    from .parser import XLSXParser
+    from .batch import get_timetable_number
+
+    xlsx_parser: XLSXParser = XLSXParser(
+        xlsx_filepath = filepath,
+        timetable_number = get_timetable_number(filepath)
+    )
+
+    xlsx_parser.parse()
+    xlsx_parser.close()
+
+    return xlsx_parser
+
+
+def _get_tables(timetable: T_TIMETABLE_SOURCE) -> Dict[str, List[Any]]:
+    if isinstance(timetable, (str, Path)):
+        return _get_tables(json_loads(Path(timetable).read_bytes()))
+
+    if isinstance(timetable, dict):
+        return {
+            table["id"]: table["data_rows"]
+            for table in timetable["r"]["dbiAccessorRes"]["tables"]
+        }
+
+    return {
+        "classes": timetable._classes,
+        "subjects": timetable._subjects,
+        "teachers": timetable._teachers,
+        "classrooms": timetable._classrooms,
+        "lessons": timetable._lessons,
+        "cards": timetable._cards
+    }
+
+
+def build_cards_index(timetable: T_TIMETABLE_SOURCE) -> Dict[T_CARD_KEY, List[Dict[str, Any]]]:
+    """
+    Cards of a parsed timetable or an output .JSON by `(class name, days, period)`.
+    IDs are replaced by names, so timetables parsed separately are comparable
+    """
+
+    tables: Dict[str, List[Any]] = _get_tables(timetable)
+
+    names_from_id: Dict[str, Dict[str, str]] = {
+        table_id: {
+            _get_field(item, "id"): _get_field(item, field)
+            for item in tables[table_id]
+        }
+        for table_id, field in (
+            ("classes", "name"),
+            ("subjects", "name"),
+            ("teachers", "short"),
+            ("classrooms", "name")
+        )
+    }
+
+    lessons_from_id: Dict[str, Any] = {
+        _get_field(lesson, "id"): lesson
+        for lesson in tables["lessons"]
+    }
+
+    cards_index: Dict[T_CARD_KEY, List[Dict[str, Any]]] = {}
+
+    for card in tables["cards"]:
+        lesson: Any = lessons_from_id[_get_field(card, "lessonid")]
+
+        classes_names: List[str] = [
+            names_from_id["classes"].get(classid, classid)
+            for classid in _get_field(lesson, "classids")
+        ]
+
+        card_data: Dict[str, Any] = dict(
+            classes = classes_names,
+            days = _get_field(card, "days"),
+            period = _get_field(card, "period"),
+            subject = names_from_id["subjects"].get(_get_field(lesson, "subjectid")),
+            teachers = [
+                names_from_id["teachers"].get(teacherid, teacherid)
+                for teacherid in _get_field(lesson, "teacherids")
+                if teacherid
+            ],
+            classrooms = [
+                names_from_id["classrooms"].get(classroomid, classroomid)
+                for classroomid in _get_field(card, "classroomids")
+            ]
+        )
+
+        for class_name in classes_names:
+            card_key: T_CARD_KEY = (class_name, card_data["days"], card_data["period"])
+
+            if card_key in cards_index:
+                cards_index[card_key].append(card_data)
+            else:
+                cards_index[card_key] = [card_data]
+
+    return cards_index
+
+
+def _get_card_change(card_key: T_CARD_KEY, card_data: Dict[str, Any]) -> Dict[str, Any]:
+    class_name, days, period = card_key
+
+    return dict(
+        class_name = class_name,
+        days = days,
+        period = period,
+        subject = card_data["subject"],
+        teachers = card_data["teachers"],
+        classrooms = card_data["classrooms"]
+    )
+
+
+def diff_timetables(old: T_TIMETABLE_SOURCE, new: T_TIMETABLE_SOURCE) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compares two timetables (parsers, loaded .JSON dicts or .JSON paths) in linear time.
+    Returns added, removed and moved cards, and teachers and classrooms reassigned
+    for the same subject in the same `(class, days, period)` slot
+    """
+
+    old_cards_index: Dict[T_CARD_KEY, List[Dict[str, Any]]] = build_cards_index(old)
+    new_cards_index: Dict[T_CARD_KEY, List[Dict[str, Any]]] = build_cards_index(new)
+
+    removed_cards: List[Tuple[T_CARD_KEY, Dict[str, Any]]] = []
+    added_cards: List[Tuple[T_CARD_KEY, Dict[str, Any]]] = []
+
+    teachers_changes: List[Dict[str, Any]] = []
+    classrooms_changes: List[Dict[str, Any]] = []
+
+    for card_key, old_cards in old_cards_index.items():
+        new_cards: List[Dict[str, Any]] = list(new_cards_index.get(card_key, []))
+
+        for old_card in old_cards:
+            new_card: Optional[Dict[str, Any]] = None
+
+            # Exact match first, then the same subject with other teachers or classrooms
+            for i, card in enumerate(new_cards):
+                if card == old_card:
+                    new_card = new_cards.pop(i)
+                    break
+
+            else:
+                for i, card in enumerate(new_cards):
+                    if card["subject"] == old_card["subject"]:
+                        new_card = new_cards.pop(i)
+                        break
+
+            if new_card is None:
+                removed_cards.append((card_key, old_card))
+                continue
+
+            if new_card["teachers"] != old_card["teachers"]:
+                teachers_change: Dict[str, Any] = _get_card_change(card_key, new_card)
+                teachers_change["old_teachers"] = old_card["teachers"]
+                teachers_changes.append(teachers_change)
+
+            if new_card["classrooms"] != old_card["classrooms"]:
+                classrooms_change: Dict[str, Any] = _get_card_change(card_key, new_card)
+                classrooms_change["old_classrooms"] = old_card["classrooms"]
+                classrooms_changes.append(classrooms_change)
+
+        for new_card in new_cards:
+            added_cards.append((card_key, new_card))
+
+    for card_key, new_cards in new_cards_index.items():
+        if card_key not in old_cards_index:
+            for new_card in new_cards:
+                added_cards.append((card_key, new_card))
+
+    # Removed and added card of the same class, subject and teachers is a moved card
+    added_cards_from_lesson: Dict[Tuple[str, Optional[str], Tuple[str, ...]], List[int]] = {}
+
+    for i, (card_key, new_card) in enumerate(added_cards):
+        added_cards_from_lesson.setdefault((card_key[0], new_card["subject"], tuple(new_card["teachers"])), []).append(i)
+
+    moved_added_cards: Dict[int, None] = {}
+
+    moved: List[Dict[str, Any]] = []
+    removed: List[Dict[str, Any]] = []
+
+    for card_key, old_card in removed_cards:
+        added_cards_indexes: Optional[List[int]] = added_cards_from_lesson.get((card_key[0], old_card["subject"], tuple(old_card["teachers"])))
+
+        if not added_cards_indexes:
+            removed.append(_get_card_change(card_key, old_card))
+            continue
+
+        added_card_index: int = added_cards_indexes.pop(0)
+        moved_added_cards[added_card_index] = None
+
+        new_card_key, new_card = added_cards[added_card_index]
+
+        moved_card: Dict[str, Any] = _get_card_change(new_card_key, new_card)
+        moved_card["old_days"] = card_key[1]
+        moved_card["old_period"] = card_key[2]
+        moved_card["old_classrooms"] = old_card["classrooms"]
+
+        moved.append(moved_card)
+
+    return dict(
+        added = [
+            _get_card_change(card_key, new_card)
+            for i, (card_key, new_card) in enumerate(added_cards)
+            if i not in moved_added_cards
+        ],
+        removed = removed,
+        moved = moved,
+        teachers_changes = teachers_changes,
+        classrooms_changes = classrooms_changes
+    )
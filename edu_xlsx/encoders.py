@@ -0,0 +1,133 @@
+from abc import ABC, abstractmethod
+from json import dumps as json_dumps
+
+from importlib.util import find_spec
+
+from typing import List, Dict, Any, Optional
+
+
+JSON_ENCODER_AUTO: str = "auto"
+
+
+class JSONEncoder(ABC):
+    name: str = ""
+
+    # Optional package the encoder needs, imported on first `dumps()`
+    module_name: Optional[str] = None
+
+    # Put between two items of a not indented array
+    compact_items_separator: str = ","
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return cls.module_name is None or find_spec(cls.module_name) is not None
+
+    def supports_indent(self, json_indent: Optional[int]) -> bool:
+        return True
+
+    @abstractmethod
+    def dumps(self, obj: Any, json_indent: Optional[int], encoding: str) -> bytes:
+        ...
+
+
+class StdlibJSONEncoder(JSONEncoder):
+    name: str = "json"
+    compact_items_separator: str = ", "
+
+    def dumps(self, obj: Any, json_indent: Optional[int], encoding: str) -> bytes:
+        return json_dumps(
+            obj = obj,
+            ensure_ascii = False,
+            indent = json_indent
+        ).encode(encoding)
+
+
+class OrjsonJSONEncoder(JSONEncoder):
+    name: str = "orjson"
+    module_name: Optional[str] = "orjson"
+
+    def supports_indent(self, json_indent: Optional[int]) -> bool:
+        return json_indent is None or json_indent == 2
+
+    def dumps(self, obj: Any, json_indent: Optional[int], encoding: str) -> bytes:
+        import orjson
+
+        data: bytes = orjson.dumps(
+            obj,
+            option = (
+                orjson.OPT_INDENT_2
+                if json_indent
+                else
+                None
+            )
+        )
+
+        # orjson always outputs UTF-8, so other encodings are re-encoded
+        if encoding.lower().replace("-", "") != "utf8":
+            data = data.decode("utf-8").encode(encoding)
+
+        return data
+
+
+class UjsonJSONEncoder(JSONEncoder):
+    name: str = "ujson"
+    module_name: Optional[str] = "ujson"
+
+    def dumps(self, obj: Any, json_indent: Optional[int], encoding: str) -> bytes:
+        import ujson
+
+        return ujson.dumps(
+            obj,
+            ensure_ascii = False,
+            escape_forward_slashes = False,
+            indent = json_indent or 0
+        ).encode(encoding)
+
+
+# In order of preference for `auto`
+JSON_ENCODERS: List[JSONEncoder] = [
+    OrjsonJSONEncoder(),
+    UjsonJSONEncoder(),
+    StdlibJSONEncoder()
+]
+
+JSON_ENCODERS_FROM_NAME: Dict[str, JSONEncoder] = {
+    json_encoder.name: json_encoder
+    for json_encoder in JSON_ENCODERS
+}
+
+ACCEPTABLE_JSON_ENCODERS: List[str] = [JSON_ENCODER_AUTO] + list(JSON_ENCODERS_FROM_NAME)
+
+
+def get_json_encoder(name: str, json_indent: Optional[int]) -> JSONEncoder:
+    if name == JSON_ENCODER_AUTO:
+        for available_json_encoder in JSON_ENCODERS:
+            if available_json_encoder.is_available() and available_json_encoder.supports_indent(json_indent):
+                return available_json_encoder
+
+    if name not in JSON_ENCODERS_FROM_NAME:
+        raise ValueError(
+            "JSON encoder {name!r} must be {correct_values}!".format(
+                name = name,
+                correct_values = " or ".join(ACCEPTABLE_JSON_ENCODERS)
+            )
+        )
+
+    json_encoder: JSONEncoder = JSON_ENCODERS_FROM_NAME[name]
+
+    if not json_encoder.is_available():
+        raise ValueError(
+            "JSON encoder {name!r} is not installed!".format(
+                name = name
+            )
+        )
+
+    if not json_encoder.supports_indent(json_indent):
+        raise ValueError(
+            "JSON encoder {name!r} does not support indent {json_indent!r}!".format(
+                name = name,
+                json_indent = json_indent
+            )
+        )
+
+    return json_encoder
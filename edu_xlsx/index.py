@@ -0,0 +1,92 @@
+from typing import List, Dict, Tuple, Iterator, Union, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import Lesson, Card
+
+
+INDEX_TEACHER: str = "teacher"
+INDEX_CLASSROOM: str = "classroom"
+INDEX_CLASS: str = "class"
+INDEX_SLOT: str = "slot"
+
+
+class TimetableIndex:
+    """
+    Inverted indexes from teacher, classroom and class IDs and `(days, period)` to cards.
+    Every index is built on its first query only, so plain conversions don't pay for them.
+    `days` is a card's days mask (e.g. "01000" is the second day), `period` is the period number
+    """
+
+    def __init__(self, lessons: List["Lesson"], cards: List["Card"]) -> None:
+        self._lessons: List["Lesson"] = lessons
+        self._cards: List["Card"] = cards
+
+        self._lessons_from_id: Optional[Dict[str, "Lesson"]] = None
+        self._indexes: Dict[str, Dict[Union[str, Tuple[str, str]], List["Card"]]] = {}
+
+    def get_lesson(self, card: "Card") -> "Lesson":
+        if self._lessons_from_id is None:
+            self._lessons_from_id = {
+                lesson.id: lesson
+                for lesson in self._lessons
+            }
+
+        return self._lessons_from_id[card.lessonid]
+
+    def _iter_keys(self, index_name: str, card: "Card") -> Iterator[Union[str, Tuple[str, str]]]:
+        if index_name == INDEX_SLOT:
+            yield (card.days, card.period)
+
+        elif index_name == INDEX_CLASSROOM:
+            yield from card.classroomids
+
+        elif index_name == INDEX_TEACHER:
+            for teacherid in self.get_lesson(card).teacherids:
+                # Lesson without teachers has one empty ID
+                if teacherid:
+                    yield teacherid
+
+        else:
+            yield from self.get_lesson(card).classids
+
+    def _get_index(self, index_name: str) -> Dict[Union[str, Tuple[str, str]], List["Card"]]:
+        index: Optional[Dict[Union[str, Tuple[str, str]], List["Card"]]] = self._indexes.get(index_name)
+
+        if index is None:
+            index = {}
+
+            for card in self._cards:
+                # A card may repeat an ID, e.g. two groups in one classroom, it's listed once still
+                for key in dict.fromkeys(self._iter_keys(index_name, card)):
+                    if key in index:
+                        index[key].append(card)
+                    else:
+                        index[key] = [card]
+
+            self._indexes[index_name] = index
+
+        return index
+
+    def _get_cards(self, index_name: str, id: str, days: Optional[str], period: Optional[Union[int, str]]) -> List["Card"]:
+        cards: List["Card"] = self._get_index(index_name).get(id, [])
+
+        if period is not None:
+            period = str(period)
+
+        return [
+            card
+            for card in cards
+            if (days is None or card.days == days) and (period is None or card.period == period)
+        ]
+
+    def get_teacher_cards(self, teacher_id: str, days: Optional[str]=None, period: Optional[Union[int, str]]=None) -> List["Card"]:
+        return self._get_cards(INDEX_TEACHER, teacher_id, days, period)
+
+    def get_classroom_cards(self, classroom_id: str, days: Optional[str]=None, period: Optional[Union[int, str]]=None) -> List["Card"]:
+        return self._get_cards(INDEX_CLASSROOM, classroom_id, days, period)
+
+    def get_class_cards(self, class_id: str, days: Optional[str]=None, period: Optional[Union[int, str]]=None) -> List["Card"]:
+        return self._get_cards(INDEX_CLASS, class_id, days, period)
+
+    def get_slot_cards(self, days: str, period: Union[int, str]) -> List["Card"]:
+        return list(self._get_index(INDEX_SLOT).get((days, str(period)), []))
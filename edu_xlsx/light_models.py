@@ -0,0 +1,252 @@
+from operator import attrgetter
+
+from .utils import generate_hex_color
+
+from typing import List, Dict, Tuple, Callable, Any, Optional
+
+
+class DefaultFactory:
+    __slots__ = ("factory", )
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self.factory: Callable[[], Any] = factory
+
+
+def timeoff_factory() -> List[List[List[str]]]:
+    return [
+        [
+            [
+                "1"
+            ]
+        ]
+    ]
+
+
+generate_hex_color_field: DefaultFactory = DefaultFactory(
+    factory = generate_hex_color
+)
+
+empty_list_field: DefaultFactory = DefaultFactory(
+    factory = list
+)
+
+timeoff_field: DefaultFactory = DefaultFactory(
+    factory = timeoff_factory
+)
+
+
+class LightModel:
+    """
+    Slotted record with the same fields and defaults as the pydantic model of the same name,
+    but without validation.
+    Used when every value is produced by the parser itself.
+    """
+
+    __slots__ = ()
+
+    # (field name, default) pairs in the pydantic model's order, `...` marks a required field
+    _fields_defaults: Tuple[Tuple[str, Any], ...] = ()
+
+    _fields: Tuple[str, ...] = ()
+    _values_getter: Callable[[Any], Tuple[Any, ...]]
+
+    def __init_subclass__(cls) -> None:
+        cls._fields = tuple([
+            field
+            for field, _ in cls._fields_defaults
+        ])
+
+        cls._values_getter = attrgetter(*cls._fields)
+
+    def __init__(self, **kwargs: Any) -> None:
+        for field, default in self._fields_defaults:
+            if field in kwargs:
+                value = kwargs.pop(field)
+
+            elif default is ...:
+                raise TypeError(
+                    "{model_name} requires {field!r} field".format(
+                        model_name = self.__class__.__name__,
+                        field = field
+                    )
+                )
+
+            elif isinstance(default, DefaultFactory):
+                value = default.factory()
+
+            else:
+                value = default
+
+            setattr(self, field, value)
+
+        if kwargs:
+            raise TypeError(
+                "{model_name} got unexpected fields: {fields}".format(
+                    model_name = self.__class__.__name__,
+                    fields = ", ".join(kwargs)
+                )
+            )
+
+    def __repr__(self) -> str:
+        return "{model_name}({fields})".format(
+            model_name = self.__class__.__name__,
+            fields = ", ".join([
+                "{0}={1!r}".format(field, value)
+                for field, value in zip(self._fields, self.to_row())
+            ])
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self.to_row() == other.to_row()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return self.to_row()
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for field, value in zip(self._fields, state):
+            setattr(self, field, value)
+
+    def to_row(self) -> Tuple[Any, ...]:
+        return self._values_getter(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._fields, self._values_getter(self)))
+
+    # Same name as pydantic's `BaseModel.dict`, so both backends are saved the same way
+    dict = to_dict
+
+    def copy(self, update: Optional[Dict[str, Any]]=None) -> "LightModel":
+        """
+        Shallow copy with `update` fields replaced, like pydantic's `BaseModel.copy`
+        """
+
+        model: LightModel = self.__class__.__new__(self.__class__)
+        model.__setstate__(self.to_row())
+
+        for field, value in (update or {}).items():
+            setattr(model, field, value)
+
+        return model
+
+
+class Class(LightModel):
+    __slots__ = ("id", "name", "short", "teacherid", "classroomids", "bell", "color", "timeoff", "printsubjectpictures", "classroomid")
+
+    _fields_defaults = (
+        ("id", ...),
+        ("name", ...),
+        ("short", ...),
+        ("teacherid", ""),
+        ("classroomids", empty_list_field),
+        ("bell", "0"),
+        ("color", generate_hex_color_field),
+        ("timeoff", timeoff_field),
+        ("printsubjectpictures", True),
+        ("classroomid", None)
+    )
+
+
+class Subject(LightModel):
+    __slots__ = ("id", "name", "short", "color", "picture_url", "timeoff", "contract_weight")
+
+    _fields_defaults = (
+        ("id", ...),
+        ("name", ...),
+        ("short", ...),
+        ("color", generate_hex_color_field),
+        ("picture_url", ""),
+        ("timeoff", timeoff_field),
+        ("contract_weight", 1)
+    )
+
+
+class Classroom(LightModel):
+    __slots__ = ("id", "name", "short", "buildingid", "sharedroom", "needssupervision", "color", "nearbyclassroomids")
+
+    _fields_defaults = (
+        ("id", ...),
+        ("name", ...),
+        ("short", ...),
+        ("buildingid", ""),
+        ("sharedroom", False),
+        ("needssupervision", False),
+        ("color", generate_hex_color_field),
+        ("nearbyclassroomids", empty_list_field)
+    )
+
+
+class Teacher(LightModel):
+    __slots__ = ("id", "firstname", "lastname", "short", "nameprefix", "namesuffix", "gender", "bell", "color", "fontcolorprint", "fontcolorprint2", "fontcolorscreen", "timeoff")
+
+    _fields_defaults = (
+        ("id", ...),
+        ("firstname", ...),
+        ("lastname", ...),
+        ("short", ...),
+        ("nameprefix", ""),
+        ("namesuffix", ""),
+        ("gender", ""),
+        ("bell", ""),
+        ("color", generate_hex_color_field),
+        ("fontcolorprint", ""),
+        ("fontcolorprint2", ""),
+        ("fontcolorscreen", ""),
+        ("timeoff", timeoff_field)
+    )
+
+
+class Group(LightModel):
+    __slots__ = ("id", "name", "classid", "entireclass", "ascttdivision", "divisionid", "okgroup", "students_count", "color")
+
+    _fields_defaults = (
+        ("id", ...),
+        ("name", ...),
+        ("classid", ...),
+        ("entireclass", ...),
+        ("ascttdivision", ...),
+        ("divisionid", ...),
+        ("okgroup", False),
+        ("students_count", None),
+        ("color", generate_hex_color_field)
+    )
+
+
+class Lesson(LightModel):
+    __slots__ = ("id", "subjectid", "teacherids", "groupids", "classids", "classroomidss", "termsdefid", "weeksdefid", "daysdefid", "count", "durationperiods", "terms", "seminargroup", "bell", "studentids", "groupnames")
+
+    _fields_defaults = (
+        ("id", ...),
+        ("subjectid", ...),
+        ("teacherids", ...),
+        ("groupids", ...),
+        ("classids", ...),
+        ("classroomidss", ...),
+        ("termsdefid", ...),
+        ("weeksdefid", ...),
+        ("daysdefid", ...),
+        ("count", 1),
+        ("durationperiods", 1),
+        ("terms", "1"),
+        ("seminargroup", None),
+        ("bell", ""),
+        ("studentids", empty_list_field),
+        ("groupnames", DefaultFactory(
+            factory = lambda: [""]
+        ))
+    )
+
+
+class Card(LightModel):
+    __slots__ = ("id", "lessonid", "period", "days", "weeks", "classroomids")
+
+    _fields_defaults = (
+        ("id", ...),
+        ("lessonid", ...),
+        ("period", ...),
+        ("days", ...),
+        ("weeks", ...),
+        ("classroomids", ...)
+    )
@@ -0,0 +1,159 @@
+from contextlib import contextmanager
+from time import perf_counter
+
+import tracemalloc
+
+from typing import List, Dict, Tuple, Callable, Iterable, Iterator, TypeVar, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from prettytable import PrettyTable
+
+
+T = TypeVar("T")
+
+DEFAULT_PERCENTILES: Tuple[int, ...] = (50, 90, 99)
+
+
+class ParseMetrics:
+    """
+    Durations of parser phases, summed over calls, and counts of parsed items.
+    Phases: "cache_load", "load" (workbook opening), "read_sheet" (rows iteration), "classes",
+    "sheet_blocks" (subjects, classrooms, teachers, lessons and cards, built in one pass),
+    "compact", "cache_store" and "save".
+    With `trace_memory`, tracemalloc's peak over each phase's start is kept too.
+    `callback` is called with the metrics after every `parse()` and `save()`
+    """
+
+    def __init__(self, trace_memory: bool=False, callback: Optional[Callable[["ParseMetrics"], None]]=None) -> None:
+        self.trace_memory: bool = trace_memory
+        self.callback: Optional[Callable[[ParseMetrics], None]] = callback
+
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self.peak_memory_bytes: Dict[str, int] = {}
+        self.counts: Dict[str, int] = {}
+
+        self._started_tracing: bool = False
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        start_memory: int = 0
+
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+            # Python 3.9+, older versions keep the peak since tracing started
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+
+            start_memory = tracemalloc.get_traced_memory()[0]
+
+        start_time: float = perf_counter()
+
+        try:
+            yield
+
+        finally:
+            self.add(phase, perf_counter() - start_time)
+
+            if self.trace_memory:
+                self.peak_memory_bytes[phase] = max(
+                    self.peak_memory_bytes.get(phase, 0),
+                    tracemalloc.get_traced_memory()[1] - start_memory
+                )
+
+    def iter_measured(self, phase: str, iterable: Iterable[T]) -> Iterator[T]:
+        """
+        Yields from `iterable`, time spent in getting each item is added to `phase`
+        """
+
+        iterator: Iterator[T] = iter(iterable)
+
+        while True:
+            with self.measure(phase):
+                try:
+                    item: T = next(iterator)
+                except StopIteration:
+                    return
+
+            yield item
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def notify(self) -> None:
+        if self.callback is not None:
+            self.callback(self)
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def reset(self) -> None:
+        self.seconds.clear()
+        self.calls.clear()
+        self.peak_memory_bytes.clear()
+        self.counts.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(
+            seconds = dict(self.seconds),
+            calls = dict(self.calls),
+            peak_memory_bytes = dict(self.peak_memory_bytes),
+            counts = dict(self.counts)
+        )
+
+
+def get_percentiles(values: Iterable[float], percentiles: Tuple[int, ...]=DEFAULT_PERCENTILES) -> Dict[str, float]:
+    """
+    Nearest-rank percentiles as `{"p50": ..., "p90": ...}`, empty for no values
+    """
+
+    sorted_values: List[float] = sorted(values)
+
+    if not sorted_values:
+        return {}
+
+    return {
+        "p{0}".format(percentile): sorted_values[
+            max(-(-len(sorted_values) * percentile // 100) - 1, 0)
+        ]
+        for percentile in percentiles
+    }
+
+
+def build_metrics_table(metrics: ParseMetrics) -> "PrettyTable":
+    from prettytable import PrettyTable
+
+    metrics_table: PrettyTable = PrettyTable(
+        field_names = [
+            "Phase",
+            "Calls",
+            "Time, s",
+            "Peak memory, KiB"
+        ]
+    )
+
+    metrics_table.align = "r"
+    metrics_table.align["Phase"] = "l"
+
+    for phase, seconds in metrics.seconds.items():
+        peak_memory: Optional[int] = metrics.peak_memory_bytes.get(phase)
+
+        metrics_table.add_row([
+            phase,
+            metrics.calls[phase],
+            "{:.4f}".format(seconds),
+            (
+                "{:.1f}".format(peak_memory / 1024)
+                if peak_memory is not None
+                else
+                "-"
+            )
+        ])
+
+    return metrics_table
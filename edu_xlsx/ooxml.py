@@ -0,0 +1,383 @@
+from pathlib import Path
+from zipfile import ZipFile
+from copy import copy
+from posixpath import join as posixpath_join, normpath as posixpath_normpath, dirname as posixpath_dirname
+from xml.etree.ElementTree import iterparse, Element
+
+from typing import List, Dict, Tuple, Iterator, Any, Union, Optional, IO
+
+
+SHEET_MAIN_NS: str = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS: str = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL_NS: str = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+WORKBOOK_PATH: str = "xl/workbook.xml"
+WORKBOOK_RELS_PATH: str = "xl/_rels/workbook.xml.rels"
+SHARED_STRINGS_PATH: str = "xl/sharedStrings.xml"
+
+SHEET_TAG: str = "{%s}sheet" % SHEET_MAIN_NS
+DIMENSION_TAG: str = "{%s}dimension" % SHEET_MAIN_NS
+SHEET_DATA_TAG: str = "{%s}sheetData" % SHEET_MAIN_NS
+ROW_TAG: str = "{%s}row" % SHEET_MAIN_NS
+CELL_TAG: str = "{%s}c" % SHEET_MAIN_NS
+VALUE_TAG: str = "{%s}v" % SHEET_MAIN_NS
+FORMULA_TAG: str = "{%s}f" % SHEET_MAIN_NS
+INLINE_STRING_TAG: str = "{%s}is" % SHEET_MAIN_NS
+STRING_ITEM_TAG: str = "{%s}si" % SHEET_MAIN_NS
+TEXT_TAG: str = "{%s}t" % SHEET_MAIN_NS
+RICH_TEXT_RUN_TAG: str = "{%s}r" % SHEET_MAIN_NS
+RELATIONSHIP_TAG: str = "{%s}Relationship" % PKG_REL_NS
+SHEET_RELATION_ID_ATTRIBUTE: str = "{%s}id" % REL_NS
+
+
+T_CELL = Tuple[int, int, Any]
+
+
+_column_indexes_cache: Dict[str, int] = {}
+_column_letters_cache: Dict[int, str] = {}
+
+
+def column_index_from_letters(letters: str) -> int:
+    column_index: Optional[int] = _column_indexes_cache.get(letters)
+
+    if column_index is None:
+        column_index = 0
+
+        for letter in letters:
+            column_index = column_index * 26 + ord(letter) - 64
+
+        _column_indexes_cache[letters] = column_index
+
+    return column_index
+
+
+def get_column_letters(column_index: int) -> str:
+    # 1 -> "A", 27 -> "AA"
+    letters: Optional[str] = _column_letters_cache.get(column_index)
+
+    if letters is None:
+        letters = ""
+        rest: int = column_index
+
+        while rest:
+            rest, remainder = divmod(rest - 1, 26)
+            letters = chr(65 + remainder) + letters
+
+        _column_letters_cache[column_index] = letters
+
+    return letters
+
+
+def read_sheets(archive: ZipFile) -> Tuple[List[str], List[str]]:
+    """
+    Names and archive paths of the workbook's sheets, in the workbook's order
+    """
+
+    relations: Dict[str, str] = {}
+
+    if WORKBOOK_RELS_PATH in archive.NameToInfo:
+        with archive.open(WORKBOOK_RELS_PATH) as rels_file:
+            for _, element in iterparse(rels_file):
+                if element.tag == RELATIONSHIP_TAG:
+                    target: str = element.get("Target", "")
+
+                    relations[element.get("Id")] = (
+                        target.lstrip("/")
+                        if target.startswith("/")
+                        else
+                        posixpath_normpath(posixpath_join(posixpath_dirname(WORKBOOK_PATH), target))
+                    )
+
+    sheetnames: List[str] = []
+    sheet_paths: List[str] = []
+
+    with archive.open(WORKBOOK_PATH) as workbook_file:
+        for _, element in iterparse(workbook_file):
+            if element.tag == SHEET_TAG:
+                sheetnames.append(element.get("name"))
+                sheet_paths.append(relations.get(
+                    element.get(SHEET_RELATION_ID_ATTRIBUTE),
+                    "xl/worksheets/sheet{}.xml".format(len(sheet_paths) + 1)
+                ))
+
+    return sheetnames, sheet_paths
+
+
+def get_sheetnames(xlsx_file: Union[str, Path, IO[bytes]]) -> List[str]:
+    with ZipFile(xlsx_file) as archive:
+        return read_sheets(archive)[0]
+
+
+def get_sheet_index(sheetnames: List[str], sheet: Union[int, str]) -> int:
+    """
+    Index of a sheet given by its index or name. A string of digits is a name first,
+    as sheets are often named "1", "2", and an index if no sheet has that name
+    """
+
+    if isinstance(sheet, str):
+        if sheet in sheetnames:
+            return sheetnames.index(sheet)
+
+        if sheet.isdecimal():
+            sheet = int(sheet)
+
+    if isinstance(sheet, int) and 0 <= sheet < len(sheetnames):
+        return sheet
+
+    raise ValueError(
+        "Sheet {sheet!r} must be {correct_values}!".format(
+            sheet = sheet,
+            correct_values = " or ".join([
+                repr(sheetname)
+                for sheetname in sheetnames
+            ] + [
+                "an index below {count}".format(
+                    count = len(sheetnames)
+                )
+            ])
+        )
+    )
+
+
+def split_coordinate(coordinate: str) -> Tuple[int, int]:
+    for i, char in enumerate(coordinate):
+        if char.isdigit():
+            return int(coordinate[i:]), column_index_from_letters(coordinate[:i])
+
+    raise ValueError(
+        "Invalid cell coordinate {coordinate!r}!".format(
+            coordinate = coordinate
+        )
+    )
+
+
+def cast_number(value: str) -> Union[int, float]:
+    # Same rules as openpyxl uses for "n" cells
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+
+    return int(value)
+
+
+def get_element_text(element: Element) -> str:
+    text: Optional[str] = element.findtext(TEXT_TAG)
+
+    if text is not None:
+        return text
+
+    return "".join([
+        run_text.text or ""
+        for run_text in element.iterfind("{0}/{1}".format(RICH_TEXT_RUN_TAG, TEXT_TAG))
+    ])
+
+
+class OOXMLSheetReader:
+    """
+    Streams cell values straight from the sheet XML of an .XLSX file,
+    without building openpyxl's workbook object model.
+    The sheet is chosen by `sheet_index` or by `sheet_name`, other sheets of the opened file
+    are read with `get_sheet()`
+    """
+
+    def __init__(self, xlsx_file: Union[str, Path, IO[bytes]], sheet_index: int=0, sheet_name: Optional[str]=None) -> None:
+        self._archive: ZipFile = ZipFile(xlsx_file)
+
+        self.sheetnames: List[str]
+        self._sheet_paths: List[str]
+
+        self.sheetnames, self._sheet_paths = read_sheets(self._archive)
+
+        if not self._sheet_paths:
+            raise ValueError("Input .XLSX has no sheets!")
+
+        if sheet_name is not None:
+            sheet_index = get_sheet_index(
+                sheetnames = self.sheetnames,
+                sheet = sheet_name
+            )
+
+        self.sheet_path: str = self._sheet_paths[sheet_index]
+
+        self._shared_strings: Optional[List[str]] = None
+
+        self.max_row: int
+        self.max_column: int
+
+        self.max_row, self.max_column = self._read_dimension()
+
+    def close(self) -> None:
+        self._archive.close()
+
+    def get_sheet(self, sheet_index: int) -> "OOXMLSheetReader":
+        """
+        Reader of another sheet sharing this one's opened archive and shared strings,
+        closing either of them closes both
+        """
+
+        if self._sheet_paths[sheet_index] == self.sheet_path:
+            return self
+
+        # Loaded once for all sheets
+        self.shared_strings
+
+        sheet_reader: OOXMLSheetReader = copy(self)
+        sheet_reader.sheet_path = self._sheet_paths[sheet_index]
+        sheet_reader.max_row, sheet_reader.max_column = sheet_reader._read_dimension()
+
+        return sheet_reader
+
+    def _read_dimension(self) -> Tuple[int, int]:
+        with self._archive.open(self.sheet_path) as sheet_file:
+            for event, element in iterparse(sheet_file, events=("start", )):
+                if element.tag == DIMENSION_TAG:
+                    ref: Optional[str] = element.get("ref")
+
+                    if ref:
+                        return split_coordinate(ref.rsplit(":", 1)[-1])
+
+                    break
+
+                if element.tag == SHEET_DATA_TAG:
+                    break
+
+        # Sheet has no <dimension> record, so it must be measured once
+        max_row = max_column = 0
+
+        for row, column, _ in self.iter_cells():
+            max_row = max(max_row, row)
+            max_column = max(max_column, column)
+
+        return max_row, max_column
+
+    @property
+    def shared_strings(self) -> List[str]:
+        if self._shared_strings is None:
+            self._shared_strings = []
+
+            if SHARED_STRINGS_PATH in self._archive.NameToInfo:
+                with self._archive.open(SHARED_STRINGS_PATH) as shared_strings_file:
+                    for _, element in iterparse(shared_strings_file):
+                        if element.tag == STRING_ITEM_TAG:
+                            self._shared_strings.append(get_element_text(element).replace("x005F_", ""))
+                            element.clear()
+
+        return self._shared_strings
+
+    def _get_cell_value(self, element: Element) -> Any:
+        data_type: str = element.get("t", "n")
+
+        formula: Optional[Element] = element.find(FORMULA_TAG)
+
+        if formula is not None:
+            return "=" + (formula.text or "")
+
+        if data_type == "inlineStr":
+            inline_string: Optional[Element] = element.find(INLINE_STRING_TAG)
+
+            return (
+                get_element_text(inline_string)
+                if inline_string is not None
+                else
+                None
+            )
+
+        value: Optional[str] = element.findtext(VALUE_TAG) or None
+
+        if value is None:
+            return None
+
+        if data_type == "n":
+            return cast_number(value)
+
+        if data_type == "s":
+            return self.shared_strings[int(value)]
+
+        if data_type == "b":
+            return bool(int(value))
+
+        return value
+
+    def iter_cells(self) -> Iterator[T_CELL]:
+        """
+        Yields `(row, column, value)` of every non-empty cell in sheet order
+        """
+
+        sheet_data: Optional[Element] = None
+        row: int = 0
+        column: int = 0
+
+        with self._archive.open(self.sheet_path) as sheet_file:
+            for event, element in iterparse(sheet_file, events=("start", "end")):
+                if event == "start":
+                    if element.tag == ROW_TAG:
+                        row_number: Optional[str] = element.get("r")
+
+                        row = (
+                            int(row_number)
+                            if row_number
+                            else
+                            row + 1
+                        )
+
+                        column = 0
+
+                    elif element.tag == SHEET_DATA_TAG:
+                        sheet_data = element
+
+                    continue
+
+                if element.tag == CELL_TAG:
+                    coordinate: Optional[str] = element.get("r")
+
+                    if coordinate:
+                        row, column = split_coordinate(coordinate)
+                    else:
+                        column += 1
+
+                    value: Any = self._get_cell_value(element)
+
+                    if value is not None:
+                        yield row, column, value
+
+                elif element.tag == ROW_TAG and sheet_data is not None:
+                    # Drop already read rows, so memory stays flat
+                    sheet_data.clear()
+
+    def iter_rows(self, min_row: int=1, max_row: Optional[int]=None, max_col: Optional[int]=None, values_only: bool=True) -> Iterator[Tuple[Any, ...]]:
+        """
+        Same as openpyxl's `Worksheet.iter_rows(values_only=True)` for the columns from "A"
+        """
+
+        if not values_only:
+            raise ValueError("OOXML reader supports only values")
+
+        if max_row is None:
+            max_row = self.max_row
+
+        if max_col is None:
+            max_col = self.max_column
+
+        current_row: int = min_row
+        row_values: List[Any] = [None] * max_col
+
+        for row, column, value in self.iter_cells():
+            if row < min_row:
+                continue
+
+            if row > max_row:
+                break
+
+            while current_row < row:
+                yield tuple(row_values)
+
+                row_values = [None] * max_col
+                current_row += 1
+
+            if column <= max_col:
+                row_values[column - 1] = value
+
+        while current_row <= max_row:
+            yield tuple(row_values)
+
+            row_values = [None] * max_col
+            current_row += 1
@@ -1,472 +1,1083 @@
-from pathlib import Path
-from openpyxl import load_workbook
-from openpyxl.workbook.workbook import Workbook
-from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.utils.cell import _STRING_COL_CACHE
-from itertools import chain as itertools_chain
-from json import dumps as json_dumps
-
-from .models import Class, Subject, Classroom, Teacher, Group, Lesson, Card
-from .utils import build_ids, build_groups, parse_classroom_names, parse_coordinate_ord
-
-from typing import List, Dict, Tuple, Any, Union, Optional
-
-
-ACCEPTABLE_TIMETABLE_NUMBERS: List[str] = [
-    "1",
-    "2"
-]
-
-
-class XLSXParser:
-    def __init__(self, xlsx_filepath: Union[str, Path], timetable_number: Union[int, str]) -> None:
-        if not isinstance(xlsx_filepath, Path):
-            xlsx_filepath = Path(xlsx_filepath)
-
-        if not isinstance(timetable_number, str):
-            timetable_number = str(timetable_number)
-
-        self.xlsx_filepath: Path = xlsx_filepath
-        self.timetable_number: str = timetable_number
-
-        if not self.xlsx_filepath.exists() or not self.xlsx_filepath.is_file():
-            raise ValueError(
-                "Input .XLSX {xlsx_filepath!r} must exists and be a file!".format(
-                    xlsx_filepath = xlsx_filepath.resolve()
-                )
-            )
-
-        if timetable_number not in ACCEPTABLE_TIMETABLE_NUMBERS:
-            raise ValueError(
-                "Timetable number {timetable_number!r} must be {correct_values}!".format(
-                    timetable_number = timetable_number,
-                    correct_values = " or ".join(ACCEPTABLE_TIMETABLE_NUMBERS)
-                )
-            )
-
-        datas_module = __import__(
-            "edu_xlsx.datas_{timetable_number}".format(
-                timetable_number = timetable_number
-            ),
-            fromlist = [
-                "periods",
-                "daysdefs"
-            ]
-        )
-
-        self._periods: List[dict] = datas_module.periods
-        self._periods_len: int = len(self._periods)
-        self._daysdefs: List[dict] = datas_module.daysdefs
-        self._daysdefs_len: int = len(self._daysdefs)
-
-        self._excel: Workbook = load_workbook(
-            filename = xlsx_filepath
-        )
-
-        self._sheet: Worksheet = self._excel[self._excel.sheetnames[0]]
-
-        self._sheet_max_row: int = self._sheet.max_row
-        self._sheet_max_column: int = self._sheet.max_column
-        self._sheet_max_column_letters: str = _STRING_COL_CACHE[self._sheet_max_column]
-
-        self.encoding: str = "utf-8"
-
-    def parse(self) -> None:
-        i: int
-        id: str
-
-        self._classes: List[Class] = []
-        self._classes_from_id: Dict[str, Class] = {}
-        self._classes_from_name: Dict[str, Class] = {}
-
-        i = 1
-
-        for _classes in self._sheet["A5:A{}".format(self._sheet_max_row)]:
-            for class_cell in _classes:
-                if not class_cell.value:
-                    continue
-
-                class_name: str = class_cell.value.strip()
-
-                id = "*{}".format(i)
-
-                class_: Class = Class(
-                    id = id,
-                    name = class_name,
-                    short = class_name
-                )
-
-                self._classes.append(class_)
-                self._classes_from_id[id] = class_
-                self._classes_from_name[class_name] = class_
-
-                i += 1
-
-        self._groups_from_class_id: Dict[str, Tuple[Group, Group, Group]] = {}
-        self._groups: List[Group] = []
-
-        for group_ in build_ids(
-            items = build_groups(
-                classids = self._classes_from_id.keys()
-            )
-        ):
-            group: Group = Group(
-                id = group_["id"],
-                name = group_["name"],
-                classid = group_["classid"],
-                entireclass = group_["entireclass"],
-                ascttdivision = (
-                    ""
-                    if group_["divisiontag"] == "0"
-                    else
-                    group_["divisiontag"]
-                ),
-                divisionid = "*{0}:{1}".format(
-                    i,
-                    (
-                        ""
-                        if group_["entireclass"]
-                        else
-                        "1"
-                    )
-                )
-            )
-
-            self._groups.append(group)
-
-            if group.classid in self._groups_from_class_id:
-                self._groups_from_class_id[group.classid].append(group)
-            else:
-                self._groups_from_class_id[group.classid] = [group]
-
-        sheet_table_datas: Dict[str, List[Any]] = {
-            "subjects": [],
-            "classrooms": [],
-            "teachers": [],
-            "lessons": []
-        }
-
-        for i in range(0, len(self._classes)):
-            i_x: int = i * 4
-
-            sheet_table_datas["subjects"].append(self._sheet["B{0}:{1}{0}".format(5 + i_x, self._sheet_max_column_letters)])
-            sheet_table_datas["classrooms"].append(self._sheet["B{0}:{1}{0}".format(7 + i_x, self._sheet_max_column_letters)])
-            sheet_table_datas["teachers"].append(self._sheet["B{0}:{1}{0}".format(8 + i_x, self._sheet_max_column_letters)])
-            sheet_table_datas["lessons"].append(self._sheet["B{0}:{1}{2}".format(5 + i_x, self._sheet_max_column_letters, 5 + i_x + 3)])
-
-        self._subjects: List[Subject] = []
-        self._subjects_from_id: Dict[str, Subject] = {}
-        self._subjects_from_name: Dict[str, Subject] = {}
-
-        i = 1
-
-        for _subjects in sheet_table_datas["subjects"]:
-            for __subjects in _subjects:
-                for subject_cell in __subjects:
-                    subject_name: Union[str, None] = subject_cell.value
-
-                    if not subject_name:
-                        continue
-
-                    subject_name = subject_name.strip()
-
-                    if subject_name in self._subjects_from_name:
-                        continue
-
-                    id = "*{}".format(i)
-
-                    subject: Subject = Subject(
-                        id = id,
-                        name = subject_name,
-                        short = subject_name
-                    )
-
-                    self._subjects.append(subject)
-                    self._subjects_from_id[id] = subject
-                    self._subjects_from_name[subject_name] = subject
-
-                    i += 1
-
-        self._classrooms: List[Classroom] = []
-        self._classrooms_from_id: Dict[str, Classroom] = {}
-        self._classrooms_from_name: Dict[str, Classroom] = {}
-
-        i = 1
-
-        for _classrooms in sheet_table_datas["classrooms"]:
-            for __classrooms in _classrooms:
-                for classroom_cell in __classrooms:
-                    classroom_names_str: Union[str, int, None] = classroom_cell.value
-
-                    if not classroom_names_str:
-                        continue
-
-                    for classroom_name in parse_classroom_names(
-                        classroom_names_str = classroom_names_str
-                    ):
-                        if classroom_name in self._classrooms_from_name:
-                            continue
-
-                        id = "*{}".format(i)
-
-                        classroom: Classroom = Classroom(
-                            id = id,
-                            name = classroom_name,
-                            short = classroom_name
-                        )
-
-                        self._classrooms.append(classroom)
-                        self._classrooms_from_id[id] = classroom
-                        self._classrooms_from_name[classroom_name] = classroom
-
-                        i += 1
-
-        self._teachers: List[Teacher] = []
-        self._teachers_from_id: Dict[str, Teacher] = {}
-        self._teachers_from_name: Dict[str, Teacher] = {}
-
-        i = 1
-
-        for _teachers in sheet_table_datas["teachers"]:
-            for __teachers in _teachers:
-                for teachers_cell in __teachers:
-                    _teachers_names: Union[str, None] = teachers_cell.value
-
-                    if not _teachers_names:
-                        continue
-
-                    for teacher_name in _teachers_names.split(","):
-                        teacher_name = teacher_name.strip()
-
-                        if teacher_name in self._teachers_from_name:
-                            continue
-
-                        id = "*{}".format(i)
-
-                        teacher: Teacher = Teacher(
-                            id = id,
-                            firstname = "",
-                            lastname = teacher_name,
-                            short = teacher_name
-                            # TODO: use `gender`
-                        )
-
-                        self._teachers.append(teacher)
-                        self._teachers_from_id[id] = teacher
-                        self._teachers_from_name[teacher_name] = teacher
-
-                        i += 1
-
-        self._lessons: List[Lesson] = []
-        self._lessons_from_id: Dict[str, Lesson] = {}
-
-        self._cards: List[Card] = []
-
-        i = 1
-
-        for sheet_lessons_rows in sheet_table_datas["lessons"]:
-            for subject_cell, classes_cell, classrooms_cell, teachers_cell in zip(sheet_lessons_rows[0], sheet_lessons_rows[1], sheet_lessons_rows[2], sheet_lessons_rows[3]):
-                if not subject_cell.value:
-                    continue
-
-                coordinate_ord: int = parse_coordinate_ord(
-                    coordinate = subject_cell.coordinate
-                )
-
-                period: int = (coordinate_ord - 65) % self._periods_len or self._periods_len
-                daysdef_id_num: int = (coordinate_ord - 65 + self._periods_len - 1) // self._periods_len
-
-                id = "*{}".format(i)
-
-                classid: str = self._classes_from_name[classes_cell.value.split(",")[0].strip()].id
-                classroom_names_str: Union[str, int, None] = classrooms_cell.value
-
-                classroomids: List[str] = []
-
-                for classroom_name in parse_classroom_names(
-                    classroom_names_str = classroom_names_str
-                ):
-                    classroomids.append(self._classrooms_from_name[classroom_name].id)
-
-                teacher_ids: List[str] = (
-                    [
-                        self._teachers_from_name[teacher_name.strip()].id
-                        for teacher_name in teachers_cell.value.split(",")
-                    ]
-                    if teachers_cell.value
-                    else
-                    [""]
-                )
-
-                lesson: Lesson = Lesson(
-                    id = id,
-                    subjectid = self._subjects_from_name[subject_cell.value.strip()].id,
-                    teacherids = teacher_ids,
-                    groupids = [
-                        group.id
-                        for group in (
-                            self._groups_from_class_id[classid][1:]
-                            if len(teacher_ids) > 1
-                            else
-                            self._groups_from_class_id[classid][:1]
-                        )
-                    ],
-                    classids = [classid],
-                    classroomidss = [classroomids],
-                    termsdefid = "*1",
-                    weeksdefid = "*1",
-                    daysdefid = "*{}".format(daysdef_id_num)
-                )
-
-                self._lessons.append(lesson)
-                self._lessons_from_id[id] = lesson
-
-                card: Card = Card(
-                    id = id,
-                    lessonid = lesson.id,
-                    period = str(period),
-                    days = self._daysdefs[daysdef_id_num - 1]["days"],
-                    weeks = "1",
-                    classroomids = lesson.classroomidss[0]
-                )
-
-                self._cards.append(card)
-
-                i += 1
-
-    def save(self, json_filepath: Union[str, Path], json_indent: Optional[int]=None) -> None:
-        if not isinstance(json_filepath, Path):
-            json_filepath = Path(json_filepath)
-
-        if not isinstance(json_indent, int) or json_indent <= 0:
-            json_indent = None
-
-        timetable_dict: dict = {
-            "r": {
-                "rights": {
-                    "subjects": True,
-                    "classes": True,
-                    "teachers": True,
-                    "classrooms": True,
-                    "students": True,
-                    "igroups": True,
-                    "classroomsupervision": True,
-                    "teachers_summary": True,
-                    "classes_summary": True,
-                    "classrooms_summary": True,
-                    "igroups_summary": True
-                },
-                "dbiAccessorRes": {
-                    "type": "ttuidocdbi",
-                    "dbid": "",
-                    "tables": [
-                        {"id":"globals","def":{"id":"globals","name":"Расписание","item_name":"Расписание","icon":"/static/pics/school_32.png"},"cdefs":[{"id":"name","type":"string","name":"Название учреждения"},{"id":"settings","type":"subobject","name":"settings","subcolumns":[{"id":"m_nZlozitostGener","type":"intcombo","name":"m_nZlozitostGener"},{"id":"m_bAllowZlavnenie","type":"checkbox","name":"m_bAllowZlavnenie"},{"id":"m_bGenerDraft","type":"checkbox","name":"m_bGenerDraft"},{"id":"m_nCoGenerovat","type":"intcombo","name":"m_nCoGenerovat"},{"id":"m_nSchoolType","type":"intcombo","name":"Тип школы"},{"id":"m_nGapsCounting","type":"intcombo","name":"Способ подсчета окон"},{"id":"name_format","type":"combo","name":"Формат имени"},{"id":"m_strPrintHeaderText","type":"string","name":"Заголовок"},{"id":"m_strDateBellowTimeTable","type":"string","name":"m_strDateBellowTimeTable"},{"id":"m_bPrintDozory","type":"checkbox","name":"Печатать дежурства в индивидуальных расписаниях"},{"id":"m_bPrintDozoryVSuhrnnych","type":"checkbox","name":"Печатать дежурства в итоговых расписаниях"},{"id":"m_bPrintDozoryColor","type":"checkbox","name":"Печатать надсмотр над кабинетами в цвете"},{"id":"m_bPrintSinglesSpolu","type":"checkbox","name":"Печатать одиночные последоват. уроки как 1 урок"},{"id":"m_bPrintDoublesAsSingles","type":"checkbox","name":"Печатать спаренные уроки как одиночные"},{"id":"m_nTimeFormat","type":"intcombo","name":"Формат времени"},{"id":"m_nPrvyDen","type":"intcombo","name":"Выходные дни"},{"id":"m_bPrintDayAsNumber","type":"checkbox","name":"Показывать номер дня вместо дня недели (т.е. День 1 вместо Понед.)"},{"id":"m_DozoryKriteria","type":"subobject","name":"m_DozoryKriteria","subcolumns":[{"id":"ucitel_limit_pocet","type":"int","name":"Большее/меньшее число надсмотров чем определено в ограничениях учителей"},{"id":"ucitel_limit_minuty","type":"int","name":"Больше/меньше минут надсмотров чем определено в ограничениях учителей"},{"id":"ucitel_rovnomerne_pocet","type":"int","name":"Такое же число для всех учителей"},{"id":"ucitel_rovnomerne_minuty","type":"int","name":"Такое же число минут для всех учителей"},{"id":"ucitel_uci_predalebopo","type":"int","name":"Учитель имет урок до ИЛИ после"},{"id":"ucitel_uci_predajpo","type":"int","name":"Учитель имет урок до И после"},{"id":"ucitel_uci_vsusednej_predalebopo","type":"int","name":"В соседнем кабинете до ИЛИ после"},{"id":"ucitel_uci_vsusednej_predajpo","type":"int","name":"В соседнем кабинете до И после"},{"id":"ucitel_cezdvojhodinovku","type":"int","name":"Во время двойного (или более длинного) урока"},{"id":"ucitel_prazdnyden","type":"int","name":"В день без уроков"},{"id":"ucitel_predvyucovanim","type":"int","name":"Перед первым уроком учителя"},{"id":"ucitel_povyucovani","type":"int","name":"После последнего урока учителя"},{"id":"ucitel_vjedenden","type":"int","name":"Все в один день"},{"id":"ucitel_zasebou","type":"int","name":"Непрерывно"}]},{"id":"draft_options","type":"subdata","name":"draft_options","subcolumns":[{"id":"active","type":"checkbox","name":"active"},{"id":"relax","type":"checkbox","name":"relax"}]}]},{"id":"year","type":"schoolyear","name":"Учебный год"},{"id":"reg_name","type":"string","name":"reg_name"}],"data_rows":[{"id":"1","name":"","settings":{"m_nZlozitostGener":1,"m_bAllowZlavnenie":True,"m_bGenerDraft":False,"m_nCoGenerovat":0,"m_nSchoolType":0,"m_nGapsCounting":0,"name_format":"FSL","m_strPrintHeaderText":"","m_strDateBellowTimeTable":"","m_bPrintDozory":True,"m_bPrintDozoryVSuhrnnych":False,"m_bPrintDozoryColor":False,"m_bPrintSinglesSpolu":False,"m_bPrintDoublesAsSingles":False,"m_nTimeFormat":0,"m_nPrvyDen":0,"m_bPrintDayAsNumber":False,"m_DozoryKriteria":{"ucitel_limit_pocet":0,"ucitel_limit_minuty":0,"ucitel_rovnomerne_pocet":0,"ucitel_rovnomerne_minuty":0,"ucitel_uci_predalebopo":0,"ucitel_uci_predajpo":0,"ucitel_uci_vsusednej_predalebopo":0,"ucitel_uci_vsusednej_predajpo":0,"ucitel_cezdvojhodinovku":0,"ucitel_prazdnyden":0,"ucitel_predvyucovanim":0,"ucitel_povyucovani":0,"ucitel_vjedenden":0,"ucitel_zasebou":0},"draft_options":{}},"year":2022,"reg_name":""}],"data_columns":["name","settings","year","reg_name"]},
-                        {"id":"periods","def":{"id":"periods","name":"Периоды","item_name":"Периоды","icon":"/static/pics/time_32.svg"},"cdefs":[{"id":"period","type":"tableid","name":"Период","table":"periods"},{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"},{"id":"daydata","type":"subdata","name":"daydata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"}]},{"id":"printinsummary","type":"checkbox","name":"Печатать этот период в общих расписаниях"},{"id":"printinteacher","type":"checkbox","name":"Печатать этот период в отд. расп. учителей"},{"id":"printinclass","type":"checkbox","name":"Печатать этот период в отд. расп. учеников"},{"id":"printinclassroom","type":"checkbox","name":"Печатать этот период в отд. расп. кабинетов"},{"id":"printonlyinbells","type":"tableids","name":"Печат. в звонках","table":"bells"}],"data_rows":[
-                            {
-                                "id": str(i),
-                                "period": period["period"],
-                                "name": period["name"],
-                                "short": period["short"],
-                                "starttime": period["starttime"],
-                                "endtime": period["endtime"],
-                                "daydata": {},
-                                "printinsummary": True,
-                                "printinteacher": True,
-                                "printinclass": True,
-                                "printinclassroom": True,
-                                "printonlyinbells": []
-                            }
-                            for i, period in enumerate(self._periods, 1)
-                        ], "data_columns":["period","name","short","starttime","endtime","daydata","printinsummary","printinteacher","printinclass","printinclassroom","printonlyinbells"]},
-                        {"id":"breaks","def":{"id":"breaks","name":"Перерывы","item_name":"Перерыв","icon":"/static/pics/break_32.png"},"cdefs":[{"id":"break","type":"tableid","name":"перемена","table":"breaks"},{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"},{"id":"daydata","type":"subdata","name":"daydata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"}]},{"id":"printinsummary","type":"checkbox","name":"Печатать этот период в общих расписаниях"},{"id":"printinteacher","type":"checkbox","name":"Печатать этот период в отд. расп. учителей"},{"id":"printinclass","type":"checkbox","name":"Печатать этот период в отд. расп. учеников"},{"id":"printinclassroom","type":"checkbox","name":"Печатать этот период в отд. расп. кабинетов"},{"id":"printonlyinbells","type":"tableids","name":"Печат. в звонках","table":"bells"},{"id":"printtext","type":"string","name":"Текст для распечатки"}],"data_rows":[],"data_columns":["break","name","short","starttime","endtime","daydata","printinsummary","printinteacher","printinclass","printinclassroom","printonlyinbells","printtext"]},
-                        {"id":"bells","def":{"id":"bells","name":"bells","item_name":"bells","icon":""},"cdefs":[{"id":"bell","type":"tableid","name":"Звонки","table":"bells"},{"id":"perioddata","type":"subdata","name":"perioddata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"},{"id":"daydata","type":"subdata","name":"daydata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"}]}]},{"id":"breakdata","type":"subdata","name":"breakdata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"},{"id":"daydata","type":"subdata","name":"daydata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"}]}]}],"data_rows":[{"id":"0","bell":"0","perioddata":{},"breakdata":{}},{"id":"1","bell":"1","perioddata":{},"breakdata":{}},{"id":"2","bell":"2","perioddata":{},"breakdata":{}},{"id":"3","bell":"3","perioddata":{},"breakdata":{}},{"id":"4","bell":"4","perioddata":{},"breakdata":{}},{"id":"5","bell":"5","perioddata":{},"breakdata":{}},{"id":"6","bell":"6","perioddata":{},"breakdata":{}},{"id":"7","bell":"7","perioddata":{},"breakdata":{}},{"id":"8","bell":"8","perioddata":{},"breakdata":{}},{"id":"9","bell":"9","perioddata":{},"breakdata":{}},{"id":"10","bell":"10","perioddata":{},"breakdata":{}},{"id":"11","bell":"11","perioddata":{},"breakdata":{}},{"id":"12","bell":"12","perioddata":{},"breakdata":{}},{"id":"13","bell":"13","perioddata":{},"breakdata":{}},{"id":"14","bell":"14","perioddata":{},"breakdata":{}},{"id":"15","bell":"15","perioddata":{},"breakdata":{}},{"id":"16","bell":"16","perioddata":{},"breakdata":{}},{"id":"17","bell":"17","perioddata":{},"breakdata":{}},{"id":"18","bell":"18","perioddata":{},"breakdata":{}},{"id":"19","bell":"19","perioddata":{},"breakdata":{}},{"id":"20","bell":"20","perioddata":{},"breakdata":{}},{"id":"21","bell":"21","perioddata":{},"breakdata":{}},{"id":"22","bell":"22","perioddata":{},"breakdata":{}},{"id":"23","bell":"23","perioddata":{},"breakdata":{}},{"id":"24","bell":"24","perioddata":{},"breakdata":{}},{"id":"25","bell":"25","perioddata":{},"breakdata":{}},{"id":"26","bell":"26","perioddata":{},"breakdata":{}},{"id":"27","bell":"27","perioddata":{},"breakdata":{}},{"id":"28","bell":"28","perioddata":{},"breakdata":{}},{"id":"29","bell":"29","perioddata":{},"breakdata":{}},{"id":"30","bell":"30","perioddata":{},"breakdata":{}},{"id":"31","bell":"31","perioddata":{},"breakdata":{}},{"id":"32","bell":"32","perioddata":{},"breakdata":{}},{"id":"33","bell":"33","perioddata":{},"breakdata":{}},{"id":"34","bell":"34","perioddata":{},"breakdata":{}},{"id":"35","bell":"35","perioddata":{},"breakdata":{}},{"id":"36","bell":"36","perioddata":{},"breakdata":{}},{"id":"37","bell":"37","perioddata":{},"breakdata":{}},{"id":"38","bell":"38","perioddata":{},"breakdata":{}},{"id":"39","bell":"39","perioddata":{},"breakdata":{}},{"id":"40","bell":"40","perioddata":{},"breakdata":{}},{"id":"41","bell":"41","perioddata":{},"breakdata":{}},{"id":"42","bell":"42","perioddata":{},"breakdata":{}},{"id":"43","bell":"43","perioddata":{},"breakdata":{}},{"id":"44","bell":"44","perioddata":{},"breakdata":{}},{"id":"45","bell":"45","perioddata":{},"breakdata":{}},{"id":"46","bell":"46","perioddata":{},"breakdata":{}},{"id":"47","bell":"47","perioddata":{},"breakdata":{}},{"id":"48","bell":"48","perioddata":{},"breakdata":{}},{"id":"49","bell":"49","perioddata":{},"breakdata":{}}],"data_columns":["bell","perioddata","breakdata"]},
-                        {"id":"daysdefs","def":{"id":"daysdefs","name":"Дни","item_name":"День","icon":"/static/pics/r_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"typ","type":"enum","name":"typ"},{"id":"vals","type":"stringarray","name":"vals"},{"id":"val","type":"int","name":"val"}],"data_rows":[
-                            {
-                                "id": "*{}".format(i),
-                                "name": daysdef["name"],
-                                "short": daysdef["short"],
-                                "typ": daysdef["typ"],
-                                "vals": daysdef["days"].split(","),
-                                "val": daysdef["val"]
-                            }
-                            for i, daysdef in enumerate(self._daysdefs, 1)
-                        ],"data_columns":["name","short","typ","vals","val"]},
-                        {"id":"weeksdefs","def":{"id":"weeksdefs","name":"Недели","item_name":"Неделя","icon":"/static/pics/g_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"typ","type":"enum","name":"typ"},{"id":"vals","type":"stringarray","name":"vals"},{"id":"val","type":"int","name":"val"}],"data_rows":[{"id":"*1","name":"Неделя A","short":"A","typ":"one","vals":["1"],"val":0},{"id":"*2","name":"Любая неделя","short":"Любой","typ":"any","vals":["1"],"val":None},{"id":"*3","name":"Все недели","short":"Все","typ":"all","vals":["1"],"val":None}],"data_columns":["name","short","typ","vals","val"]},
-                        {"id":"termsdefs","def":{"id":"termsdefs","name":"Семестры","item_name":"Семестр","icon":"/static/pics/b_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"typ","type":"enum","name":"typ"},{"id":"vals","type":"stringarray","name":"vals"},{"id":"val","type":"int","name":"val"}],"data_rows":[{"id":"*1","name":"Весь год","short":"Год","typ":"all","vals":["1"],"val":None}],"data_columns":["name","short","typ","vals","val"]},
-                        {"id":"days","def":{"id":"days","name":"Дни","item_name":"День","icon":"/static/pics/r_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"}],"data_rows":[
-                            {
-                                "id": str(i),
-                                "name": daysdef["name"],
-                                "short": daysdef["short"]
-                            }
-                            for i, daysdef in enumerate(self._daysdefs, 0)
-                        ],"data_columns":["name","short"]},
-                        {"id":"weeks","def":{"id":"weeks","name":"Недели","item_name":"Неделя","icon":"/static/pics/g_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"}],"data_rows":[{"id":"0","name":"Неделя A","short":"A"}],"data_columns":["name","short"]},
-                        {"id":"terms","def":{"id":"terms","name":"Семестры","item_name":"Семестр","icon":"/static/pics/b_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"}],"data_rows":[{"id":"0","name":"Семестр 1","short":"T1"}],"data_columns":["name","short"]},
-                        {"id":"buildings","def":{"id":"buildings","name":"Школьные корпуса","item_name":"Учебный корпус","icon":"/static/pics/classroom_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"color","type":"color","name":"Цвет"}],"data_rows":[],"data_columns":["name","short","color"]},
-                        {"id":"classrooms","def":{"id":"classrooms","name":"Кабинеты","item_name":"Кабинет","icon":"/static/pics/classroom_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"buildingid","type":"tableid","name":"Учебный корпус","table":"buildings"},{"id":"sharedroom","type":"checkbox","name":"Общий кабинет"},{"id":"needssupervision","type":"checkbox","name":"Этому кабинету нужен надсмотр"},{"id":"color","type":"color","name":"Цвет"},{"id":"nearbyclassroomids","type":"tableids","name":"Кабинеты поблизости","table":"classrooms"}],"data_rows":[
-                            classroom.dict()
-                            for classroom in self._classrooms
-                        ],"data_columns":["name","short","buildingid","sharedroom","needssupervision","color","nearbyclassroomids"]},
-                        {"id":"classes","def":{"id":"classes","name":"Классы","item_name":"Класс","icon":"/static/pics/class_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"teacherid","type":"tableid","name":"Классный руководитель","table":"teachers"},{"id":"classroomids","type":"tableids","name":"Основной кабинет","table":"classrooms"},{"id":"bell","type":"tableid","name":"Звонки","table":"bells"},{"id":"color","type":"color","name":"Цвет"},{"id":"timeoff","type":"object","name":"Рабочее время"},{"id":"printsubjectpictures","type":"checkbox","name":"Печатать картинки предметов"},{"id":"classroomid","type":"tableid","name":"Кабинет","table":"classrooms"}],"data_rows":[
-                            class_.dict()
-                            for class_ in self._classes
-                        ],"data_columns":["name","short","teacherid","classroomids","bell","color","timeoff","printsubjectpictures","classroomid"]},
-                        {"id":"subjects","def":{"id":"subjects","name":"Предметы","item_name":"Предмет","icon":"/static/pics/subject_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"color","type":"color","name":"Цвет"},{"id":"picture_url","name":"Картинка"},{"id":"timeoff","type":"object","name":"Рабочее время"},{"id":"contract_weight","type":"float","name":"Продолжительность контракта учителя"}],"data_rows":[
-                            subject.dict()
-                            for subject in self._subjects
-                        ],"data_columns":["name","short","color","picture_url","timeoff","contract_weight"]},
-                        {"id":"teachers","def":{"id":"teachers","name":"Учителя","item_name":"Учитель","icon":"/static/pics/teacher_32.svg"},"cdefs":[{"id":"firstname","type":"string","name":"Имя"},{"id":"lastname","type":"string","name":"Фамилия"},{"id":"nameprefix","type":"string","name":"Обращение"},{"id":"namesuffix","type":"string","name":"суффикс имени"},{"id":"short","type":"string","name":"Сокращение"},{"id":"gender","type":"enum","name":"Пол"},{"id":"bell","type":"tableid","name":"Звонки","table":"bells"},{"id":"color","type":"color","name":"Цвет"},{"id":"fontcolorprint","type":"color","name":"Основной текст"},{"id":"fontcolorprint2","type":"color","name":"Другой текст"},{"id":"fontcolorscreen","type":"color","name":"Текст на экране"},{"id":"timeoff","type":"object","name":"Рабочее время"}],"data_rows":[
-                            teacher.dict()
-                            for teacher in self._teachers
-                        ],"data_columns":["firstname","lastname","nameprefix","namesuffix","short","gender","bell","color","fontcolorprint","fontcolorprint2","fontcolorscreen","timeoff"]},
-                        {"id":"groups","def":{"id":"groups","name":"Группы","item_name":"Группа","icon":"/static/pics/group_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"classid","type":"tableid","name":"Класс","table":"classes"},{"id":"entireclass","type":"checkbox","name":"entireclass"},{"id":"ascttdivision","type":"string","name":"ascttdivision"},{"id":"okgroup","name":"okgroup"},{"id":"students_count","type":"int","name":"students_count"},{"id":"divisionid","type":"tableid","name":"divisionid","table":"divisions"},{"id":"color","type":"color","name":"Цвет"}],"data_rows":[
-                            group.dict()
-                            for group in self._groups
-                        ],"data_columns":["name","classid","entireclass","ascttdivision","okgroup","students_count","divisionid","color"]},
-                        {"id":"divisions","def":{"id":"divisions","name":"divisions","item_name":"divisions","icon":"/timetable/pics/app/office/division_32.svg"},"cdefs":[{"id":"groupids","type":"tableids","name":"Группы","table":"groups"}],"data_rows":list(itertools_chain(*
-                            [
-                                [
-                                    {
-                                        "id": "*{}:".format(i),
-                                        "groupids": [
-                                            groups[0].id
-                                        ]
-                                    },
-                                    {
-                                        "id": "*{}:1".format(i),
-                                        "groupids": [
-                                            group.id
-                                            for group in groups[1:]
-                                        ]
-                                    }
-                                ]
-                                for i, groups in enumerate(self._groups_from_class_id.values(), 1)
-                            ]
-                        )),"data_columns":["groupids"]},
-                        {"id":"students","def":{"id":"students","name":"Учащиеся","item_name":"Учащийся","icon":"/static/pics/student_32.svg"},"cdefs":[{"id":"classid","type":"tableid","name":"Класс","table":"classes"},{"id":"groupids","type":"tableids","name":"Группы","table":"groups"},{"id":"short","type":"string","name":"Сокращение"}],"data_rows":[],"data_columns":["classid","groupids","short"]},
-                        {"id":"lessons","def":{"id":"lessons","name":"Уроки","item_name":"Урок","icon":"/static/pics/lessons_32.svg"},"cdefs":[{"id":"subjectid","type":"tableid","name":"Предмет","table":"subjects"},{"id":"teacherids","type":"tableids","name":"Учителя","table":"teachers"},{"id":"groupids","type":"tableids","name":"Группы","table":"groups"},{"id":"classids","type":"tableids","name":"Класс","table":"classes"},{"id":"count","type":"int","name":"Всего"},{"id":"durationperiods","type":"int","name":"Длина"},{"id":"classroomidss","type":"tableidss","name":"Свободные кабинеты","table":"classrooms"},{"id":"termsdefid","type":"tableid","name":"Семестр","table":"termsdefs"},{"id":"weeksdefid","type":"tableid","name":"Неделя","table":"weeksdefs"},{"id":"daysdefid","type":"tableid","name":"День недели","table":"daysdefs"},{"id":"terms","name":"terms"},{"id":"seminargroup","type":"int","name":"Группа семинара №"},{"id":"bell","type":"tableid","name":"Звонки","table":"bells"},{"id":"studentids","type":"tableids","name":"Учащиеся","table":"students"},{"id":"groupnames","type":"stringarray","name":"Группы"}],"data_rows":[
-                            lesson.dict()
-                            for lesson in self._lessons
-                        ],"data_columns":["subjectid","teacherids","groupids","classids","count","durationperiods","classroomidss","termsdefid","weeksdefid","daysdefid","terms","seminargroup","bell","studentids","groupnames"]},
-                        {"id":"studentsubjects","def":{"id":"studentsubjects","name":"Семинары","item_name":"Семинары","icon":"/timetable/pics/app/office/seminar_32.png"},"cdefs":[{"id":"studentid","type":"tableid","name":"Учащийся","table":"students"},{"id":"subjectid","type":"tableid","name":"Предмет","table":"subjects"},{"id":"seminargroup","type":"int","name":"Группа семинара №"},{"id":"importance","type":"enum","name":"Важность"},{"id":"locked","type":"checkbox","name":"Запертый"}],"data_rows":[],"data_columns":["studentid","subjectid","seminargroup","importance","locked"]},
-                        {"id":"cards","def":{"id":"cards","name":"Карточки","item_name":"Карточка урока","icon":"/timetable/pics/app/card_32.png"},"cdefs":[{"id":"lessonid","type":"tableid","name":"lessonid","table":"lessons"},{"id":"period","type":"tableid","name":"Период","table":"periods"},{"id":"days","type":"string","name":"days"},{"id":"weeks","type":"string","name":"weeks"},{"id":"classroomids","type":"tableids","name":"Кабинеты","table":"classrooms"}],"data_rows":[
-                            card.dict()
-                            for card in self._cards
-                        ],"data_columns":["lessonid","period","days","weeks","classroomids"]},
-                        {"id":"ttreports","def":{"id":"ttreports","name":"Сводки","item_name":"Сводки","icon":"/timetable/pics/app/print_preview_32.png"},"cdefs":[{"id":"typ","type":"int","name":"typ"},{"id":"fitwidth","type":"checkbox","name":"Устан. ширину в одну страницу"},{"id":"fitheight","type":"checkbox","name":"Устан. высоту в одну страницу"},{"id":"hideemptycolumns","type":"checkbox","name":"Скрыть пустые столбцы"},{"id":"hideemptyrows","type":"checkbox","name":"Скрыть пустые строки"},{"id":"headerwidth","type":"float","name":"headerwidth"},{"id":"headerheight","type":"float","name":"headerheight"},{"id":"cellwidth","type":"float","name":"cellwidth"},{"id":"cellheight","type":"float","name":"cellheight"},{"id":"page_tables","type":"enumarray","name":"Печатать одну страницу для"},{"id":"row_tables","type":"enumarray","name":"Строки"},{"id":"column_tables","type":"enumarray","name":"Столбцы"},{"id":"celltype","type":"intcombo","name":"Ячейки"},{"id":"cardcolorenabled","type":"checkbox","name":"Цветная печать"},{"id":"cardcolortable1","type":"enum","name":"cardcolortable1"},{"id":"cardcolortable2","type":"enum","name":"cardcolortable2"},{"id":"cardcolorpos","name":"cardcolorpos"},{"id":"cardstyles","type":"subarray","name":"Карточки - Стиль","subcolumns":[{"id":"m_nDlzka","type":"int","name":"m_nDlzka"},{"id":"m_nPocetRiadkov","type":"int","name":"m_nPocetRiadkov"},{"id":"m_nBezTriedyAleboUcitela","type":"int","name":"m_nBezTriedyAleboUcitela"},{"id":"texts","type":"subdata","name":"texts","subcolumns":[{"id":"enabled","type":"checkbox","name":"enabled"},{"id":"pos","type":"int","name":"pos"},{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"autohide","type":"checkbox","name":"autohide"},{"id":"name_col","type":"string","name":"name_col"}]}]},{"id":"classroomsupervisionstyle","type":"subobject","name":"classroomsupervisionstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"}]},{"id":"gridheadertexts","type":"subdata","name":"Название - Стиль","subcolumns":[{"id":"enabled","type":"boolean_or_None","name":"enabled"},{"id":"pos","type":"int","name":"pos"},{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"column","type":"string","name":"column"}]},{"id":"pageheader","type":"subobject","name":"Название","subcolumns":[{"id":"font","type":"string","name":"Шрифт"},{"id":"size","type":"float","name":"Размер"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"}]},{"id":"pageheaderprefixenabled","type":"checkbox","name":"Печатать префикс"},{"id":"userheader","type":"subobject","name":"userheader","subcolumns":[{"id":"text","type":"string","name":"text"},{"id":"font","type":"string","name":"Шрифт"},{"id":"size","type":"float","name":"Размер"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"}]},{"id":"settings","name":"settings"},{"id":"landscape","type":"checkbox","name":"landscape"},{"id":"repeatpage","type":"int","name":"repeatpage"},{"id":"splitpage_h","type":"int","name":"splitpage_h"},{"id":"splitpage_w","type":"int","name":"splitpage_w"},{"id":"withclassroomtt","type":"checkbox","name":"withclassroomtt"},{"id":"printlogo","type":"checkbox","name":"printlogo"},{"id":"name","type":"string","name":"Название"},{"id":"extracolumns","type":"subarray","name":"Дополнительные столбцы","subcolumns":[{"id":"typ","type":"combo","name":"typ"},{"id":"name","type":"string","name":"Название"},{"id":"size","type":"int","name":"Размер"},{"id":"headerstyle","type":"subobject","name":"headerstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"vertical","type":"checkbox","name":"vertical"}]},{"id":"cellstyle","type":"subobject","name":"cellstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"vertical","type":"checkbox","name":"vertical"}]}]},{"id":"extrarows","type":"subarray","name":"Дополнительные строки","subcolumns":[{"id":"typ","type":"combo","name":"typ"},{"id":"name","type":"string","name":"Название"},{"id":"size","type":"int","name":"Размер"},{"id":"headerstyle","type":"subobject","name":"headerstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"vertical","type":"checkbox","name":"vertical"}]},{"id":"cellstyle","type":"subobject","name":"cellstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"vertical","type":"checkbox","name":"vertical"}]}]}],"data_rows":[{"id":"*25","typ":0,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["classes"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивидуальные расписания классов","extracolumns":[],"extrarows":[]},{"id":"*26","typ":1,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["teachers"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивидуальные расписания учителей","extracolumns":[],"extrarows":[]},{"id":"*27","typ":2,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["students"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивидуальные расписания учащихся","extracolumns":[],"extrarows":[]},{"id":"*28","typ":3,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["classrooms"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивидуальные расписания кабинетов","extracolumns":[],"extrarows":[]},{"id":"*29","typ":4,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["subjects"],"row_tables":["days"],"column_tables":["periods"],"celltype":1,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"left","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":8,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":True,"pos":2,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Отдельные расписания для предметов","extracolumns":[],"extrarows":[]},{"id":"*30","typ":5,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classes"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.15,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание классов","extracolumns":[],"extrarows":[]},{"id":"*31","typ":6,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["teachers"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.15,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание учителей","extracolumns":[],"extrarows":[]},{"id":"*32","typ":7,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classrooms"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание кабинетов","extracolumns":[],"extrarows":[]},{"id":"*33","typ":8,"fitwidth":False,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classes"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Расписание классов (настенный плакат)","extracolumns":[],"extrarows":[]},{"id":"*34","typ":9,"fitwidth":False,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["teachers"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Расписание учителей (настенный плакат)","extracolumns":[],"extrarows":[]},{"id":"*35","typ":10,"fitwidth":False,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classrooms"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Расписание кабинетов (настенный плакат)","extracolumns":[],"extrarows":[]},{"id":"*36","typ":15,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classes"],"column_tables":["subjects"],"celltype":2,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"left","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":True,"pos":8,"size":0.5,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Сетка уроков","extracolumns":[],"extrarows":[]},{"id":"*37","typ":17,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["students"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание учащихся","extracolumns":[],"extrarows":[]},{"id":"*38","typ":18,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["subjects"],"column_tables":["days","periods"],"celltype":1,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"left","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":True,"pos":2,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание предметов","extracolumns":[],"extrarows":[]},{"id":"*39","typ":19,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["classes"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Создан пользователем 1","extracolumns":[],"extrarows":[]},{"id":"*40","typ":20,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["teachers"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Создан пользователем 2","extracolumns":[],"extrarows":[]},{"id":"*41","typ":21,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["teachers"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Создан пользователем 3","extracolumns":[],"extrarows":[]},{"id":"*42","typ":22,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.05,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["classes"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.15,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":4,"size":0.08,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.08,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":7,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивид. расписания классов - с таблицей","extracolumns":[],"extrarows":[]},{"id":"*43","typ":23,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.05,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["teachers"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":7,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивид. расписания учителей - с таблицей","extracolumns":[],"extrarows":[]},{"id":"*44","typ":24,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["teachers"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":7,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Расписание каждого учителя - дополнительно","extracolumns":[],"extrarows":[]},{"id":"*45","typ":25,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["teachers"],"column_tables":["subjects"],"celltype":3,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"left","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Печать нагрузки учителей","extracolumns":[],"extrarows":[]},{"id":"*46","typ":26,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["days","classes"],"row_tables":[],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":False,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Daily attendance","extracolumns":[],"extrarows":[]},{"id":"*47","typ":27,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.25,"headerheight":0.07,"cellwidth":0.1,"cellheight":0.04,"page_tables":[],"row_tables":["teachers"],"column_tables":[],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":False,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Список учителей","extracolumns":[],"extrarows":[]},{"id":"*48","typ":28,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.25,"headerheight":0.07,"cellwidth":0.1,"cellheight":0.04,"page_tables":[],"row_tables":["classes"],"column_tables":[],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":7,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":False,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Список классов","extracolumns":[],"extrarows":[]}],"data_columns":["typ","fitwidth","fitheight","hideemptycolumns","hideemptyrows","headerwidth","headerheight","cellwidth","cellheight","page_tables","row_tables","column_tables","celltype","cardcolorenabled","cardcolortable1","cardcolortable2","cardcolorpos","cardstyles","classroomsupervisionstyle","gridheadertexts","pageheader","pageheaderprefixenabled","userheader","settings","landscape","repeatpage","splitpage_h","splitpage_w","withclassroomtt","printlogo","name","extracolumns","extrarows"]},
-                        {"id":"classroomsupervisions","def":{"id":"classroomsupervisions","name":"Надсмотры","item_name":"Надсмотр","icon":"/timetable/pics/app/views/supervisions.png"},"cdefs":[{"id":"classroomid","type":"tableid","name":"Кабинет","table":"classrooms"},{"id":"teacherid","type":"tableid","name":"Учитель","table":"teachers"},{"id":"day","name":"day"},{"id":"week","name":"week"},{"id":"term","name":"term"},{"id":"period","type":"tableid","name":"Период","table":"periods"},{"id":"break","type":"tableid","name":"перемена","table":"breaks"},{"id":"locked","type":"checkbox","name":"Запертый"},{"id":"weeks","name":"weeks"}],"data_rows":[],"data_columns":["classroomid","teacherid","day","week","term","period","break","locked","weeks"]},
-                        {"id":"coursegroups","def":{"id":"coursegroups","name":"Группы семинаров","item_name":"Группа семинара","icon":"/timetable/pics/app/office/sectiongroups_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"}],"data_rows":[],"data_columns":["name"]}
-                    ]
-                }
-            }
-        }
-
-        json_filepath.write_text(
-            data = json_dumps(
-                obj = timetable_dict,
-                ensure_ascii = False,
-                indent = json_indent
-            ),
-            encoding = self.encoding
-        )
+from pathlib import Path
+from types import ModuleType
+from hashlib import blake2b
+from importlib import import_module
+from collections import deque
+from functools import lru_cache
+from sys import intern
+from io import BytesIO
+from contextlib import nullcontext
+from zipfile import is_zipfile
+
+from .ooxml import OOXMLSheetReader, get_column_letters, get_sheet_index
+from .index import TimetableIndex
+from .columnar import InternTable, ColumnarTable, ColumnarMapping
+from .metrics import ParseMetrics
+from . import light_models
+from .encoders import JSONEncoder, JSON_ENCODER_AUTO, get_json_encoder
+from .skeleton import T_SKELETON_CHUNKS, get_skeleton_chunks, iter_data_rows_json
+from .utils import T_COLUMN_SLOT, get_column_slots, build_groups, generate_hex_color, parse_classroom_names
+
+from typing import List, Dict, Tuple, Set, Deque, Iterable, Iterator, ContextManager, Callable, TypeVar, Any, Union, Optional, BinaryIO, TYPE_CHECKING, cast
+
+# openpyxl and pydantic are imported only when used, so importing the package stays fast
+if TYPE_CHECKING:
+    from openpyxl.workbook.workbook import Workbook
+    from openpyxl.worksheet.worksheet import Worksheet
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+
+    from .cache import ParseCache
+    from .models import Class, Subject, Classroom, Teacher, Group, Lesson, Card
+
+
+ACCEPTABLE_TIMETABLE_NUMBERS: List[str] = [
+    "1",
+    "2"
+]
+
+ENGINE_OPENPYXL: str = "openpyxl"
+ENGINE_OOXML: str = "ooxml"
+
+ACCEPTABLE_ENGINES: List[str] = [
+    ENGINE_OPENPYXL,
+    ENGINE_OOXML
+]
+
+MODELS_PYDANTIC: str = "pydantic"
+MODELS_LIGHT: str = "light"
+
+# Imported on first use
+MODELS_MODULES: Dict[str, str] = {
+    MODELS_PYDANTIC: "models",
+    MODELS_LIGHT: "light_models"
+}
+
+COLORS_HASH: str = "hash"
+COLORS_RANDOM: str = "random"
+
+ACCEPTABLE_COLORS: List[str] = [
+    COLORS_HASH,
+    COLORS_RANDOM
+]
+
+STORE_OBJECTS: str = "objects"
+STORE_COLUMNAR: str = "columnar"
+
+ACCEPTABLE_STORES: List[str] = [
+    STORE_OBJECTS,
+    STORE_COLUMNAR
+]
+
+PARSE_STATE_ATTRIBUTES: Tuple[str, ...] = (
+    "_classes",
+    "_classes_from_id",
+    "_classes_from_name",
+    "_groups_from_class_id",
+    "_groups",
+    "_subjects",
+    "_subjects_from_id",
+    "_subjects_from_name",
+    "_classrooms",
+    "_classrooms_from_id",
+    "_classrooms_from_name",
+    "_teachers",
+    "_teachers_from_id",
+    "_teachers_from_name",
+    "_lessons",
+    "_lessons_from_id",
+    "_cards",
+    "_sheet_blocks",
+    "_last_entity_ids"
+)
+
+# Registries kept by incremental parses, their IDs are counted in `_last_entity_ids`
+ENTITY_REGISTRIES: Tuple[str, ...] = (
+    "subjects",
+    "classrooms",
+    "teachers"
+)
+
+# Distinct classroom cell values kept resolved during a parse
+CLASSROOM_IDS_CACHE_SIZE: int = 4096
+
+SHEET_FIRST_ROW: int = 5
+SHEET_BLOCK_ROWS: int = 4
+
+
+T = TypeVar("T")
+
+T_XLSX_INPUT = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+
+T_SHEET_ROW = Tuple[Any, ...]
+T_SHEET_BLOCK = Tuple[T_SHEET_ROW, T_SHEET_ROW, T_SHEET_ROW, T_SHEET_ROW]
+# Fingerprint, lessons and cards of a parsed class block,
+# and IDs of teachers and classrooms of its cells without a subject
+T_PARSED_SHEET_BLOCK = Tuple[bytes, List["Lesson"], List["Card"], List[str], List[str]]
+
+
+def get_sheet_block_fingerprint(block_class_names: List[str], sheet_block: T_SHEET_BLOCK) -> bytes:
+    return blake2b(
+        repr((block_class_names, sheet_block)).encode("utf-8"),
+        digest_size = 16
+    ).digest()
+
+
+class XLSXParser:
+    def __init__(self, xlsx_filepath: T_XLSX_INPUT, timetable_number: Union[int, str], read_only: bool=False, engine: str=ENGINE_OPENPYXL, models: str=MODELS_PYDANTIC, cache: Optional["ParseCache"]=None, colors: str=COLORS_HASH, store: str=STORE_OBJECTS, metrics: Optional[ParseMetrics]=None, sheet: Union[int, str]=0) -> None:
+        # In-memory workbook: uploaded bytes or a binary file object, read once
+        xlsx_data: Optional[bytes] = None
+
+        if isinstance(xlsx_filepath, (bytes, bytearray, memoryview)):
+            xlsx_data = bytes(xlsx_filepath)
+
+        elif hasattr(xlsx_filepath, "read"):
+            xlsx_data = xlsx_filepath.read()
+
+        elif not isinstance(xlsx_filepath, Path):
+            xlsx_filepath = Path(xlsx_filepath)
+
+        if not isinstance(timetable_number, str):
+            timetable_number = str(timetable_number)
+
+        self.xlsx_filepath: Optional[Path] = (
+            xlsx_filepath
+            if xlsx_data is None
+            else
+            None
+        )
+
+        self.xlsx_data: Optional[bytes] = xlsx_data
+        self.timetable_number: str = timetable_number
+        self.read_only: bool = read_only
+        self.engine: str = engine
+        self.models: str = models
+        self.colors: str = colors
+        self.store: str = store
+        self.sheet: Union[int, str] = sheet
+
+        if xlsx_data is not None:
+            if not is_zipfile(BytesIO(xlsx_data)):
+                raise ValueError(
+                    "Input .XLSX data of {size} bytes must be a .XLSX file!".format(
+                        size = len(xlsx_data)
+                    )
+                )
+
+        elif not self.xlsx_filepath.exists() or not self.xlsx_filepath.is_file():
+            raise ValueError(
+                "Input .XLSX {xlsx_filepath!r} must exists and be a file!".format(
+                    xlsx_filepath = xlsx_filepath.resolve()
+                )
+            )
+
+        if timetable_number not in ACCEPTABLE_TIMETABLE_NUMBERS:
+            raise ValueError(
+                "Timetable number {timetable_number!r} must be {correct_values}!".format(
+                    timetable_number = timetable_number,
+                    correct_values = " or ".join(ACCEPTABLE_TIMETABLE_NUMBERS)
+                )
+            )
+
+        if engine not in ACCEPTABLE_ENGINES:
+            raise ValueError(
+                "Engine {engine!r} must be {correct_values}!".format(
+                    engine = engine,
+                    correct_values = " or ".join(ACCEPTABLE_ENGINES)
+                )
+            )
+
+        if models not in MODELS_MODULES:
+            raise ValueError(
+                "Models {models!r} must be {correct_values}!".format(
+                    models = models,
+                    correct_values = " or ".join(MODELS_MODULES)
+                )
+            )
+
+        if colors not in ACCEPTABLE_COLORS:
+            raise ValueError(
+                "Colors {colors!r} must be {correct_values}!".format(
+                    colors = colors,
+                    correct_values = " or ".join(ACCEPTABLE_COLORS)
+                )
+            )
+
+        if store not in ACCEPTABLE_STORES:
+            raise ValueError(
+                "Store {store!r} must be {correct_values}!".format(
+                    store = store,
+                    correct_values = " or ".join(ACCEPTABLE_STORES)
+                )
+            )
+
+        if not isinstance(sheet, (int, str)) or isinstance(sheet, bool):
+            raise ValueError(
+                "Sheet {sheet!r} must be an index or a name!".format(
+                    sheet = sheet
+                )
+            )
+
+        # Pydantic models validate every field, light models just store them
+        self._models: ModuleType = import_module(
+            name = "." + MODELS_MODULES[models],
+            package = __package__
+        )
+
+        # Loaded by parsing, cached and saved timetables don't need them
+        self._column_slots: Optional[List[Optional[T_COLUMN_SLOT]]] = None
+
+        # Memoised `_get_classroom_ids` of the last parse
+        self._resolve_classroom_ids: Optional[Callable[[Union[str, int]], Tuple[str, ...]]] = None
+
+        self.cache: Optional[ParseCache] = cache
+        self.metrics: Optional[ParseMetrics] = metrics
+
+        # Workbook, or for "ooxml" engine a reader of its first opened sheet
+        self._excel: Optional[Union[Workbook, OOXMLSheetReader]] = None
+        self._excel_owned: bool = True
+        self._sheet: Optional[Union[Worksheet, ReadOnlyWorksheet, OOXMLSheetReader]] = None
+
+        self._index: Optional[TimetableIndex] = None
+
+        # Indexes of class blocks parsed by the last parse, empty after a cache hit
+        self.changed_sheet_blocks: List[int] = []
+
+        self.encoding: str = "utf-8"
+
+    @classmethod
+    def from_bytes(cls, xlsx_data: Union[bytes, bytearray, memoryview], timetable_number: Union[int, str], **kwargs: Any) -> "XLSXParser":
+        return cls(
+            xlsx_filepath = xlsx_data,
+            timetable_number = timetable_number,
+            **kwargs
+        )
+
+    @classmethod
+    def from_stream(cls, xlsx_file: BinaryIO, timetable_number: Union[int, str], **kwargs: Any) -> "XLSXParser":
+        return cls(
+            xlsx_filepath = xlsx_file,
+            timetable_number = timetable_number,
+            **kwargs
+        )
+
+    def _get_xlsx_file(self) -> Union[Path, BytesIO]:
+        if self.xlsx_data is None:
+            return self.xlsx_filepath
+
+        return BytesIO(self.xlsx_data)
+
+    def read_xlsx_data(self) -> bytes:
+        if self.xlsx_data is None:
+            return self.xlsx_filepath.read_bytes()
+
+        return self.xlsx_data
+
+    def _measure(self, phase: str) -> ContextManager[None]:
+        if self.metrics is None:
+            return nullcontext()
+
+        return self.metrics.measure(phase)
+
+    def _iter_measured(self, phase: str, iterable: Iterable[T]) -> Iterable[T]:
+        if self.metrics is None:
+            return iterable
+
+        return self.metrics.iter_measured(phase, iterable)
+
+    def _update_metrics_counts(self) -> None:
+        self.metrics.counts.update(
+            classes = len(self._classes),
+            groups = len(self._groups),
+            subjects = len(self._subjects),
+            classrooms = len(self._classrooms),
+            teachers = len(self._teachers),
+            lessons = len(self._lessons),
+            cards = len(self._cards),
+            changed_sheet_blocks = len(self.changed_sheet_blocks)
+        )
+
+        if self._resolve_classroom_ids is not None:
+            classroom_ids_cache_info = self._resolve_classroom_ids.cache_info()
+
+            self.metrics.counts.update(
+                classroom_cache_hits = classroom_ids_cache_info.hits,
+                classroom_cache_misses = classroom_ids_cache_info.misses
+            )
+
+    def _load_datas(self) -> None:
+        # Shared by parsers of the same timetable number and sheet width
+        self._column_slots = get_column_slots(
+            timetable_number = self.timetable_number,
+            max_column = self._sheet_max_column
+        )
+
+    def use_workbook(self, excel: Union["Workbook", OOXMLSheetReader]) -> None:
+        """
+        Parses `sheet` of an already opened workbook (openpyxl's for "openpyxl" engine,
+        `OOXMLSheetReader` for "ooxml"), so several parsers open the file once.
+        `close()` leaves it open
+        """
+
+        self.close()
+
+        self._excel = excel
+        self._excel_owned = False
+
+    def _open_sheet(self) -> None:
+        if self._sheet is not None:
+            return
+
+        if self._excel is None:
+            if self.engine == ENGINE_OOXML:
+                self._excel = OOXMLSheetReader(
+                    xlsx_file = self._get_xlsx_file(),
+                    sheet_index = (
+                        self.sheet
+                        if isinstance(self.sheet, int)
+                        else
+                        0
+                    ),
+                    sheet_name = (
+                        self.sheet
+                        if isinstance(self.sheet, str)
+                        else
+                        None
+                    )
+                )
+
+            else:
+                from openpyxl import load_workbook
+
+                self._excel = load_workbook(
+                    filename = self._get_xlsx_file(),
+                    read_only = self.read_only
+                )
+
+            self._excel_owned = True
+
+        sheet_index: int = get_sheet_index(
+            sheetnames = self._excel.sheetnames,
+            sheet = self.sheet
+        )
+
+        if self.engine == ENGINE_OOXML:
+            self._sheet = self._excel.get_sheet(sheet_index)
+
+        else:
+            self._sheet = self._excel[self._excel.sheetnames[sheet_index]]
+
+            if self.read_only and (self._sheet.max_row is None or self._sheet.max_column is None):
+                # Sheet has no <dimension> record, so it must be measured once
+                self._sheet.calculate_dimension(
+                    force = True
+                )
+
+        self._sheet_max_row: int = self._sheet.max_row
+        self._sheet_max_column: int = self._sheet.max_column
+        self._sheet_max_column_letters: str = get_column_letters(self._sheet_max_column)
+
+    def close(self) -> None:
+        if self._excel is None:
+            return
+
+        # Sheets of "ooxml" engine share their workbook reader's archive
+        if self._excel_owned:
+            self._excel.close()
+
+        self._excel = None
+        self._excel_owned = True
+        self._sheet = None
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Parsed registries, enough to `save()` without parsing again
+        """
+
+        return {
+            attribute_name: getattr(self, attribute_name)
+            for attribute_name in PARSE_STATE_ATTRIBUTES
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        for attribute_name in PARSE_STATE_ATTRIBUTES:
+            setattr(self, attribute_name, state[attribute_name])
+
+        self._index = None
+        self.changed_sheet_blocks = []
+
+    @property
+    def index(self) -> TimetableIndex:
+        """
+        Query indexes over parsed cards, built lazily and dropped by the next `parse()`
+        """
+
+        if self._index is None:
+            self._index = TimetableIndex(
+                lessons = self._lessons,
+                cards = self._cards
+            )
+
+        return self._index
+
+    def _iter_sheet_rows(self) -> Iterator[T_SHEET_ROW]:
+        return self._sheet.iter_rows(
+            min_row = SHEET_FIRST_ROW,
+            max_row = self._sheet_max_row,
+            max_col = self._sheet_max_column,
+            values_only = True
+        )
+
+    def _iter_sheet_blocks(self) -> Iterator[Tuple[List[str], T_SHEET_BLOCK]]:
+        block_class_names: List[str] = []
+        block_rows: List[T_SHEET_ROW] = []
+
+        empty_row: T_SHEET_ROW = (None, ) * (self._sheet_max_column - 1)
+
+        for row in self._iter_sheet_rows():
+            if row and row[0]:
+                block_class_names.append(row[0].strip())
+
+            block_rows.append(row[1:] or empty_row)
+
+            if len(block_rows) == SHEET_BLOCK_ROWS:
+                yield block_class_names, tuple(block_rows)
+
+                block_class_names = []
+                block_rows = []
+
+        if block_rows:
+            block_rows.extend([empty_row] * (SHEET_BLOCK_ROWS - len(block_rows)))
+
+            yield block_class_names, tuple(block_rows)
+
+    def _get_color(self, kind: str, name: str) -> str:
+        if self.colors == COLORS_RANDOM:
+            return generate_hex_color()
+
+        return generate_hex_color(
+            seed = kind + "\0" + name
+        )
+
+    def _add_class(self, class_name: str) -> None:
+        id: str = "*{}".format(len(self._classes) + 1)
+
+        class_: Class = self._models.Class(
+            id = id,
+            name = class_name,
+            short = class_name,
+            color = self._get_color(
+                kind = "class",
+                name = class_name
+            )
+        )
+
+        self._classes.append(class_)
+        self._classes_from_id[id] = class_
+        self._classes_from_name[class_name] = class_
+
+        groups: List[Group] = []
+
+        for group_ in build_groups(
+            classids = [id]
+        ):
+            group: Group = self._models.Group(
+                id = "*{}".format(len(self._groups) + 1),
+                name = group_["name"],
+                classid = group_["classid"],
+                entireclass = group_["entireclass"],
+                ascttdivision = (
+                    ""
+                    if group_["divisiontag"] == "0"
+                    else
+                    group_["divisiontag"]
+                ),
+                divisionid = "",
+                color = self._get_color(
+                    kind = "group",
+                    name = class_name + "\0" + group_["name"]
+                )
+            )
+
+            self._groups.append(group)
+            groups.append(group)
+
+        self._groups_from_class_id[id] = groups
+
+    def _get_classroom_ids(self, classroom_names_str: Union[str, int]) -> Tuple[str, ...]:
+        classroomids: List[str] = []
+
+        for classroom_name in parse_classroom_names(
+            classroom_names_str = classroom_names_str
+        ):
+            # Names are dictionary keys and model fields of many lessons
+            classroom_name = intern(classroom_name)
+
+            classroom: Optional[Classroom] = self._classrooms_from_name.get(classroom_name)
+
+            if classroom is None:
+                id: str = self._get_new_entity_id("classrooms")
+
+                classroom = self._models.Classroom(
+                    id = id,
+                    name = classroom_name,
+                    short = classroom_name,
+                    color = self._get_color(
+                        kind = "classroom",
+                        name = classroom_name
+                    )
+                )
+
+                self._classrooms.append(classroom)
+                self._classrooms_from_id[id] = classroom
+                self._classrooms_from_name[classroom_name] = classroom
+
+            classroomids.append(classroom.id)
+
+        return tuple(classroomids)
+
+    def _get_new_entity_id(self, registry_name: str) -> str:
+        # Counted, not taken from the registry's length, as incremental parses drop entities
+        self._last_entity_ids[registry_name] += 1
+
+        return "*{}".format(self._last_entity_ids[registry_name])
+
+    def _parse_sheet_block(self, sheet_block: T_SHEET_BLOCK) -> Tuple[List[str], List[str]]:
+        """
+        Returns IDs of teachers and classrooms of cells without a subject, they have no lessons
+        """
+
+        id: str
+
+        orphan_teacherids: List[str] = []
+        orphan_classroomids: List[str] = []
+
+        column_slots: List[Optional[T_COLUMN_SLOT]] = self._column_slots
+
+        # Block rows start from column "B", so the first value is column 2
+        for column, (subject_name, classes_names, classroom_names_str, teachers_names) in enumerate(zip(*sheet_block), 2):
+            subject: Optional[Subject] = None
+
+            if subject_name:
+                subject_name = subject_name.strip()
+
+                subject = self._subjects_from_name.get(subject_name)
+
+                if subject is None:
+                    id = self._get_new_entity_id("subjects")
+
+                    subject = self._models.Subject(
+                        id = id,
+                        name = subject_name,
+                        short = subject_name,
+                        color = self._get_color(
+                            kind = "subject",
+                            name = subject_name
+                        )
+                    )
+
+                    self._subjects.append(subject)
+                    self._subjects_from_id[id] = subject
+                    self._subjects_from_name[subject_name] = subject
+
+            classroomids: List[str] = (
+                list(self._resolve_classroom_ids(classroom_names_str))
+                if classroom_names_str
+                else
+                []
+            )
+
+            teacher_ids: List[str] = []
+
+            if teachers_names:
+                for teacher_name in teachers_names.split(","):
+                    teacher_name = teacher_name.strip()
+
+                    teacher: Optional[Teacher] = self._teachers_from_name.get(teacher_name)
+
+                    if teacher is None:
+                        id = self._get_new_entity_id("teachers")
+
+                        teacher = self._models.Teacher(
+                            id = id,
+                            firstname = "",
+                            lastname = teacher_name,
+                            short = teacher_name,
+                            color = self._get_color(
+                                kind = "teacher",
+                                name = teacher_name
+                            )
+                            # TODO: use `gender`
+                        )
+
+                        self._teachers.append(teacher)
+                        self._teachers_from_id[id] = teacher
+                        self._teachers_from_name[teacher_name] = teacher
+
+                    teacher_ids.append(teacher.id)
+
+            else:
+                teacher_ids.append("")
+
+            if subject is None:
+                orphan_teacherids.extend(teacher_ids)
+                orphan_classroomids.extend(classroomids)
+
+                continue
+
+            column_slot: Optional[T_COLUMN_SLOT] = column_slots[column]
+
+            if column_slot is None:
+                raise ValueError(
+                    "Lesson's column {column_letters!r} must be one of the timetable's days and periods!".format(
+                        column_letters = get_column_letters(column)
+                    )
+                )
+
+            period, daysdefid, days = column_slot
+
+            id = "*{}".format(len(self._lessons) + 1)
+
+            classid: str = self._classes_from_name[classes_names.split(",")[0].strip()].id
+
+            lesson: Lesson = self._models.Lesson(
+                id = id,
+                subjectid = subject.id,
+                teacherids = teacher_ids,
+                groupids = [
+                    group.id
+                    for group in (
+                        self._groups_from_class_id[classid][1:]
+                        if len(teacher_ids) > 1
+                        else
+                        self._groups_from_class_id[classid][:1]
+                    )
+                ],
+                classids = [classid],
+                classroomidss = [classroomids],
+                termsdefid = "*1",
+                weeksdefid = "*1",
+                daysdefid = daysdefid
+            )
+
+            self._lessons.append(lesson)
+            self._lessons_from_id[id] = lesson
+
+            card: Card = self._models.Card(
+                id = id,
+                lessonid = lesson.id,
+                period = period,
+                days = days,
+                weeks = "1",
+                classroomids = lesson.classroomidss[0]
+            )
+
+            self._cards.append(card)
+
+        return orphan_teacherids, orphan_classroomids
+
+    def parse(self, incremental: bool=False) -> None:
+        """
+        With `incremental`, the previous parse is kept: class blocks with an unchanged fingerprint
+        reuse their lessons and cards, and known subjects, classrooms and teachers keep their IDs.
+        Such a parse depends on the previous one, so it doesn't use the cache
+        """
+
+        cache_key: Optional[str] = None
+        state: Optional[Dict[str, Any]] = None
+
+        if self.cache is not None and not (incremental and hasattr(self, "_sheet_blocks")):
+            with self._measure("cache_load"):
+                cache_key = self.cache.get_key(
+                    xlsx_data = self.read_xlsx_data(),
+                    timetable_number = self.timetable_number,
+                    parser_options = (
+                        self.models,
+                        self.colors,
+                        self.store,
+                        str(self.sheet)
+                    )
+                )
+
+                state = self.cache.load(
+                    key = cache_key
+                )
+
+        if state is not None:
+            self.set_state(
+                state = state
+            )
+
+        else:
+            self._parse_sheet(
+                incremental = incremental
+            )
+
+            if cache_key is not None:
+                with self._measure("cache_store"):
+                    self.cache.store(
+                        key = cache_key,
+                        value = self.get_state()
+                    )
+
+        if self.metrics is not None:
+            self._update_metrics_counts()
+            self.metrics.notify()
+
+    def _reuse_sheet_block(self, lessons: List["Lesson"], cards: List["Card"]) -> None:
+        # Previous records are copied, not renumbered, as they may still belong to another parser's state
+        for previous_lesson, previous_card in zip(lessons, cards):
+            id: str = "*{}".format(len(self._lessons) + 1)
+
+            lesson: Lesson = previous_lesson.copy(
+                update = {
+                    "id": id
+                }
+            )
+
+            card: Card = previous_card.copy(
+                update = {
+                    "id": id,
+                    "lessonid": id
+                }
+            )
+
+            self._lessons.append(lesson)
+            self._lessons_from_id[id] = lesson
+
+            self._cards.append(card)
+
+    def _parse_sheet(self, incremental: bool=False) -> None:
+        previous_sheet_blocks: Optional[List[T_PARSED_SHEET_BLOCK]] = (
+            getattr(self, "_sheet_blocks", None)
+            if incremental
+            else
+            None
+        )
+
+        previous_class_names: List[str] = []
+
+        if previous_sheet_blocks is not None:
+            previous_class_names = [
+                class_.name
+                for class_ in self._classes
+            ]
+
+            # Opened again, so the changed file is read
+            self.close()
+
+        with self._measure("load"):
+            self._open_sheet()
+            self._load_datas()
+
+        self._classes: List[Class] = []
+        self._classes_from_id: Dict[str, Class] = {}
+        self._classes_from_name: Dict[str, Class] = {}
+
+        self._groups_from_class_id: Dict[str, List[Group]] = {}
+        self._groups: List[Group] = []
+
+        if previous_sheet_blocks is None:
+            self._subjects: List[Subject] = []
+            self._subjects_from_id: Dict[str, Subject] = {}
+            self._subjects_from_name: Dict[str, Subject] = {}
+
+            self._classrooms: List[Classroom] = []
+            self._classrooms_from_id: Dict[str, Classroom] = {}
+            self._classrooms_from_name: Dict[str, Classroom] = {}
+
+            self._teachers: List[Teacher] = []
+            self._teachers_from_id: Dict[str, Teacher] = {}
+            self._teachers_from_name: Dict[str, Teacher] = {}
+
+            self._last_entity_ids: Dict[str, int] = dict.fromkeys(ENTITY_REGISTRIES, 0)
+
+        self._lessons: List[Lesson] = []
+        self._lessons_from_id: Dict[str, Lesson] = {}
+
+        self._cards: List[Card] = []
+
+        self._index = None
+
+        # Same classroom cells repeat all over a timetable, each distinct value is parsed once.
+        # Typed, as 101 and 101.0 are equal keys giving different names
+        self._resolve_classroom_ids = lru_cache(
+            maxsize = CLASSROOM_IDS_CACHE_SIZE,
+            typed = True
+        )(self._get_classroom_ids)
+
+        self._sheet_blocks: List[T_PARSED_SHEET_BLOCK] = []
+        self.changed_sheet_blocks = []
+
+        # The n-th block belongs to the n-th class, so a block waits here until its class is found
+        pending_sheet_blocks: Deque[Tuple[bytes, T_SHEET_BLOCK]] = deque()
+
+        for block_class_names, sheet_block in self._iter_measured("read_sheet", self._iter_sheet_blocks()):
+            with self._measure("classes"):
+                for class_name in block_class_names:
+                    self._add_class(
+                        class_name = class_name
+                    )
+
+            pending_sheet_blocks.append((
+                get_sheet_block_fingerprint(
+                    block_class_names = block_class_names,
+                    sheet_block = sheet_block
+                ),
+                sheet_block
+            ))
+
+            while pending_sheet_blocks and len(self._sheet_blocks) < len(self._classes):
+                fingerprint, sheet_block = pending_sheet_blocks.popleft()
+
+                sheet_block_index: int = len(self._sheet_blocks)
+                lessons_start: int = len(self._lessons)
+
+                with self._measure("sheet_blocks"):
+                    if previous_sheet_blocks is not None and sheet_block_index < len(previous_sheet_blocks) and previous_sheet_blocks[sheet_block_index][0] == fingerprint:
+                        _, previous_lessons, previous_cards, orphan_teacherids, orphan_classroomids = previous_sheet_blocks[sheet_block_index]
+
+                        self._reuse_sheet_block(
+                            lessons = previous_lessons,
+                            cards = previous_cards
+                        )
+
+                    else:
+                        orphan_teacherids, orphan_classroomids = self._parse_sheet_block(
+                            sheet_block = sheet_block
+                        )
+
+                        self.changed_sheet_blocks.append(sheet_block_index)
+
+                self._sheet_blocks.append((
+                    fingerprint,
+                    self._lessons[lessons_start:],
+                    self._cards[lessons_start:],
+                    orphan_teacherids,
+                    orphan_classroomids
+                ))
+
+        if previous_sheet_blocks is not None and previous_class_names != list(self._classes_from_name):
+            # Reused lessons refer to classes by IDs, which are valid only for the same classes
+            self._parse_sheet()
+            return
+
+        if previous_sheet_blocks is not None:
+            self._drop_unused_entities()
+
+        # Kept as before: every group refers to the division after the last class
+        for group in self._groups:
+            group.divisionid = "*{0}:{1}".format(
+                len(self._classes) + 1,
+                (
+                    ""
+                    if group.entireclass
+                    else
+                    "1"
+                )
+            )
+
+        if self.store == STORE_COLUMNAR:
+            with self._measure("compact"):
+                self._compact()
+
+    def _drop_unused_entities(self) -> None:
+        """
+        Drops subjects, classrooms and teachers kept from the previous parse which the sheet
+        doesn't have anymore, the rest keep their IDs
+        """
+
+        used_ids: Dict[str, Set[str]] = {
+            "subjects": {
+                lesson.subjectid
+                for lesson in self._lessons
+            },
+            "classrooms": {
+                classroomid
+                for card in self._cards
+                for classroomid in card.classroomids
+            },
+            "teachers": {
+                teacherid
+                for lesson in self._lessons
+                for teacherid in lesson.teacherids
+            }
+        }
+
+        for _, _, _, orphan_teacherids, orphan_classroomids in self._sheet_blocks:
+            used_ids["teachers"].update(orphan_teacherids)
+            used_ids["classrooms"].update(orphan_classroomids)
+
+        for registry_name in ENTITY_REGISTRIES:
+            registry_used_ids: Set[str] = used_ids[registry_name]
+            items: List[Any] = getattr(self, "_" + registry_name)
+
+            if all(item.id in registry_used_ids for item in items):
+                continue
+
+            setattr(self, "_" + registry_name, [
+                item
+                for item in items
+                if item.id in registry_used_ids
+            ])
+
+            for mapping_name in ("_{}_from_id", "_{}_from_name"):
+                mapping_name = mapping_name.format(registry_name)
+
+                setattr(self, mapping_name, {
+                    key: item
+                    for key, item in getattr(self, mapping_name).items()
+                    if item.id in registry_used_ids
+                })
+
+    def _compact(self) -> None:
+        """
+        Moves lessons and cards into columnar tables, they are kept as read-only row views
+        """
+
+        intern_table: InternTable = InternTable()
+
+        lessons: ColumnarTable = ColumnarTable(
+            model_name = "Lesson",
+            fields = light_models.Lesson._fields,
+            intern_table = intern_table
+        )
+
+        lessons.extend(self._lessons)
+
+        cards: ColumnarTable = ColumnarTable(
+            model_name = "Card",
+            fields = light_models.Card._fields,
+            intern_table = intern_table
+        )
+
+        cards.extend(self._cards)
+
+        # Row views have the models' fields, so they stand in for them
+        self._lessons = cast(List["Lesson"], lessons)
+        self._lessons_from_id = cast(Dict[str, "Lesson"], ColumnarMapping(
+            table = lessons
+        ))
+
+        self._cards = cast(List["Card"], cards)
+
+        # Blocks would keep the objects alive, so the next incremental parse re-parses every block
+        self._sheet_blocks = []
+
+    def _iter_divisions_data_rows(self) -> Iterator[dict]:
+        for i, groups in enumerate(self._groups_from_class_id.values(), 1):
+            yield {
+                "id": "*{}:".format(i),
+                "groupids": [
+                    groups[0].id
+                ]
+            }
+
+            yield {
+                "id": "*{}:1".format(i),
+                "groupids": [
+                    group.id
+                    for group in groups[1:]
+                ]
+            }
+
+    def _iter_data_rows(self, table_id: str) -> Iterator[dict]:
+        if table_id == "divisions":
+            return self._iter_divisions_data_rows()
+
+        tables: Dict[str, Iterable[Any]] = {
+            "classrooms": self._classrooms,
+            "classes": self._classes,
+            "subjects": self._subjects,
+            "teachers": self._teachers,
+            "groups": self._groups,
+            "lessons": self._lessons,
+            "cards": self._cards
+        }
+
+        return (
+            item.dict()
+            for item in tables[table_id]
+        )
+
+    def iter_json(self, json_indent: Optional[int]=None, json_encoder: str=JSON_ENCODER_AUTO) -> Iterator[bytes]:
+        """
+        Yields the encoded Edupage response piece by piece, without building it whole in memory.
+        Unsupported encoder options raise here, before anything is yielded
+        """
+
+        if not isinstance(json_indent, int) or json_indent <= 0:
+            json_indent = None
+
+        encoder: JSONEncoder = get_json_encoder(
+            name = json_encoder,
+            json_indent = json_indent
+        )
+
+        # Only tables built from the sheet are encoded here, the rest is cached per timetable number
+        skeleton_chunks: T_SKELETON_CHUNKS = get_skeleton_chunks(
+            timetable_number = self.timetable_number,
+            json_indent = json_indent,
+            encoding = self.encoding,
+            json_encoder = encoder
+        )
+
+        return self._iter_json(
+            skeleton_chunks = skeleton_chunks,
+            json_indent = json_indent,
+            encoder = encoder
+        )
+
+    def _iter_json(self, skeleton_chunks: T_SKELETON_CHUNKS, json_indent: Optional[int], encoder: JSONEncoder) -> Iterator[bytes]:
+        for skeleton_chunk in skeleton_chunks:
+            if isinstance(skeleton_chunk, bytes):
+                yield skeleton_chunk
+                continue
+
+            table_id, line_prefix = skeleton_chunk
+
+            yield from iter_data_rows_json(
+                data_rows = self._iter_data_rows(
+                    table_id = table_id
+                ),
+                json_indent = json_indent,
+                line_prefix = line_prefix,
+                encoding = self.encoding,
+                json_encoder = encoder
+            )
+
+    def save(self, json_filepath: Union[str, Path, BinaryIO], json_indent: Optional[int]=None, json_encoder: str=JSON_ENCODER_AUTO) -> None:
+        """
+        Writes the Edupage response to a file path or to any binary file-like object.
+        `json_encoder` is "auto" (orjson, ujson or stdlib, the first installed one supporting `json_indent`),
+        "orjson", "ujson" or "json"
+        """
+
+        with self._measure("save"):
+            self._save(
+                json_filepath = json_filepath,
+                json_indent = json_indent,
+                json_encoder = json_encoder
+            )
+
+        if self.metrics is not None:
+            self.metrics.notify()
+
+    def _save(self, json_filepath: Union[str, Path, BinaryIO], json_indent: Optional[int], json_encoder: str) -> None:
+        # Resolves the encoder before the target is opened, so bad options don't truncate it
+        json_chunks: Iterator[bytes] = self.iter_json(
+            json_indent = json_indent,
+            json_encoder = json_encoder
+        )
+
+        if hasattr(json_filepath, "write"):
+            for json_chunk in json_chunks:
+                json_filepath.write(json_chunk)
+
+            return
+
+        if not isinstance(json_filepath, Path):
+            json_filepath = Path(json_filepath)
+
+        with json_filepath.open("wb") as json_file:
+            for json_chunk in json_chunks:
+                json_file.write(json_chunk)
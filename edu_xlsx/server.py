@@ -0,0 +1,492 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+from email.parser import BytesParser
+from email.message import EmailMessage
+from email.policy import HTTP as HTTPPolicy
+from urllib.parse import urlsplit, parse_qs
+from importlib import import_module
+from threading import BoundedSemaphore, Lock
+from json import dumps as json_dumps
+from io import BytesIO
+from time import perf_counter
+
+import os
+
+from .parser import XLSXParser, ACCEPTABLE_TIMETABLE_NUMBERS, MODELS_MODULES, ENGINE_OPENPYXL
+from .encoders import JSON_ENCODER_AUTO, get_json_encoder
+from .skeleton import get_skeleton_chunks
+from .metrics import ParseMetrics, get_percentiles
+from .utils import import_datas_module
+
+from typing import List, Dict, Tuple, Deque, Any, Optional
+
+
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8080
+
+DEFAULT_MAX_BODY_SIZE: int = 20 * 1024 * 1024
+DEFAULT_MAX_QUEUE: int = 16
+DEFAULT_REQUEST_TIMEOUT: float = 60.0
+
+# Latencies of this many last requests are kept for percentiles
+LATENCIES_WINDOW: int = 1024
+
+CONVERT_PATH: str = "/convert"
+HEALTH_PATH: str = "/health"
+
+MULTIPART_FILE_FIELD: str = "file"
+TIMETABLE_NUMBER_FIELD: str = "timetable_number"
+
+
+class ServiceBusyError(Exception):
+    pass
+
+
+def warm_worker(parser_options: Dict[str, Any], json_encoder: str) -> None:
+    """
+    Worker process initializer: imports what parsing needs and builds static parts of the response,
+    so the first request of each worker isn't slower than the rest
+    """
+
+    import_module(
+        "." + MODELS_MODULES[parser_options.get("models", "pydantic")],
+        package = __package__
+    )
+
+    if parser_options.get("engine", ENGINE_OPENPYXL) == ENGINE_OPENPYXL:
+        import_module("openpyxl")
+
+    for timetable_number in ACCEPTABLE_TIMETABLE_NUMBERS:
+        import_datas_module(
+            timetable_number = timetable_number
+        )
+
+        get_skeleton_chunks(
+            timetable_number = timetable_number,
+            json_indent = None,
+            encoding = "utf-8",
+            json_encoder = get_json_encoder(
+                name = json_encoder,
+                json_indent = None
+            )
+        )
+
+
+def ping_worker() -> int:
+    return os.getpid()
+
+
+def convert_data(xlsx_data: bytes, timetable_number: str, parser_options: Dict[str, Any], json_encoder: str) -> Tuple[bytes, Dict[str, float]]:
+    """
+    Runs in a worker, returns the encoded response and seconds of the parser phases
+    """
+
+    start_time: float = perf_counter()
+
+    metrics: ParseMetrics = ParseMetrics()
+
+    xlsx_parser: XLSXParser = XLSXParser.from_bytes(
+        xlsx_data = xlsx_data,
+        timetable_number = timetable_number,
+        metrics = metrics,
+        **parser_options
+    )
+
+    try:
+        xlsx_parser.parse()
+
+    finally:
+        xlsx_parser.close()
+
+    json_file: BytesIO = BytesIO()
+
+    xlsx_parser.save(
+        json_filepath = json_file,
+        json_encoder = json_encoder
+    )
+
+    seconds: Dict[str, float] = dict(metrics.seconds)
+    seconds["worker"] = perf_counter() - start_time
+
+    return json_file.getvalue(), seconds
+
+
+class ConversionService:
+    """
+    Pool of warm worker processes converting uploaded workbooks.
+    At most `workers + max_queue` conversions are running or waiting,
+    more raise `ServiceBusyError` at once instead of piling up
+    """
+
+    def __init__(self, workers: Optional[int]=None, max_queue: int=DEFAULT_MAX_QUEUE, request_timeout: float=DEFAULT_REQUEST_TIMEOUT, json_encoder: str=JSON_ENCODER_AUTO, **parser_options: Any) -> None:
+        self.workers: int = workers or os.cpu_count() or 1
+        self.max_pending: int = self.workers + max_queue
+        self.request_timeout: float = request_timeout
+        self.json_encoder: str = json_encoder
+        self.parser_options: Dict[str, Any] = parser_options
+
+        self._executor: ProcessPoolExecutor = self._create_executor()
+        self._executor_lock: Lock = Lock()
+
+        self._slots: BoundedSemaphore = BoundedSemaphore(self.max_pending)
+
+        self._stats_lock: Lock = Lock()
+        self._pending: int = 0
+        self._counts: Dict[str, int] = dict(
+            requests = 0,
+            succeeded = 0,
+            failed = 0,
+            rejected = 0,
+            timed_out = 0
+        )
+        self._latencies: Dict[str, Deque[float]] = {}
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers = self.workers,
+            initializer = warm_worker,
+            initargs = (self.parser_options, self.json_encoder)
+        )
+
+    def warm_up(self) -> None:
+        """
+        Starts all worker processes, they are otherwise started on first requests
+        """
+
+        for future in [
+            self._executor.submit(ping_worker)
+            for _ in range(self.workers)
+        ]:
+            future.result()
+
+    def _release_slot(self, _: Optional[Future]=None) -> None:
+        with self._stats_lock:
+            self._pending -= 1
+
+        self._slots.release()
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._counts[name] += 1
+
+    def _add_latencies(self, seconds: Dict[str, float]) -> None:
+        with self._stats_lock:
+            for phase, phase_seconds in seconds.items():
+                if phase not in self._latencies:
+                    self._latencies[phase] = deque(
+                        maxlen = LATENCIES_WINDOW
+                    )
+
+                self._latencies[phase].append(phase_seconds)
+
+    def _submit(self, xlsx_data: bytes, timetable_number: str) -> Future:
+        with self._executor_lock:
+            try:
+                return self._executor.submit(convert_data, xlsx_data, timetable_number, self.parser_options, self.json_encoder)
+
+            except BrokenProcessPool:
+                # A worker died (killed, out of memory), others are replaced with a new pool
+                self._executor.shutdown(
+                    wait = False
+                )
+
+                self._executor = self._create_executor()
+
+                return self._executor.submit(convert_data, xlsx_data, timetable_number, self.parser_options, self.json_encoder)
+
+    def convert(self, xlsx_data: bytes, timetable_number: str) -> bytes:
+        self._count("requests")
+
+        if not self._slots.acquire(blocking=False):
+            self._count("rejected")
+
+            raise ServiceBusyError(
+                "{max_pending} conversions are already running or queued!".format(
+                    max_pending = self.max_pending
+                )
+            )
+
+        with self._stats_lock:
+            self._pending += 1
+
+        start_time: float = perf_counter()
+
+        try:
+            future: Future = self._submit(
+                xlsx_data = xlsx_data,
+                timetable_number = timetable_number
+            )
+
+        except BaseException:
+            self._release_slot()
+            raise
+
+        # The slot is freed when the worker is done, even if the request timed out
+        future.add_done_callback(self._release_slot)
+
+        try:
+            json_data, seconds = future.result(
+                timeout = self.request_timeout
+            )
+
+        except FutureTimeoutError:
+            future.cancel()
+            self._count("timed_out")
+            raise
+
+        except BaseException:
+            self._count("failed")
+            raise
+
+        seconds["total"] = perf_counter() - start_time
+        seconds["queue"] = max(seconds["total"] - seconds["worker"], 0.0)
+
+        self._add_latencies(seconds)
+        self._count("succeeded")
+
+        return json_data
+
+    def get_health(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return dict(
+                status = "ok",
+                workers = self.workers,
+                pending = self._pending,
+                max_pending = self.max_pending,
+                counts = dict(self._counts),
+                latencies_ms = {
+                    phase: dict(
+                        count = len(phase_latencies),
+                        **{
+                            name: round(seconds * 1000, 3)
+                            for name, seconds in get_percentiles(phase_latencies).items()
+                        }
+                    )
+                    for phase, phase_latencies in self._latencies.items()
+                }
+            )
+
+    def close(self) -> None:
+        self._executor.shutdown(
+            wait = True
+        )
+
+
+class ConversionHTTPServer(ThreadingHTTPServer):
+    def __init__(self, server_address: Tuple[str, int], service: ConversionService, max_body_size: int=DEFAULT_MAX_BODY_SIZE, log_requests: bool=True) -> None:
+        super().__init__(server_address, ConversionRequestHandler)
+
+        self.service: ConversionService = service
+        self.max_body_size: int = max_body_size
+        self.log_requests: bool = log_requests
+
+
+class ConversionRequestHandler(BaseHTTPRequestHandler):
+    """
+    `POST /convert?timetable_number=1` with the .XLSX as the body (or as the "file" field of
+    a multipart form, with "timetable_number" field) returns the Edupage response,
+    `GET /health` returns the service state and latency percentiles of parser phases
+    """
+
+    protocol_version: str = "HTTP/1.1"
+
+    server: ConversionHTTPServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.log_requests:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]]=None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, obj: Any, headers: Optional[Dict[str, str]]=None) -> None:
+        self._send(
+            status = status,
+            body = json_dumps(
+                obj = obj,
+                ensure_ascii = False
+            ).encode("utf-8"),
+            content_type = "application/json; charset=utf-8",
+            headers = headers
+        )
+
+    def _send_error(self, status: int, message: str, headers: Optional[Dict[str, str]]=None) -> None:
+        self._send_json(
+            status = status,
+            obj = dict(
+                error = message
+            ),
+            headers = headers
+        )
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path != HEALTH_PATH:
+            self._send_error(404, "Not found")
+            return
+
+        self._send_json(200, self.server.service.get_health())
+
+    def _read_body(self) -> Optional[bytes]:
+        content_length: Optional[str] = self.headers.get("Content-Length")
+
+        if content_length is None or not content_length.isdigit():
+            self.close_connection = True
+            self._send_error(411, "Content-Length is required")
+            return None
+
+        if int(content_length) > self.server.max_body_size:
+            # The body is not read, so the connection can't be reused
+            self.close_connection = True
+
+            self._send_error(
+                413,
+                "Body of {size} bytes is bigger than {max_body_size} bytes".format(
+                    size = content_length,
+                    max_body_size = self.server.max_body_size
+                )
+            )
+
+            return None
+
+        return self.rfile.read(int(content_length))
+
+    def _get_upload(self, body: bytes) -> Tuple[bytes, Optional[str]]:
+        timetable_numbers: List[str] = parse_qs(urlsplit(self.path).query).get(TIMETABLE_NUMBER_FIELD, [])
+        timetable_number: Optional[str] = timetable_numbers[0] if timetable_numbers else None
+
+        content_type: str = self.headers.get("Content-Type", "")
+
+        if not content_type.startswith("multipart/form-data"):
+            return body, timetable_number
+
+        message: EmailMessage = BytesParser(
+            policy = HTTPPolicy
+        ).parsebytes(
+            "Content-Type: {content_type}\r\n\r\n".format(
+                content_type = content_type
+            ).encode("utf-8") + body
+        )
+
+        xlsx_data: bytes = b""
+
+        for part in message.iter_parts():
+            name: Optional[str] = part.get_param("name", header="content-disposition")
+
+            if name == MULTIPART_FILE_FIELD:
+                xlsx_data = part.get_payload(decode=True) or b""
+
+            elif name == TIMETABLE_NUMBER_FIELD:
+                timetable_number = part.get_content().strip()
+
+        return xlsx_data, timetable_number
+
+    def do_POST(self) -> None:
+        if urlsplit(self.path).path != CONVERT_PATH:
+            self.close_connection = True
+            self._send_error(404, "Not found")
+            return
+
+        body: Optional[bytes] = self._read_body()
+
+        if body is None:
+            return
+
+        xlsx_data, timetable_number = self._get_upload(body)
+
+        if timetable_number is None:
+            self._send_error(
+                400,
+                "\"{field}\" is required".format(
+                    field = TIMETABLE_NUMBER_FIELD
+                )
+            )
+
+            return
+
+        try:
+            # Invalid input is rejected here, before it takes a worker
+            XLSXParser.from_bytes(
+                xlsx_data = xlsx_data,
+                timetable_number = timetable_number,
+                **self.server.service.parser_options
+            )
+
+            json_data: bytes = self.server.service.convert(
+                xlsx_data = xlsx_data,
+                timetable_number = timetable_number
+            )
+
+        except ValueError as exception:
+            self._send_error(400, str(exception))
+
+        except ServiceBusyError as exception:
+            self._send_error(
+                503,
+                str(exception),
+                headers = {
+                    "Retry-After": "1"
+                }
+            )
+
+        except FutureTimeoutError:
+            self._send_error(504, "Conversion timed out")
+
+        except BrokenProcessPool:
+            self._send_error(500, "Worker process died")
+
+        except Exception as exception:
+            self._send_error(
+                422,
+                "Failed to parse: {exception!r}".format(
+                    exception = exception
+                )
+            )
+
+        else:
+            self._send(
+                status = 200,
+                body = json_data,
+                content_type = "application/json; charset=utf-8"
+            )
+
+
+def serve(host: str=DEFAULT_HOST, port: int=DEFAULT_PORT, max_body_size: int=DEFAULT_MAX_BODY_SIZE, log_requests: bool=True, **service_options: Any) -> None:
+    """
+    Runs the service until interrupted, `service_options` go to `ConversionService`
+    """
+
+    service: ConversionService = ConversionService(**service_options)
+    service.warm_up()
+
+    http_server: ConversionHTTPServer = ConversionHTTPServer(
+        server_address = (host, port),
+        service = service,
+        max_body_size = max_body_size,
+        log_requests = log_requests
+    )
+
+    print(
+        "Serving on http://{host}:{port} with {workers} workers ...".format(
+            host = host,
+            port = http_server.server_address[1],
+            workers = service.workers
+        ),
+        flush = True
+    )
+
+    try:
+        http_server.serve_forever()
+
+    finally:
+        http_server.server_close()
+        service.close()
@@ -0,0 +1,329 @@
+from pathlib import Path
+from io import BytesIO
+from concurrent.futures import Future, ProcessPoolExecutor
+from re import Pattern as RePattern, compile as regex_compile
+from json import dumps as json_dumps
+
+import os
+
+from .parser import XLSXParser, T_XLSX_INPUT, ACCEPTABLE_TIMETABLE_NUMBERS, ENGINE_OPENPYXL, ENGINE_OOXML
+from .ooxml import OOXMLSheetReader, get_sheetnames, get_sheet_index
+from .encoders import JSON_ENCODER_AUTO
+from .aio import parse_state
+
+from typing import List, Dict, Tuple, Iterator, Any, Union, Optional, BinaryIO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openpyxl.workbook.workbook import Workbook
+
+
+SHEET_OUTPUT_TEMPLATE: str = "{stem}.{sheet}.json"
+
+# Stem of in-memory workbooks in output names
+DEFAULT_STEM: str = "workbook"
+
+number_re: RePattern = regex_compile(r"\d+")
+unsafe_filename_chars_re: RePattern = regex_compile(r"[\\/:*?\"<>|]")
+
+
+# Sheet index or name to timetable number
+T_SHEETS_CONFIG = Dict[Union[int, str], Union[int, str]]
+
+
+def get_sheet_timetable_number(sheetname: str) -> Optional[str]:
+    # "Смена 2" -> "2"
+    numbers: List[str] = number_re.findall(sheetname)
+
+    if numbers and numbers[-1] in ACCEPTABLE_TIMETABLE_NUMBERS:
+        return numbers[-1]
+
+    return None
+
+
+def resolve_sheets(sheetnames: List[str], sheets: Optional[T_SHEETS_CONFIG]=None, timetable_number: Optional[Union[int, str]]=None) -> List[Tuple[str, str]]:
+    """
+    Names and timetable numbers of selected sheets. Without `sheets` every sheet is selected,
+    its timetable number is the last number in its name ("Смена 2") or else `timetable_number`
+    """
+
+    if sheets is None:
+        sheets = {
+            sheetname: get_sheet_timetable_number(sheetname) or timetable_number
+            for sheetname in sheetnames
+        }
+
+    resolved_sheets: List[Tuple[str, str]] = []
+
+    for sheet, sheet_timetable_number in sheets.items():
+        sheetname: str = sheetnames[get_sheet_index(
+            sheetnames = sheetnames,
+            sheet = sheet
+        )]
+
+        if sheet_timetable_number is None:
+            raise ValueError(
+                "Timetable number of sheet {sheetname!r} must be given!".format(
+                    sheetname = sheetname
+                )
+            )
+
+        resolved_sheets.append((sheetname, str(sheet_timetable_number)))
+
+    return resolved_sheets
+
+
+def parse_sheets_config(values: List[str]) -> Optional[T_SHEETS_CONFIG]:
+    """
+    CLI values: ["all"] for every sheet, or "NAME=NUMBER" and "INDEX=NUMBER" pairs
+    """
+
+    if values == ["all"]:
+        return None
+
+    sheets: T_SHEETS_CONFIG = {}
+
+    for value in values:
+        sheet, _, timetable_number = value.rpartition("=")
+
+        if not sheet or not timetable_number:
+            raise ValueError(
+                "Sheet {value!r} must be NAME=NUMBER or INDEX=NUMBER!".format(
+                    value = value
+                )
+            )
+
+        # Digits stay a string, a sheet named so is matched before an index
+        sheets[sheet] = timetable_number
+
+    return sheets
+
+
+def get_sheet_filename(sheetname: str) -> str:
+    return unsafe_filename_chars_re.sub("_", sheetname).strip() or "_"
+
+
+class WorkbookParser:
+    """
+    Parses several sheets of one workbook, each as its own timetable, into `parsers` by sheet name.
+    The file is read once. With `workers` above 1 the sheets are parsed in parallel processes
+    which get the workbook's bytes, otherwise one after another from the workbook opened once.
+    `kwargs` go to every `XLSXParser`
+    """
+
+    def __init__(self, xlsx_filepath: T_XLSX_INPUT, sheets: Optional[T_SHEETS_CONFIG]=None, timetable_number: Optional[Union[int, str]]=None, workers: Optional[int]=1, **kwargs: Any) -> None:
+        self.xlsx_filepath: Optional[Path] = None
+
+        if isinstance(xlsx_filepath, (bytes, bytearray, memoryview)):
+            xlsx_data: bytes = bytes(xlsx_filepath)
+
+        elif hasattr(xlsx_filepath, "read"):
+            xlsx_data = xlsx_filepath.read()
+
+        else:
+            self.xlsx_filepath = Path(xlsx_filepath)
+
+            if not self.xlsx_filepath.is_file():
+                raise ValueError(
+                    "Input .XLSX {xlsx_filepath!r} must exists and be a file!".format(
+                        xlsx_filepath = self.xlsx_filepath.resolve()
+                    )
+                )
+
+            xlsx_data = self.xlsx_filepath.read_bytes()
+
+        self.xlsx_data: bytes = xlsx_data
+        self.workers: Optional[int] = workers
+
+        self._parser_kwargs: Dict[str, Any] = kwargs
+
+        self.sheets: List[Tuple[str, str]] = resolve_sheets(
+            sheetnames = self._get_sheetnames(),
+            sheets = sheets,
+            timetable_number = timetable_number
+        )
+
+        self.parsers: Dict[str, XLSXParser] = {
+            sheetname: XLSXParser.from_bytes(
+                xlsx_data = xlsx_data,
+                timetable_number = sheet_timetable_number,
+                sheet = sheetname,
+                **kwargs
+            )
+            for sheetname, sheet_timetable_number in self.sheets
+        }
+
+    def _get_sheetnames(self) -> List[str]:
+        try:
+            return get_sheetnames(BytesIO(self.xlsx_data))
+
+        except Exception:
+            raise ValueError(
+                "Input .XLSX data of {size} bytes must be a .XLSX file!".format(
+                    size = len(self.xlsx_data)
+                )
+            ) from None
+
+    def _open_workbook(self) -> Union["Workbook", OOXMLSheetReader]:
+        engine: str = self._parser_kwargs.get("engine", ENGINE_OPENPYXL)
+
+        if engine == ENGINE_OOXML:
+            return OOXMLSheetReader(
+                xlsx_file = BytesIO(self.xlsx_data)
+            )
+
+        from openpyxl import load_workbook
+
+        return load_workbook(
+            filename = BytesIO(self.xlsx_data),
+            read_only = self._parser_kwargs.get("read_only", False)
+        )
+
+    def _parse_sequentially(self) -> None:
+        excel: Union["Workbook", OOXMLSheetReader] = self._open_workbook()
+
+        try:
+            for xlsx_parser in self.parsers.values():
+                xlsx_parser.use_workbook(excel)
+
+                try:
+                    xlsx_parser.parse()
+
+                finally:
+                    xlsx_parser.close()
+
+        finally:
+            excel.close()
+
+    def _parse_in_parallel(self, workers: int) -> None:
+        # Metrics callbacks may be unpicklable, sheets parsed in workers aren't measured
+        worker_kwargs: Dict[str, Any] = {
+            name: value
+            for name, value in self._parser_kwargs.items()
+            if name != "metrics"
+        }
+
+        # A fully loaded openpyxl workbook has every sheet in it, each worker streams only its own
+        worker_kwargs["read_only"] = True
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures: Dict[str, Future] = {
+                sheetname: executor.submit(
+                    parse_state,
+                    dict(
+                        xlsx_filepath = self.xlsx_data,
+                        timetable_number = sheet_timetable_number,
+                        sheet = sheetname,
+                        **worker_kwargs
+                    )
+                )
+                for sheetname, sheet_timetable_number in self.sheets
+            }
+
+            for sheetname, future in futures.items():
+                self.parsers[sheetname].set_state(
+                    state = future.result()[0]
+                )
+
+    def parse(self) -> None:
+        workers: int = min(self.workers or os.cpu_count() or 1, len(self.parsers))
+
+        if workers > 1:
+            self._parse_in_parallel(
+                workers = workers
+            )
+
+        else:
+            self._parse_sequentially()
+
+    def get_stem(self) -> str:
+        if self.xlsx_filepath is None:
+            return DEFAULT_STEM
+
+        return self.xlsx_filepath.stem
+
+    def save(self, output_dir: Union[str, Path], output_template: str=SHEET_OUTPUT_TEMPLATE, json_indent: Optional[int]=None, json_encoder: str=JSON_ENCODER_AUTO) -> Dict[str, Path]:
+        """
+        Writes every sheet's Edupage response to its own file, returns them by sheet name.
+        Template fields: {stem}, {sheet}, {timetable_number}
+        """
+
+        if not isinstance(output_dir, Path):
+            output_dir = Path(output_dir)
+
+        output_dir.mkdir(
+            parents = True,
+            exist_ok = True
+        )
+
+        json_filepaths: Dict[str, Path] = {}
+
+        for sheetname, sheet_timetable_number in self.sheets:
+            json_filepath: Path = output_dir / output_template.format(
+                stem = self.get_stem(),
+                sheet = get_sheet_filename(sheetname),
+                timetable_number = sheet_timetable_number
+            )
+
+            self.parsers[sheetname].save(
+                json_filepath = json_filepath,
+                json_indent = json_indent,
+                json_encoder = json_encoder
+            )
+
+            json_filepaths[sheetname] = json_filepath
+
+        return json_filepaths
+
+    def iter_json(self, json_indent: Optional[int]=None, json_encoder: str=JSON_ENCODER_AUTO) -> Iterator[bytes]:
+        """
+        Yields one JSON object of every sheet's Edupage response by sheet name.
+        Unsupported encoder options raise here, before anything is yielded
+        """
+
+        sheets_json_chunks: Dict[str, Iterator[bytes]] = {
+            sheetname: xlsx_parser.iter_json(
+                json_indent = json_indent,
+                json_encoder = json_encoder
+            )
+            for sheetname, xlsx_parser in self.parsers.items()
+        }
+
+        return self._iter_json(
+            sheets_json_chunks = sheets_json_chunks
+        )
+
+    def _iter_json(self, sheets_json_chunks: Dict[str, Iterator[bytes]]) -> Iterator[bytes]:
+        yield b"{"
+
+        for i, (sheetname, json_chunks) in enumerate(sheets_json_chunks.items()):
+            yield "{separator}{sheetname}:".format(
+                separator = "," if i else "",
+                sheetname = json_dumps(
+                    obj = sheetname,
+                    ensure_ascii = False
+                )
+            ).encode("utf-8")
+
+            yield from json_chunks
+
+        yield b"}"
+
+    def save_merged(self, json_filepath: Union[str, Path, BinaryIO], json_indent: Optional[int]=None, json_encoder: str=JSON_ENCODER_AUTO) -> None:
+        json_chunks: Iterator[bytes] = self.iter_json(
+            json_indent = json_indent,
+            json_encoder = json_encoder
+        )
+
+        if hasattr(json_filepath, "write"):
+            for json_chunk in json_chunks:
+                json_filepath.write(json_chunk)
+
+            return
+
+        with Path(json_filepath).open("wb") as json_file:
+            for json_chunk in json_chunks:
+                json_file.write(json_chunk)
+
+    def close(self) -> None:
+        for xlsx_parser in self.parsers.values():
+            xlsx_parser.close()
@@ -0,0 +1,227 @@
+from itertools import islice
+
+from .encoders import JSONEncoder
+from .utils import import_datas_module
+
+from typing import List, Dict, Tuple, Iterable, Iterator, Union, Optional
+
+
+DYNAMIC_TABLE_IDS: Tuple[str, ...] = (
+    "classrooms",
+    "classes",
+    "subjects",
+    "teachers",
+    "groups",
+    "divisions",
+    "lessons",
+    "cards"
+)
+
+DATA_ROWS_PLACEHOLDERS: Dict[str, str] = {
+    table_id: "<edu_xlsx:data_rows:{table_id}>".format(
+        table_id = table_id
+    )
+    for table_id in DYNAMIC_TABLE_IDS
+}
+
+
+DATA_ROWS_BATCH_SIZE: int = 512
+
+
+# Encoded static JSON and `(table_id, line_prefix)` of each table's `data_rows` to splice in between
+T_SKELETON_CHUNKS = List[Union[bytes, Tuple[str, str]]]
+
+
+_skeleton_chunks_cache: Dict[Tuple[str, Optional[int], str], T_SKELETON_CHUNKS] = {}
+
+
+def build_timetable_skeleton(periods: List[dict], daysdefs: List[dict]) -> dict:
+    return {
+        "r": {
+            "rights": {
+                "subjects": True,
+                "classes": True,
+                "teachers": True,
+                "classrooms": True,
+                "students": True,
+                "igroups": True,
+                "classroomsupervision": True,
+                "teachers_summary": True,
+                "classes_summary": True,
+                "classrooms_summary": True,
+                "igroups_summary": True
+            },
+            "dbiAccessorRes": {
+                "type": "ttuidocdbi",
+                "dbid": "",
+                "tables": [
+                    {"id":"globals","def":{"id":"globals","name":"Расписание","item_name":"Расписание","icon":"/static/pics/school_32.png"},"cdefs":[{"id":"name","type":"string","name":"Название учреждения"},{"id":"settings","type":"subobject","name":"settings","subcolumns":[{"id":"m_nZlozitostGener","type":"intcombo","name":"m_nZlozitostGener"},{"id":"m_bAllowZlavnenie","type":"checkbox","name":"m_bAllowZlavnenie"},{"id":"m_bGenerDraft","type":"checkbox","name":"m_bGenerDraft"},{"id":"m_nCoGenerovat","type":"intcombo","name":"m_nCoGenerovat"},{"id":"m_nSchoolType","type":"intcombo","name":"Тип школы"},{"id":"m_nGapsCounting","type":"intcombo","name":"Способ подсчета окон"},{"id":"name_format","type":"combo","name":"Формат имени"},{"id":"m_strPrintHeaderText","type":"string","name":"Заголовок"},{"id":"m_strDateBellowTimeTable","type":"string","name":"m_strDateBellowTimeTable"},{"id":"m_bPrintDozory","type":"checkbox","name":"Печатать дежурства в индивидуальных расписаниях"},{"id":"m_bPrintDozoryVSuhrnnych","type":"checkbox","name":"Печатать дежурства в итоговых расписаниях"},{"id":"m_bPrintDozoryColor","type":"checkbox","name":"Печатать надсмотр над кабинетами в цвете"},{"id":"m_bPrintSinglesSpolu","type":"checkbox","name":"Печатать одиночные последоват. уроки как 1 урок"},{"id":"m_bPrintDoublesAsSingles","type":"checkbox","name":"Печатать спаренные уроки как одиночные"},{"id":"m_nTimeFormat","type":"intcombo","name":"Формат времени"},{"id":"m_nPrvyDen","type":"intcombo","name":"Выходные дни"},{"id":"m_bPrintDayAsNumber","type":"checkbox","name":"Показывать номер дня вместо дня недели (т.е. День 1 вместо Понед.)"},{"id":"m_DozoryKriteria","type":"subobject","name":"m_DozoryKriteria","subcolumns":[{"id":"ucitel_limit_pocet","type":"int","name":"Большее/меньшее число надсмотров чем определено в ограничениях учителей"},{"id":"ucitel_limit_minuty","type":"int","name":"Больше/меньше минут надсмотров чем определено в ограничениях учителей"},{"id":"ucitel_rovnomerne_pocet","type":"int","name":"Такое же число для всех учителей"},{"id":"ucitel_rovnomerne_minuty","type":"int","name":"Такое же число минут для всех учителей"},{"id":"ucitel_uci_predalebopo","type":"int","name":"Учитель имет урок до ИЛИ после"},{"id":"ucitel_uci_predajpo","type":"int","name":"Учитель имет урок до И после"},{"id":"ucitel_uci_vsusednej_predalebopo","type":"int","name":"В соседнем кабинете до ИЛИ после"},{"id":"ucitel_uci_vsusednej_predajpo","type":"int","name":"В соседнем кабинете до И после"},{"id":"ucitel_cezdvojhodinovku","type":"int","name":"Во время двойного (или более длинного) урока"},{"id":"ucitel_prazdnyden","type":"int","name":"В день без уроков"},{"id":"ucitel_predvyucovanim","type":"int","name":"Перед первым уроком учителя"},{"id":"ucitel_povyucovani","type":"int","name":"После последнего урока учителя"},{"id":"ucitel_vjedenden","type":"int","name":"Все в один день"},{"id":"ucitel_zasebou","type":"int","name":"Непрерывно"}]},{"id":"draft_options","type":"subdata","name":"draft_options","subcolumns":[{"id":"active","type":"checkbox","name":"active"},{"id":"relax","type":"checkbox","name":"relax"}]}]},{"id":"year","type":"schoolyear","name":"Учебный год"},{"id":"reg_name","type":"string","name":"reg_name"}],"data_rows":[{"id":"1","name":"","settings":{"m_nZlozitostGener":1,"m_bAllowZlavnenie":True,"m_bGenerDraft":False,"m_nCoGenerovat":0,"m_nSchoolType":0,"m_nGapsCounting":0,"name_format":"FSL","m_strPrintHeaderText":"","m_strDateBellowTimeTable":"","m_bPrintDozory":True,"m_bPrintDozoryVSuhrnnych":False,"m_bPrintDozoryColor":False,"m_bPrintSinglesSpolu":False,"m_bPrintDoublesAsSingles":False,"m_nTimeFormat":0,"m_nPrvyDen":0,"m_bPrintDayAsNumber":False,"m_DozoryKriteria":{"ucitel_limit_pocet":0,"ucitel_limit_minuty":0,"ucitel_rovnomerne_pocet":0,"ucitel_rovnomerne_minuty":0,"ucitel_uci_predalebopo":0,"ucitel_uci_predajpo":0,"ucitel_uci_vsusednej_predalebopo":0,"ucitel_uci_vsusednej_predajpo":0,"ucitel_cezdvojhodinovku":0,"ucitel_prazdnyden":0,"ucitel_predvyucovanim":0,"ucitel_povyucovani":0,"ucitel_vjedenden":0,"ucitel_zasebou":0},"draft_options":{}},"year":2022,"reg_name":""}],"data_columns":["name","settings","year","reg_name"]},
+                    {"id":"periods","def":{"id":"periods","name":"Периоды","item_name":"Периоды","icon":"/static/pics/time_32.svg"},"cdefs":[{"id":"period","type":"tableid","name":"Период","table":"periods"},{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"},{"id":"daydata","type":"subdata","name":"daydata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"}]},{"id":"printinsummary","type":"checkbox","name":"Печатать этот период в общих расписаниях"},{"id":"printinteacher","type":"checkbox","name":"Печатать этот период в отд. расп. учителей"},{"id":"printinclass","type":"checkbox","name":"Печатать этот период в отд. расп. учеников"},{"id":"printinclassroom","type":"checkbox","name":"Печатать этот период в отд. расп. кабинетов"},{"id":"printonlyinbells","type":"tableids","name":"Печат. в звонках","table":"bells"}],"data_rows":[
+                        {
+                            "id": str(i),
+                            "period": period["period"],
+                            "name": period["name"],
+                            "short": period["short"],
+                            "starttime": period["starttime"],
+                            "endtime": period["endtime"],
+                            "daydata": {},
+                            "printinsummary": True,
+                            "printinteacher": True,
+                            "printinclass": True,
+                            "printinclassroom": True,
+                            "printonlyinbells": []
+                        }
+                        for i, period in enumerate(periods, 1)
+                    ], "data_columns":["period","name","short","starttime","endtime","daydata","printinsummary","printinteacher","printinclass","printinclassroom","printonlyinbells"]},
+                    {"id":"breaks","def":{"id":"breaks","name":"Перерывы","item_name":"Перерыв","icon":"/static/pics/break_32.png"},"cdefs":[{"id":"break","type":"tableid","name":"перемена","table":"breaks"},{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"},{"id":"daydata","type":"subdata","name":"daydata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"}]},{"id":"printinsummary","type":"checkbox","name":"Печатать этот период в общих расписаниях"},{"id":"printinteacher","type":"checkbox","name":"Печатать этот период в отд. расп. учителей"},{"id":"printinclass","type":"checkbox","name":"Печатать этот период в отд. расп. учеников"},{"id":"printinclassroom","type":"checkbox","name":"Печатать этот период в отд. расп. кабинетов"},{"id":"printonlyinbells","type":"tableids","name":"Печат. в звонках","table":"bells"},{"id":"printtext","type":"string","name":"Текст для распечатки"}],"data_rows":[],"data_columns":["break","name","short","starttime","endtime","daydata","printinsummary","printinteacher","printinclass","printinclassroom","printonlyinbells","printtext"]},
+                    {"id":"bells","def":{"id":"bells","name":"bells","item_name":"bells","icon":""},"cdefs":[{"id":"bell","type":"tableid","name":"Звонки","table":"bells"},{"id":"perioddata","type":"subdata","name":"perioddata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"},{"id":"daydata","type":"subdata","name":"daydata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"}]}]},{"id":"breakdata","type":"subdata","name":"breakdata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"},{"id":"daydata","type":"subdata","name":"daydata","subcolumns":[{"id":"starttime","type":"time","name":"Начинается"},{"id":"endtime","type":"time","name":"Заканчивается"}]}]}],"data_rows":[{"id":"0","bell":"0","perioddata":{},"breakdata":{}},{"id":"1","bell":"1","perioddata":{},"breakdata":{}},{"id":"2","bell":"2","perioddata":{},"breakdata":{}},{"id":"3","bell":"3","perioddata":{},"breakdata":{}},{"id":"4","bell":"4","perioddata":{},"breakdata":{}},{"id":"5","bell":"5","perioddata":{},"breakdata":{}},{"id":"6","bell":"6","perioddata":{},"breakdata":{}},{"id":"7","bell":"7","perioddata":{},"breakdata":{}},{"id":"8","bell":"8","perioddata":{},"breakdata":{}},{"id":"9","bell":"9","perioddata":{},"breakdata":{}},{"id":"10","bell":"10","perioddata":{},"breakdata":{}},{"id":"11","bell":"11","perioddata":{},"breakdata":{}},{"id":"12","bell":"12","perioddata":{},"breakdata":{}},{"id":"13","bell":"13","perioddata":{},"breakdata":{}},{"id":"14","bell":"14","perioddata":{},"breakdata":{}},{"id":"15","bell":"15","perioddata":{},"breakdata":{}},{"id":"16","bell":"16","perioddata":{},"breakdata":{}},{"id":"17","bell":"17","perioddata":{},"breakdata":{}},{"id":"18","bell":"18","perioddata":{},"breakdata":{}},{"id":"19","bell":"19","perioddata":{},"breakdata":{}},{"id":"20","bell":"20","perioddata":{},"breakdata":{}},{"id":"21","bell":"21","perioddata":{},"breakdata":{}},{"id":"22","bell":"22","perioddata":{},"breakdata":{}},{"id":"23","bell":"23","perioddata":{},"breakdata":{}},{"id":"24","bell":"24","perioddata":{},"breakdata":{}},{"id":"25","bell":"25","perioddata":{},"breakdata":{}},{"id":"26","bell":"26","perioddata":{},"breakdata":{}},{"id":"27","bell":"27","perioddata":{},"breakdata":{}},{"id":"28","bell":"28","perioddata":{},"breakdata":{}},{"id":"29","bell":"29","perioddata":{},"breakdata":{}},{"id":"30","bell":"30","perioddata":{},"breakdata":{}},{"id":"31","bell":"31","perioddata":{},"breakdata":{}},{"id":"32","bell":"32","perioddata":{},"breakdata":{}},{"id":"33","bell":"33","perioddata":{},"breakdata":{}},{"id":"34","bell":"34","perioddata":{},"breakdata":{}},{"id":"35","bell":"35","perioddata":{},"breakdata":{}},{"id":"36","bell":"36","perioddata":{},"breakdata":{}},{"id":"37","bell":"37","perioddata":{},"breakdata":{}},{"id":"38","bell":"38","perioddata":{},"breakdata":{}},{"id":"39","bell":"39","perioddata":{},"breakdata":{}},{"id":"40","bell":"40","perioddata":{},"breakdata":{}},{"id":"41","bell":"41","perioddata":{},"breakdata":{}},{"id":"42","bell":"42","perioddata":{},"breakdata":{}},{"id":"43","bell":"43","perioddata":{},"breakdata":{}},{"id":"44","bell":"44","perioddata":{},"breakdata":{}},{"id":"45","bell":"45","perioddata":{},"breakdata":{}},{"id":"46","bell":"46","perioddata":{},"breakdata":{}},{"id":"47","bell":"47","perioddata":{},"breakdata":{}},{"id":"48","bell":"48","perioddata":{},"breakdata":{}},{"id":"49","bell":"49","perioddata":{},"breakdata":{}}],"data_columns":["bell","perioddata","breakdata"]},
+                    {"id":"daysdefs","def":{"id":"daysdefs","name":"Дни","item_name":"День","icon":"/static/pics/r_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"typ","type":"enum","name":"typ"},{"id":"vals","type":"stringarray","name":"vals"},{"id":"val","type":"int","name":"val"}],"data_rows":[
+                        {
+                            "id": "*{}".format(i),
+                            "name": daysdef["name"],
+                            "short": daysdef["short"],
+                            "typ": daysdef["typ"],
+                            "vals": daysdef["days"].split(","),
+                            "val": daysdef["val"]
+                        }
+                        for i, daysdef in enumerate(daysdefs, 1)
+                    ],"data_columns":["name","short","typ","vals","val"]},
+                    {"id":"weeksdefs","def":{"id":"weeksdefs","name":"Недели","item_name":"Неделя","icon":"/static/pics/g_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"typ","type":"enum","name":"typ"},{"id":"vals","type":"stringarray","name":"vals"},{"id":"val","type":"int","name":"val"}],"data_rows":[{"id":"*1","name":"Неделя A","short":"A","typ":"one","vals":["1"],"val":0},{"id":"*2","name":"Любая неделя","short":"Любой","typ":"any","vals":["1"],"val":None},{"id":"*3","name":"Все недели","short":"Все","typ":"all","vals":["1"],"val":None}],"data_columns":["name","short","typ","vals","val"]},
+                    {"id":"termsdefs","def":{"id":"termsdefs","name":"Семестры","item_name":"Семестр","icon":"/static/pics/b_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"typ","type":"enum","name":"typ"},{"id":"vals","type":"stringarray","name":"vals"},{"id":"val","type":"int","name":"val"}],"data_rows":[{"id":"*1","name":"Весь год","short":"Год","typ":"all","vals":["1"],"val":None}],"data_columns":["name","short","typ","vals","val"]},
+                    {"id":"days","def":{"id":"days","name":"Дни","item_name":"День","icon":"/static/pics/r_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"}],"data_rows":[
+                        {
+                            "id": str(i),
+                            "name": daysdef["name"],
+                            "short": daysdef["short"]
+                        }
+                        for i, daysdef in enumerate(daysdefs, 0)
+                    ],"data_columns":["name","short"]},
+                    {"id":"weeks","def":{"id":"weeks","name":"Недели","item_name":"Неделя","icon":"/static/pics/g_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"}],"data_rows":[{"id":"0","name":"Неделя A","short":"A"}],"data_columns":["name","short"]},
+                    {"id":"terms","def":{"id":"terms","name":"Семестры","item_name":"Семестр","icon":"/static/pics/b_2_A.png"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"}],"data_rows":[{"id":"0","name":"Семестр 1","short":"T1"}],"data_columns":["name","short"]},
+                    {"id":"buildings","def":{"id":"buildings","name":"Школьные корпуса","item_name":"Учебный корпус","icon":"/static/pics/classroom_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"color","type":"color","name":"Цвет"}],"data_rows":[],"data_columns":["name","short","color"]},
+                    {"id":"classrooms","def":{"id":"classrooms","name":"Кабинеты","item_name":"Кабинет","icon":"/static/pics/classroom_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"buildingid","type":"tableid","name":"Учебный корпус","table":"buildings"},{"id":"sharedroom","type":"checkbox","name":"Общий кабинет"},{"id":"needssupervision","type":"checkbox","name":"Этому кабинету нужен надсмотр"},{"id":"color","type":"color","name":"Цвет"},{"id":"nearbyclassroomids","type":"tableids","name":"Кабинеты поблизости","table":"classrooms"}],"data_rows":DATA_ROWS_PLACEHOLDERS["classrooms"],"data_columns":["name","short","buildingid","sharedroom","needssupervision","color","nearbyclassroomids"]},
+                    {"id":"classes","def":{"id":"classes","name":"Классы","item_name":"Класс","icon":"/static/pics/class_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"teacherid","type":"tableid","name":"Классный руководитель","table":"teachers"},{"id":"classroomids","type":"tableids","name":"Основной кабинет","table":"classrooms"},{"id":"bell","type":"tableid","name":"Звонки","table":"bells"},{"id":"color","type":"color","name":"Цвет"},{"id":"timeoff","type":"object","name":"Рабочее время"},{"id":"printsubjectpictures","type":"checkbox","name":"Печатать картинки предметов"},{"id":"classroomid","type":"tableid","name":"Кабинет","table":"classrooms"}],"data_rows":DATA_ROWS_PLACEHOLDERS["classes"],"data_columns":["name","short","teacherid","classroomids","bell","color","timeoff","printsubjectpictures","classroomid"]},
+                    {"id":"subjects","def":{"id":"subjects","name":"Предметы","item_name":"Предмет","icon":"/static/pics/subject_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"short","type":"string","name":"Сокращение"},{"id":"color","type":"color","name":"Цвет"},{"id":"picture_url","name":"Картинка"},{"id":"timeoff","type":"object","name":"Рабочее время"},{"id":"contract_weight","type":"float","name":"Продолжительность контракта учителя"}],"data_rows":DATA_ROWS_PLACEHOLDERS["subjects"],"data_columns":["name","short","color","picture_url","timeoff","contract_weight"]},
+                    {"id":"teachers","def":{"id":"teachers","name":"Учителя","item_name":"Учитель","icon":"/static/pics/teacher_32.svg"},"cdefs":[{"id":"firstname","type":"string","name":"Имя"},{"id":"lastname","type":"string","name":"Фамилия"},{"id":"nameprefix","type":"string","name":"Обращение"},{"id":"namesuffix","type":"string","name":"суффикс имени"},{"id":"short","type":"string","name":"Сокращение"},{"id":"gender","type":"enum","name":"Пол"},{"id":"bell","type":"tableid","name":"Звонки","table":"bells"},{"id":"color","type":"color","name":"Цвет"},{"id":"fontcolorprint","type":"color","name":"Основной текст"},{"id":"fontcolorprint2","type":"color","name":"Другой текст"},{"id":"fontcolorscreen","type":"color","name":"Текст на экране"},{"id":"timeoff","type":"object","name":"Рабочее время"}],"data_rows":DATA_ROWS_PLACEHOLDERS["teachers"],"data_columns":["firstname","lastname","nameprefix","namesuffix","short","gender","bell","color","fontcolorprint","fontcolorprint2","fontcolorscreen","timeoff"]},
+                    {"id":"groups","def":{"id":"groups","name":"Группы","item_name":"Группа","icon":"/static/pics/group_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"},{"id":"classid","type":"tableid","name":"Класс","table":"classes"},{"id":"entireclass","type":"checkbox","name":"entireclass"},{"id":"ascttdivision","type":"string","name":"ascttdivision"},{"id":"okgroup","name":"okgroup"},{"id":"students_count","type":"int","name":"students_count"},{"id":"divisionid","type":"tableid","name":"divisionid","table":"divisions"},{"id":"color","type":"color","name":"Цвет"}],"data_rows":DATA_ROWS_PLACEHOLDERS["groups"],"data_columns":["name","classid","entireclass","ascttdivision","okgroup","students_count","divisionid","color"]},
+                    {"id":"divisions","def":{"id":"divisions","name":"divisions","item_name":"divisions","icon":"/timetable/pics/app/office/division_32.svg"},"cdefs":[{"id":"groupids","type":"tableids","name":"Группы","table":"groups"}],"data_rows":DATA_ROWS_PLACEHOLDERS["divisions"],"data_columns":["groupids"]},
+                    {"id":"students","def":{"id":"students","name":"Учащиеся","item_name":"Учащийся","icon":"/static/pics/student_32.svg"},"cdefs":[{"id":"classid","type":"tableid","name":"Класс","table":"classes"},{"id":"groupids","type":"tableids","name":"Группы","table":"groups"},{"id":"short","type":"string","name":"Сокращение"}],"data_rows":[],"data_columns":["classid","groupids","short"]},
+                    {"id":"lessons","def":{"id":"lessons","name":"Уроки","item_name":"Урок","icon":"/static/pics/lessons_32.svg"},"cdefs":[{"id":"subjectid","type":"tableid","name":"Предмет","table":"subjects"},{"id":"teacherids","type":"tableids","name":"Учителя","table":"teachers"},{"id":"groupids","type":"tableids","name":"Группы","table":"groups"},{"id":"classids","type":"tableids","name":"Класс","table":"classes"},{"id":"count","type":"int","name":"Всего"},{"id":"durationperiods","type":"int","name":"Длина"},{"id":"classroomidss","type":"tableidss","name":"Свободные кабинеты","table":"classrooms"},{"id":"termsdefid","type":"tableid","name":"Семестр","table":"termsdefs"},{"id":"weeksdefid","type":"tableid","name":"Неделя","table":"weeksdefs"},{"id":"daysdefid","type":"tableid","name":"День недели","table":"daysdefs"},{"id":"terms","name":"terms"},{"id":"seminargroup","type":"int","name":"Группа семинара №"},{"id":"bell","type":"tableid","name":"Звонки","table":"bells"},{"id":"studentids","type":"tableids","name":"Учащиеся","table":"students"},{"id":"groupnames","type":"stringarray","name":"Группы"}],"data_rows":DATA_ROWS_PLACEHOLDERS["lessons"],"data_columns":["subjectid","teacherids","groupids","classids","count","durationperiods","classroomidss","termsdefid","weeksdefid","daysdefid","terms","seminargroup","bell","studentids","groupnames"]},
+                    {"id":"studentsubjects","def":{"id":"studentsubjects","name":"Семинары","item_name":"Семинары","icon":"/timetable/pics/app/office/seminar_32.png"},"cdefs":[{"id":"studentid","type":"tableid","name":"Учащийся","table":"students"},{"id":"subjectid","type":"tableid","name":"Предмет","table":"subjects"},{"id":"seminargroup","type":"int","name":"Группа семинара №"},{"id":"importance","type":"enum","name":"Важность"},{"id":"locked","type":"checkbox","name":"Запертый"}],"data_rows":[],"data_columns":["studentid","subjectid","seminargroup","importance","locked"]},
+                    {"id":"cards","def":{"id":"cards","name":"Карточки","item_name":"Карточка урока","icon":"/timetable/pics/app/card_32.png"},"cdefs":[{"id":"lessonid","type":"tableid","name":"lessonid","table":"lessons"},{"id":"period","type":"tableid","name":"Период","table":"periods"},{"id":"days","type":"string","name":"days"},{"id":"weeks","type":"string","name":"weeks"},{"id":"classroomids","type":"tableids","name":"Кабинеты","table":"classrooms"}],"data_rows":DATA_ROWS_PLACEHOLDERS["cards"],"data_columns":["lessonid","period","days","weeks","classroomids"]},
+                    {"id":"ttreports","def":{"id":"ttreports","name":"Сводки","item_name":"Сводки","icon":"/timetable/pics/app/print_preview_32.png"},"cdefs":[{"id":"typ","type":"int","name":"typ"},{"id":"fitwidth","type":"checkbox","name":"Устан. ширину в одну страницу"},{"id":"fitheight","type":"checkbox","name":"Устан. высоту в одну страницу"},{"id":"hideemptycolumns","type":"checkbox","name":"Скрыть пустые столбцы"},{"id":"hideemptyrows","type":"checkbox","name":"Скрыть пустые строки"},{"id":"headerwidth","type":"float","name":"headerwidth"},{"id":"headerheight","type":"float","name":"headerheight"},{"id":"cellwidth","type":"float","name":"cellwidth"},{"id":"cellheight","type":"float","name":"cellheight"},{"id":"page_tables","type":"enumarray","name":"Печатать одну страницу для"},{"id":"row_tables","type":"enumarray","name":"Строки"},{"id":"column_tables","type":"enumarray","name":"Столбцы"},{"id":"celltype","type":"intcombo","name":"Ячейки"},{"id":"cardcolorenabled","type":"checkbox","name":"Цветная печать"},{"id":"cardcolortable1","type":"enum","name":"cardcolortable1"},{"id":"cardcolortable2","type":"enum","name":"cardcolortable2"},{"id":"cardcolorpos","name":"cardcolorpos"},{"id":"cardstyles","type":"subarray","name":"Карточки - Стиль","subcolumns":[{"id":"m_nDlzka","type":"int","name":"m_nDlzka"},{"id":"m_nPocetRiadkov","type":"int","name":"m_nPocetRiadkov"},{"id":"m_nBezTriedyAleboUcitela","type":"int","name":"m_nBezTriedyAleboUcitela"},{"id":"texts","type":"subdata","name":"texts","subcolumns":[{"id":"enabled","type":"checkbox","name":"enabled"},{"id":"pos","type":"int","name":"pos"},{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"autohide","type":"checkbox","name":"autohide"},{"id":"name_col","type":"string","name":"name_col"}]}]},{"id":"classroomsupervisionstyle","type":"subobject","name":"classroomsupervisionstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"}]},{"id":"gridheadertexts","type":"subdata","name":"Название - Стиль","subcolumns":[{"id":"enabled","type":"boolean_or_None","name":"enabled"},{"id":"pos","type":"int","name":"pos"},{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"column","type":"string","name":"column"}]},{"id":"pageheader","type":"subobject","name":"Название","subcolumns":[{"id":"font","type":"string","name":"Шрифт"},{"id":"size","type":"float","name":"Размер"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"}]},{"id":"pageheaderprefixenabled","type":"checkbox","name":"Печатать префикс"},{"id":"userheader","type":"subobject","name":"userheader","subcolumns":[{"id":"text","type":"string","name":"text"},{"id":"font","type":"string","name":"Шрифт"},{"id":"size","type":"float","name":"Размер"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"}]},{"id":"settings","name":"settings"},{"id":"landscape","type":"checkbox","name":"landscape"},{"id":"repeatpage","type":"int","name":"repeatpage"},{"id":"splitpage_h","type":"int","name":"splitpage_h"},{"id":"splitpage_w","type":"int","name":"splitpage_w"},{"id":"withclassroomtt","type":"checkbox","name":"withclassroomtt"},{"id":"printlogo","type":"checkbox","name":"printlogo"},{"id":"name","type":"string","name":"Название"},{"id":"extracolumns","type":"subarray","name":"Дополнительные столбцы","subcolumns":[{"id":"typ","type":"combo","name":"typ"},{"id":"name","type":"string","name":"Название"},{"id":"size","type":"int","name":"Размер"},{"id":"headerstyle","type":"subobject","name":"headerstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"vertical","type":"checkbox","name":"vertical"}]},{"id":"cellstyle","type":"subobject","name":"cellstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"vertical","type":"checkbox","name":"vertical"}]}]},{"id":"extrarows","type":"subarray","name":"Дополнительные строки","subcolumns":[{"id":"typ","type":"combo","name":"typ"},{"id":"name","type":"string","name":"Название"},{"id":"size","type":"int","name":"Размер"},{"id":"headerstyle","type":"subobject","name":"headerstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"vertical","type":"checkbox","name":"vertical"}]},{"id":"cellstyle","type":"subobject","name":"cellstyle","subcolumns":[{"id":"size","type":"float","name":"Размер"},{"id":"font","type":"string","name":"Шрифт"},{"id":"bold","type":"checkbox","name":"Жирный шрифт"},{"id":"italic","type":"checkbox","name":"Курсив"},{"id":"underline","type":"checkbox","name":"Подчеркнутый шрифт"},{"id":"vertical","type":"checkbox","name":"vertical"}]}]}],"data_rows":[{"id":"*25","typ":0,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["classes"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивидуальные расписания классов","extracolumns":[],"extrarows":[]},{"id":"*26","typ":1,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["teachers"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивидуальные расписания учителей","extracolumns":[],"extrarows":[]},{"id":"*27","typ":2,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["students"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивидуальные расписания учащихся","extracolumns":[],"extrarows":[]},{"id":"*28","typ":3,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["classrooms"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивидуальные расписания кабинетов","extracolumns":[],"extrarows":[]},{"id":"*29","typ":4,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["subjects"],"row_tables":["days"],"column_tables":["periods"],"celltype":1,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"left","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":8,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":True,"pos":2,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Отдельные расписания для предметов","extracolumns":[],"extrarows":[]},{"id":"*30","typ":5,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classes"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.15,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание классов","extracolumns":[],"extrarows":[]},{"id":"*31","typ":6,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["teachers"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.15,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание учителей","extracolumns":[],"extrarows":[]},{"id":"*32","typ":7,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classrooms"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание кабинетов","extracolumns":[],"extrarows":[]},{"id":"*33","typ":8,"fitwidth":False,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classes"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Расписание классов (настенный плакат)","extracolumns":[],"extrarows":[]},{"id":"*34","typ":9,"fitwidth":False,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["teachers"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Расписание учителей (настенный плакат)","extracolumns":[],"extrarows":[]},{"id":"*35","typ":10,"fitwidth":False,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classrooms"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Расписание кабинетов (настенный плакат)","extracolumns":[],"extrarows":[]},{"id":"*36","typ":15,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["classes"],"column_tables":["subjects"],"celltype":2,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"left","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":True,"pos":8,"size":0.5,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Сетка уроков","extracolumns":[],"extrarows":[]},{"id":"*37","typ":17,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["students"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание учащихся","extracolumns":[],"extrarows":[]},{"id":"*38","typ":18,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["subjects"],"column_tables":["days","periods"],"celltype":1,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"left","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":4,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":True,"pos":2,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Общее расписание предметов","extracolumns":[],"extrarows":[]},{"id":"*39","typ":19,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["classes"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Создан пользователем 1","extracolumns":[],"extrarows":[]},{"id":"*40","typ":20,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["teachers"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Создан пользователем 2","extracolumns":[],"extrarows":[]},{"id":"*41","typ":21,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["teachers"],"column_tables":["days","periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Создан пользователем 3","extracolumns":[],"extrarows":[]},{"id":"*42","typ":22,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.05,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["classes"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.15,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":True,"pos":4,"size":0.08,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":3,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.08,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":7,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивид. расписания классов - с таблицей","extracolumns":[],"extrarows":[]},{"id":"*43","typ":23,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.05,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["teachers"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":7,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Индивид. расписания учителей - с таблицей","extracolumns":[],"extrarows":[]},{"id":"*44","typ":24,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["teachers"],"row_tables":["days"],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":1,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":True,"pos":2,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"groupnames":{"enabled":True,"pos":5,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":7,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Расписание каждого учителя - дополнительно","extracolumns":[],"extrarows":[]},{"id":"*45","typ":25,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":[],"row_tables":["teachers"],"column_tables":["subjects"],"celltype":3,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"left","cardstyles":[{"texts":{"subjects":{"enabled":False,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":True,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":True,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Печать нагрузки учителей","extracolumns":[],"extrarows":[]},{"id":"*46","typ":26,"fitwidth":True,"fitheight":True,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.1,"headerheight":0.1,"cellwidth":0.1,"cellheight":0.1,"page_tables":["days","classes"],"row_tables":[],"column_tables":["periods"],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":True,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":None,"enabled":None}},"pageheader":{"size":0.071429,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.033333,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":False,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Daily attendance","extracolumns":[],"extrarows":[]},{"id":"*47","typ":27,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.25,"headerheight":0.07,"cellwidth":0.1,"cellheight":0.04,"page_tables":[],"row_tables":["teachers"],"column_tables":[],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":False,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Список учителей","extracolumns":[],"extrarows":[]},{"id":"*48","typ":28,"fitwidth":True,"fitheight":False,"hideemptycolumns":False,"hideemptyrows":False,"headerwidth":0.25,"headerheight":0.07,"cellwidth":0.1,"cellheight":0.04,"page_tables":[],"row_tables":["classes"],"column_tables":[],"celltype":0,"cardcolorenabled":False,"cardcolortable1":"","cardcolortable2":"","cardcolorpos":"","cardstyles":[{"texts":{"subjects":{"enabled":True,"pos":0,"size":0.26,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"teachers":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"name_col":"","autohide":False},"classrooms":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"groupnames":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":True,"name_col":""},"classes":{"enabled":False,"pos":0,"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"count":{"enabled":False,"pos":0,"size":0.2,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""},"time":{"enabled":False,"pos":0,"size":0.06,"font":"Arial","bold":False,"italic":False,"underline":False,"autohide":False,"name_col":""}},"m_nDlzka":0,"m_nPocetRiadkov":0,"m_nBezTriedyAleboUcitela":1}],"classroomsupervisionstyle":{"size":0.1,"font":"Arial","bold":False,"italic":False,"underline":False},"gridheadertexts":{"days":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"name","pos":7,"enabled":None},"periods":{"size":0.33,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":0,"enabled":None,"column":""},"time":{"enabled":False,"size":0.14,"font":"Arial","bold":False,"italic":False,"underline":False,"pos":5,"column":""},"objects":{"size":0.4,"font":"Arial","bold":False,"italic":False,"underline":False,"column":"short","pos":7,"enabled":None}},"pageheader":{"size":0.033333,"font":"Arial","bold":False,"italic":False,"underline":False},"pageheaderprefixenabled":True,"userheader":{"text":"","font":"Arial","size":0.02,"bold":False,"italic":False,"underline":False},"settings":{"m_nSirkaCiaryLesson":1,"m_nSirkaCiaryOkraj":1,"m_nSirkaCiaryDen":1},"landscape":False,"repeatpage":1,"splitpage_h":1,"splitpage_w":1,"withclassroomtt":False,"printlogo":False,"name":"Список классов","extracolumns":[],"extrarows":[]}],"data_columns":["typ","fitwidth","fitheight","hideemptycolumns","hideemptyrows","headerwidth","headerheight","cellwidth","cellheight","page_tables","row_tables","column_tables","celltype","cardcolorenabled","cardcolortable1","cardcolortable2","cardcolorpos","cardstyles","classroomsupervisionstyle","gridheadertexts","pageheader","pageheaderprefixenabled","userheader","settings","landscape","repeatpage","splitpage_h","splitpage_w","withclassroomtt","printlogo","name","extracolumns","extrarows"]},
+                    {"id":"classroomsupervisions","def":{"id":"classroomsupervisions","name":"Надсмотры","item_name":"Надсмотр","icon":"/timetable/pics/app/views/supervisions.png"},"cdefs":[{"id":"classroomid","type":"tableid","name":"Кабинет","table":"classrooms"},{"id":"teacherid","type":"tableid","name":"Учитель","table":"teachers"},{"id":"day","name":"day"},{"id":"week","name":"week"},{"id":"term","name":"term"},{"id":"period","type":"tableid","name":"Период","table":"periods"},{"id":"break","type":"tableid","name":"перемена","table":"breaks"},{"id":"locked","type":"checkbox","name":"Запертый"},{"id":"weeks","name":"weeks"}],"data_rows":[],"data_columns":["classroomid","teacherid","day","week","term","period","break","locked","weeks"]},
+                    {"id":"coursegroups","def":{"id":"coursegroups","name":"Группы семинаров","item_name":"Группа семинара","icon":"/timetable/pics/app/office/sectiongroups_32.svg"},"cdefs":[{"id":"name","type":"string","name":"Название"}],"data_rows":[],"data_columns":["name"]}
+                ]
+            }
+        }
+    }
+
+def get_skeleton_chunks(timetable_number: str, json_indent: Optional[int], encoding: str, json_encoder: JSONEncoder) -> T_SKELETON_CHUNKS:
+    cache_key: Tuple[str, Optional[int], str, str] = (timetable_number, json_indent, encoding, json_encoder.name)
+
+    skeleton_chunks: Optional[T_SKELETON_CHUNKS] = _skeleton_chunks_cache.get(cache_key)
+
+    if skeleton_chunks is not None:
+        return skeleton_chunks
+
+    datas_module = import_datas_module(
+        timetable_number = timetable_number
+    )
+
+    skeleton_json: str = json_encoder.dumps(
+        obj = build_timetable_skeleton(
+            periods = datas_module.periods,
+            daysdefs = datas_module.daysdefs
+        ),
+        json_indent = json_indent,
+        encoding = encoding
+    ).decode(encoding)
+
+    placeholders_table_ids: Dict[str, str] = {
+        json_encoder.dumps(
+            obj = placeholder,
+            json_indent = None,
+            encoding = encoding
+        ).decode(encoding): table_id
+        for table_id, placeholder in DATA_ROWS_PLACEHOLDERS.items()
+    }
+
+    skeleton_chunks = []
+
+    position: int = 0
+
+    for placeholder_position, placeholder_json in sorted([
+        (skeleton_json.index(placeholder_json), placeholder_json)
+        for placeholder_json in placeholders_table_ids
+    ]):
+        line_start: int = skeleton_json.rfind("\n", 0, placeholder_position) + 1
+        line: str = skeleton_json[line_start:placeholder_position]
+
+        skeleton_chunks.append(skeleton_json[position:placeholder_position].encode(encoding))
+        skeleton_chunks.append((
+            placeholders_table_ids[placeholder_json],
+            line[:len(line) - len(line.lstrip(" "))]
+        ))
+
+        position = placeholder_position + len(placeholder_json)
+
+    skeleton_chunks.append(skeleton_json[position:].encode(encoding))
+
+    _skeleton_chunks_cache[cache_key] = skeleton_chunks
+
+    return skeleton_chunks
+
+
+def iter_data_rows_json(data_rows: Iterable[dict], json_indent: Optional[int], line_prefix: str, encoding: str, json_encoder: JSONEncoder) -> Iterator[bytes]:
+    """
+    Encodes `data_rows` batch by batch, byte-identical to encoding the whole skeleton at once
+    """
+
+    data_rows_iterator: Iterator[dict] = iter(data_rows)
+
+    line_break: bytes = "\n".encode(encoding)
+    nested_line_break: bytes = ("\n" + line_prefix).encode(encoding)
+
+    opening_separator: bytes = "[".encode(encoding)
+    items_separator: bytes = (
+        json_encoder.compact_items_separator
+        if json_indent is None
+        else
+        ","
+    ).encode(encoding)
+
+    separator: bytes = opening_separator
+
+    while True:
+        data_rows_batch: List[dict] = list(islice(data_rows_iterator, DATA_ROWS_BATCH_SIZE))
+
+        if not data_rows_batch:
+            break
+
+        data_rows_json: bytes = json_encoder.dumps(
+            obj = data_rows_batch,
+            json_indent = json_indent,
+            encoding = encoding
+        )
+
+        if json_indent is None:
+            # "[row, row]" -> "row, row"
+            data_rows_json = data_rows_json[1:-1]
+
+        else:
+            # "[\n  row,\n  row\n]" -> "\n  row,\n  row", then nested into the skeleton's line
+            data_rows_json = data_rows_json[1:-2].replace(line_break, nested_line_break)
+
+        yield separator + data_rows_json
+
+        separator = items_separator
+
+    if separator is opening_separator:
+        yield "[]".encode(encoding)
+
+    elif json_indent is None:
+        yield "]".encode(encoding)
+
+    else:
+        yield nested_line_break + "]".encode(encoding)
@@ -1,8 +1,10 @@
 from re import Pattern as RePattern, compile as regex_compile
 from itertools import chain as itertools_chain
 from random import randint
+from hashlib import blake2b
+from types import ModuleType
 
-from typing import List, Dict, Tuple, Any, Union
+from typing import List, Dict, Tuple, Any, Union, Optional
 
 
 digit_6_re: RePattern = regex_compile(r"^\d{6}$")
@@ -10,6 +12,25 @@ digit_3_dot_3_re: RePattern = regex_compile(r"^\d{3}\.\d{3}$")
 letters_re: RePattern = regex_compile(r"^[A-Z]+")
 
 
+# Period, days definition ID and days of a lesson in a sheet column
+T_COLUMN_SLOT = Tuple[str, str, str]
+
+
+_column_slots_cache: Dict[Tuple[str, int], List[Optional[T_COLUMN_SLOT]]] = {}
+
+
+def import_datas_module(timetable_number: str) -> ModuleType:
+    return __import__(
+        "edu_xlsx.datas_{timetable_number}".format(
+            timetable_number = timetable_number
+        ),
+        fromlist = [
+            "periods",
+            "daysdefs"
+        ]
+    )
+
+
 def table_to_dict_id_obj(table: List[object]) -> Dict[str, object]:
     return {
         item_data.id: item_data
@@ -113,8 +134,12 @@ def build_groups(classids: List[str]) -> List[Tuple[dict, dict, dict]]:
     return results
 
 
-def generate_hex_color() -> str:
-    return ("#%06x" % randint(0, 0xFFFFFF)).upper()
+def generate_hex_color(seed: Optional[str]=None) -> str:
+    if seed is None:
+        return ("#%06x" % randint(0, 0xFFFFFF)).upper()
+
+    # Same seed always gives the same color, so identical inputs give identical outputs
+    return "#" + blake2b(seed.encode("utf-8"), digest_size=3).hexdigest().upper()
 
 
 def get_short_first_chars(string: str) -> str:
@@ -170,16 +195,54 @@ def parse_classroom_names(classroom_names_str: Union[str, int]) -> List[str]:
 
 
 def parse_coordinate_ord(coordinate: str) -> int:
-    coordinate_letters: str = letters_re.match(
+    # 64 + column index: "B2" -> 66, "AA2" -> 91, "BA2" -> 117
+    column_index: int = 0
+
+    for letter in letters_re.match(
         string = coordinate
-    ).group(0)
+    ).group(0):
+        column_index = column_index * 26 + ord(letter) - 64
 
-    return ord((
-        "Z"
-        if coordinate_letters[0] == "A" and len(coordinate_letters) > 1
-        else
-        coordinate_letters[0]
-    )) + sum([
-        ord(letter) - 64
-        for letter in coordinate_letters[1:]
-    ])
+    return 64 + column_index
+
+
+def build_column_slots(periods_len: int, daysdefs: List[dict], max_column: int) -> List[Optional[T_COLUMN_SLOT]]:
+    """
+    Slots indexed by column: lessons start from column "B" (2), `periods_len` columns a day.
+    Columns beyond the last days definition have no slot
+    """
+
+    column_slots: List[Optional[T_COLUMN_SLOT]] = [None] * (max_column + 1)
+
+    for column in range(2, max_column + 1):
+        daysdef_id_num: int = (column + periods_len - 2) // periods_len
+
+        if daysdef_id_num > len(daysdefs):
+            break
+
+        column_slots[column] = (
+            str((column - 1) % periods_len or periods_len),
+            "*{}".format(daysdef_id_num),
+            daysdefs[daysdef_id_num - 1]["days"]
+        )
+
+    return column_slots
+
+
+def get_column_slots(timetable_number: str, max_column: int) -> List[Optional[T_COLUMN_SLOT]]:
+    cache_key: Tuple[str, int] = (timetable_number, max_column)
+
+    column_slots: Optional[List[Optional[T_COLUMN_SLOT]]] = _column_slots_cache.get(cache_key)
+
+    if column_slots is None:
+        datas_module: ModuleType = import_datas_module(
+            timetable_number = timetable_number
+        )
+
+        column_slots = _column_slots_cache[cache_key] = build_column_slots(
+            periods_len = len(datas_module.periods),
+            daysdefs = datas_module.daysdefs,
+            max_column = max_column
+        )
+
+    return column_slots
@@ -0,0 +1,378 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from hashlib import blake2b
+from select import select
+from time import monotonic, sleep
+from struct import Struct
+from glob import has_magic
+
+import ctypes
+import ctypes.util
+import os
+import sys
+import warnings
+
+from .batch import is_xlsx_filename, find_output_conflicts, get_failed_result, convert
+
+from typing import List, Dict, Tuple, Set, Callable, Any, Optional
+
+
+IN_MODIFY: int = 0x00000002
+IN_CLOSE_WRITE: int = 0x00000008
+IN_MOVED_TO: int = 0x00000080
+IN_CREATE: int = 0x00000100
+IN_DELETE: int = 0x00000200
+
+WATCH_MASK: int = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event: int wd, uint32_t mask, uint32_t cookie, uint32_t len, then `len` bytes of name
+INOTIFY_EVENT_STRUCT: Struct = Struct("iIII")
+
+DEFAULT_DEBOUNCE: float = 0.5
+DEFAULT_POLL_INTERVAL: float = 1.0
+
+
+T_JOBS_GETTER = Callable[[], List[Tuple[Path, Path]]]
+
+
+def get_input_dirs(inputs: List[str]) -> List[Path]:
+    """
+    Directories to watch for inputs that don't match any file yet: a directory itself,
+    a glob pattern's fixed part ("timetables" of "timetables/*/*.xlsx") or a file's parent
+    """
+
+    input_dirs: List[Path] = []
+
+    for input in inputs:
+        path: Path = Path(input)
+
+        if has_magic(input):
+            while has_magic(str(path)):
+                path = path.parent
+
+        elif not path.is_dir():
+            path = path.parent
+
+        input_dirs.append(path)
+
+    return input_dirs
+
+
+def get_content_hash(xlsx_filepath: Path) -> Optional[str]:
+    try:
+        return blake2b(xlsx_filepath.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class Watcher(ABC):
+    """
+    Waits for changes of the workbooks returned by `get_jobs`, which is called again
+    on every check, so new files in watched directories and glob patterns are picked up
+    """
+
+    def __init__(self, get_jobs: T_JOBS_GETTER) -> None:
+        self.get_jobs: T_JOBS_GETTER = get_jobs
+
+    @abstractmethod
+    def wait(self, timeout: Optional[float]=None) -> bool:
+        """
+        Returns `True` on a change, `False` when nothing changed in `timeout` seconds
+        """
+
+    def close(self) -> None:
+        pass
+
+
+class PollingWatcher(Watcher):
+    def __init__(self, get_jobs: T_JOBS_GETTER, poll_interval: float=DEFAULT_POLL_INTERVAL) -> None:
+        super().__init__(
+            get_jobs = get_jobs
+        )
+
+        self.poll_interval: float = poll_interval
+
+        self._snapshot: Dict[Path, Tuple[int, int]] = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+
+        for xlsx_filepath, _ in self.get_jobs():
+            try:
+                stat_result: os.stat_result = xlsx_filepath.stat()
+            except OSError:
+                continue
+
+            snapshot[xlsx_filepath] = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        return snapshot
+
+    def wait(self, timeout: Optional[float]=None) -> bool:
+        deadline: Optional[float] = (
+            None
+            if timeout is None
+            else
+            monotonic() + timeout
+        )
+
+        while True:
+            sleep_time: float = self.poll_interval
+
+            if deadline is not None:
+                sleep_time = min(sleep_time, deadline - monotonic())
+
+                if sleep_time <= 0:
+                    return False
+
+            sleep(sleep_time)
+
+            snapshot: Dict[Path, Tuple[int, int]] = self._take_snapshot()
+
+            if snapshot != self._snapshot:
+                self._snapshot = snapshot
+                return True
+
+
+class InotifyWatcher(Watcher):
+    """
+    Linux inotify through ctypes, watches directories of the workbooks,
+    as editors and uploads often replace a file instead of writing into it.
+    Raises `OSError` when inotify fails, a directory that can't be watched included
+    """
+
+    def __init__(self, get_jobs: T_JOBS_GETTER, input_dirs: Optional[List[Path]]=None) -> None:
+        super().__init__(
+            get_jobs = get_jobs
+        )
+
+        self.input_dirs: List[Path] = input_dirs or []
+
+        self._libc: ctypes.CDLL = self._load_libc()
+
+        self._fd: int = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._watched_dirs: Set[Path] = set()
+
+        try:
+            self._update_watches()
+
+        except OSError:
+            self.close()
+            raise
+
+    @staticmethod
+    def _load_libc() -> ctypes.CDLL:
+        libc: ctypes.CDLL = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6",
+            use_errno = True
+        )
+
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        return libc
+
+    @classmethod
+    def is_available(cls) -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+
+        try:
+            cls._load_libc()
+        except (OSError, AttributeError):
+            return False
+
+        return True
+
+    def _update_watches(self) -> None:
+        for watched_dir in self.input_dirs + [
+            xlsx_filepath.parent
+            for xlsx_filepath, _ in self.get_jobs()
+        ]:
+            watched_dir = watched_dir.resolve()
+
+            if watched_dir in self._watched_dirs:
+                continue
+
+            # A missing directory too, its creation wouldn't be seen
+            if self._libc.inotify_add_watch(self._fd, os.fsencode(watched_dir), WATCH_MASK) < 0:
+                raise OSError(ctypes.get_errno(), "inotify_add_watch failed", str(watched_dir))
+
+            self._watched_dirs.add(watched_dir)
+
+    def _read_events(self) -> bool:
+        changed: bool = False
+
+        while True:
+            try:
+                data: bytes = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+
+            offset: int = 0
+
+            while offset < len(data):
+                _, _, _, name_length = INOTIFY_EVENT_STRUCT.unpack_from(data, offset)
+                offset += INOTIFY_EVENT_STRUCT.size
+
+                name: str = os.fsdecode(data[offset:offset + name_length].rstrip(b"\0"))
+                offset += name_length
+
+                if is_xlsx_filename(name):
+                    changed = True
+
+        return changed
+
+    def wait(self, timeout: Optional[float]=None) -> bool:
+        deadline: Optional[float] = (
+            None
+            if timeout is None
+            else
+            monotonic() + timeout
+        )
+
+        while True:
+            select_timeout: Optional[float] = (
+                None
+                if deadline is None
+                else
+                max(deadline - monotonic(), 0)
+            )
+
+            if not select([self._fd], [], [], select_timeout)[0]:
+                return False
+
+            if self._read_events():
+                # Files matching a glob may appear in new directories
+                self._update_watches()
+
+                return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def warn_polling(exception: OSError) -> None:
+    warnings.warn(
+        "Watching with stat polling, inotify failed: {exception}".format(
+            exception = exception
+        ),
+        RuntimeWarning,
+        stacklevel = 3
+    )
+
+
+def create_watcher(get_jobs: T_JOBS_GETTER, input_dirs: Optional[List[Path]]=None, poll_interval: float=DEFAULT_POLL_INTERVAL, polling: bool=False) -> Watcher:
+    """
+    inotify watcher where it's available and works (its instances and watches are limited),
+    stat polling otherwise
+    """
+
+    if not polling and InotifyWatcher.is_available():
+        try:
+            return InotifyWatcher(
+                get_jobs = get_jobs,
+                input_dirs = input_dirs
+            )
+
+        except OSError as exception:
+            warn_polling(exception)
+
+    return PollingWatcher(
+        get_jobs = get_jobs,
+        poll_interval = poll_interval
+    )
+
+
+def convert_changed(jobs: List[Tuple[Path, Path]], options: Dict[str, Any], content_hashes: Dict[Path, str]) -> List[Dict[str, Any]]:
+    """
+    Converts workbooks whose content hash differs from the last successful conversion.
+    Jobs sharing an output file fail without converting
+    """
+
+    results: List[Dict[str, Any]] = []
+
+    output_conflicts: Dict[int, str] = find_output_conflicts(jobs)
+
+    for i, (xlsx_filepath, json_filepath) in enumerate(jobs):
+        if i in output_conflicts:
+            results.append(get_failed_result(
+                xlsx_filepath = xlsx_filepath,
+                json_filepath = json_filepath,
+                error = output_conflicts[i]
+            ))
+
+            continue
+
+        content_hash: Optional[str] = get_content_hash(xlsx_filepath)
+
+        if content_hash is None or content_hashes.get(xlsx_filepath) == content_hash:
+            continue
+
+        result: Dict[str, Any] = convert(
+            xlsx_filepath = xlsx_filepath,
+            json_filepath = json_filepath,
+            options = options
+        )
+
+        # Failed one is tried again on the next change
+        if not result["error"]:
+            content_hashes[xlsx_filepath] = content_hash
+
+        results.append(result)
+
+    return results
+
+
+def watch(get_jobs: T_JOBS_GETTER, options: Dict[str, Any], on_results: Callable[[List[Dict[str, Any]]], None], input_dirs: Optional[List[Path]]=None, debounce: float=DEFAULT_DEBOUNCE, poll_interval: float=DEFAULT_POLL_INTERVAL, polling: bool=False) -> None:
+    """
+    Converts the workbooks, then converts them again on every change until interrupted.
+    A burst of changes is converted once, after `debounce` seconds without changes.
+    If inotify fails, watching goes on with stat polling
+    """
+
+    watcher: Watcher = create_watcher(
+        get_jobs = get_jobs,
+        input_dirs = input_dirs,
+        poll_interval = poll_interval,
+        polling = polling
+    )
+
+    content_hashes: Dict[Path, str] = {}
+
+    try:
+        while True:
+            results: List[Dict[str, Any]] = convert_changed(
+                jobs = get_jobs(),
+                options = options,
+                content_hashes = content_hashes
+            )
+
+            if results:
+                on_results(results)
+
+            try:
+                watcher.wait()
+
+                while watcher.wait(debounce):
+                    pass
+
+            # New directories of glob matches may be over the watches limit
+            except OSError as exception:
+                if not isinstance(watcher, InotifyWatcher):
+                    raise
+
+                warn_polling(exception)
+
+                watcher.close()
+
+                watcher = PollingWatcher(
+                    get_jobs = get_jobs,
+                    poll_interval = poll_interval
+                )
+
+    finally:
+        watcher.close()
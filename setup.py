@@ -31,7 +31,12 @@ setup(
     license = "MIT",
     author = "Aryn Yklas",
     author_email = "arynyklas@gmail.com",
-    packages = find_packages(),
+    packages = find_packages(
+        exclude = [
+            "benchmarks",
+            "benchmarks.*"
+        ]
+    ),
     python_requires = ">=3.7",
     install_requires = (WORK_DIR / "requirements.txt").read_text(ENCODING).strip().split("\n"),
     include_package_data = False
@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import pytest
+
+from typing import List, Dict, Tuple, Callable, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from openpyxl.worksheet.worksheet import Worksheet
+
+    from edu_xlsx.parser import XLSXParser
+
+
+EXAMPLE_XLSX_FILEPATH: Path = Path(__file__).parent.parent / "timetable_examples" / "input_timetable.xlsx"
+EXAMPLE_TIMETABLE_NUMBER: str = "1"
+
+
+def parse_example(xlsx_filepath: Path=EXAMPLE_XLSX_FILEPATH, **kwargs: Any) -> "XLSXParser":
+    from edu_xlsx.parser import XLSXParser
+
+    xlsx_parser: XLSXParser = XLSXParser(
+        xlsx_filepath = xlsx_filepath,
+        timetable_number = EXAMPLE_TIMETABLE_NUMBER,
+        **kwargs
+    )
+
+    try:
+        xlsx_parser.parse()
+
+    finally:
+        xlsx_parser.close()
+
+    return xlsx_parser
+
+
+def write_example(xlsx_filepath: Path, edit: Optional[Callable[["Worksheet"], None]]=None) -> Path:
+    """
+    Saves the example workbook to `xlsx_filepath`, with its sheet changed by `edit`
+    """
+
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(
+        filename = EXAMPLE_XLSX_FILEPATH
+    )
+
+    if edit is not None:
+        edit(workbook.worksheets[0])
+
+    workbook.save(xlsx_filepath)
+    workbook.close()
+
+    return xlsx_filepath
+
+
+def get_timetable_by_names(xlsx_parser: "XLSXParser") -> Dict[str, List[Any]]:
+    """
+    Parsed registries and lessons by names, which don't depend on the IDs given by parsing
+    """
+
+    names_from_id: Dict[str, Dict[str, str]] = {
+        "subjects": {
+            subject.id: subject.name
+            for subject in xlsx_parser._subjects
+        },
+        "classrooms": {
+            classroom.id: classroom.name
+            for classroom in xlsx_parser._classrooms
+        },
+        "teachers": {
+            teacher.id: teacher.short
+            for teacher in xlsx_parser._teachers
+        },
+        "classes": {
+            class_.id: class_.name
+            for class_ in xlsx_parser._classes
+        }
+    }
+
+    lessons: List[Tuple[Any, ...]] = []
+
+    for card in xlsx_parser._cards:
+        lesson = xlsx_parser._lessons_from_id[card.lessonid]
+
+        lessons.append((
+            names_from_id["subjects"][lesson.subjectid],
+            tuple([names_from_id["teachers"].get(teacherid, "") for teacherid in lesson.teacherids]),
+            tuple([names_from_id["classes"][classid] for classid in lesson.classids]),
+            tuple([names_from_id["classrooms"][classroomid] for classroomid in card.classroomids]),
+            card.period,
+            card.days
+        ))
+
+    timetable: Dict[str, List[Any]] = {
+        registry_name: sorted(names.values())
+        for registry_name, names in names_from_id.items()
+    }
+
+    timetable["lessons"] = sorted(lessons)
+
+    return timetable
+
+
+@pytest.fixture(scope="session")
+def example_parser() -> "XLSXParser":
+    return parse_example()
@@ -0,0 +1,121 @@
+from pathlib import Path
+from io import BytesIO
+from shutil import copyfile
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import asyncio
+
+import pytest
+
+from conftest import EXAMPLE_XLSX_FILEPATH, EXAMPLE_TIMETABLE_NUMBER, write_example
+
+from edu_xlsx import aio
+from edu_xlsx.aio import AsyncXLSXParser, parse_async
+from edu_xlsx.parser import XLSXParser
+
+from typing import List, Any
+
+
+def get_json(xlsx_parser: XLSXParser) -> bytes:
+    return b"".join(xlsx_parser.iter_json(json_encoder="json"))
+
+
+@pytest.mark.parametrize("get_input", [
+    lambda: EXAMPLE_XLSX_FILEPATH,
+    lambda: EXAMPLE_XLSX_FILEPATH.read_bytes(),
+    lambda: BytesIO(EXAMPLE_XLSX_FILEPATH.read_bytes())
+])
+def test_parse_async(example_parser: XLSXParser, get_input: Any) -> None:
+    xlsx_parser: XLSXParser = asyncio.run(parse_async(
+        xlsx_filepath = get_input(),
+        timetable_number = EXAMPLE_TIMETABLE_NUMBER
+    ))
+
+    assert get_json(xlsx_parser) == get_json(example_parser)
+
+
+def test_save_before_parse(tmp_path: Path) -> None:
+    for xlsx_input in [BytesIO(EXAMPLE_XLSX_FILEPATH.read_bytes()), EXAMPLE_XLSX_FILEPATH]:
+        async_xlsx_parser: AsyncXLSXParser = AsyncXLSXParser(
+            xlsx_filepath = xlsx_input,
+            timetable_number = EXAMPLE_TIMETABLE_NUMBER
+        )
+
+        with pytest.raises(ValueError, match="must be parsed first"):
+            asyncio.run(async_xlsx_parser.save(tmp_path / "school_1.json"))
+
+
+@pytest.mark.parametrize("started", [False, True])
+def test_cancelled_parse_keeps_state(tmp_path: Path, monkeypatch, started: bool) -> None:
+    """
+    A cancelled incremental parse of an edited file, queued or already running in a thread,
+    leaves the parsed timetable as it was
+    """
+
+    xlsx_filepath: Path = tmp_path / "school_1.xlsx"
+    copyfile(EXAMPLE_XLSX_FILEPATH, xlsx_filepath)
+
+    edited_xlsx_filepath: Path = write_example(
+        tmp_path / "edited.xlsx",
+        lambda sheet: setattr(sheet.cell(5, 2), "value", "Новый предмет")
+    )
+
+    worker_started: Event = Event()
+    worker_released: Event = Event()
+
+    parse_state = aio.parse_state
+
+    def blocked_parse_state(*args: Any, **kwargs: Any) -> Any:
+        worker_started.set()
+        worker_released.wait()
+
+        return parse_state(*args, **kwargs)
+
+    async def main(executor: ThreadPoolExecutor) -> None:
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(1)
+
+        async_xlsx_parser: AsyncXLSXParser = AsyncXLSXParser(
+            xlsx_filepath = xlsx_filepath,
+            timetable_number = EXAMPLE_TIMETABLE_NUMBER,
+            executor = executor,
+            semaphore = semaphore
+        )
+
+        await async_xlsx_parser.parse(incremental=True)
+
+        xlsx_parser: XLSXParser = async_xlsx_parser.parser
+        json_data: bytes = get_json(xlsx_parser)
+        lessons_ids: List[str] = [lesson.id for lesson in xlsx_parser._lessons]
+
+        copyfile(edited_xlsx_filepath, xlsx_filepath)
+        monkeypatch.setattr(aio, "parse_state", blocked_parse_state)
+
+        if not started:
+            # Queued behind another job
+            await semaphore.acquire()
+
+        task: asyncio.Task = asyncio.ensure_future(async_xlsx_parser.parse(incremental=True))
+
+        if started:
+            await asyncio.get_running_loop().run_in_executor(None, worker_started.wait)
+
+        else:
+            await asyncio.sleep(0.05)
+
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        worker_released.set()
+
+        # A started worker finishes and its result is thrown away
+        await asyncio.get_running_loop().run_in_executor(executor, lambda: None)
+
+        assert worker_started.is_set() is started
+        assert get_json(xlsx_parser) == json_data
+        assert [lesson.id for lesson in xlsx_parser._lessons] == lessons_ids
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        asyncio.run(main(executor))
@@ -0,0 +1,61 @@
+from pathlib import Path
+from shutil import copyfile
+
+from conftest import EXAMPLE_XLSX_FILEPATH
+
+from edu_xlsx.batch import DEFAULT_OUTPUT_TEMPLATE, get_timetable_number, collect_xlsx_filepaths, get_json_filepath, convert, convert_many
+from edu_xlsx.parser import XLSXParser
+
+from typing import List, Dict, Tuple, Any
+
+
+def test_get_timetable_number() -> None:
+    assert get_timetable_number(Path("school_1.xlsx")) == "1"
+    assert get_timetable_number(Path("Makefile")) == ""
+
+
+def test_glob_collects_only_workbooks(tmp_path: Path) -> None:
+    for name in ["school_1.xlsx", "~$school_1.xlsx", "Makefile", "notes.txt"]:
+        (tmp_path / name).write_bytes(b"")
+
+    xlsx_filepaths: List[Path] = collect_xlsx_filepaths([
+        str(tmp_path / "*")
+    ])
+
+    assert xlsx_filepaths == [tmp_path / "school_1.xlsx"]
+
+
+def test_shared_output_fails(tmp_path: Path) -> None:
+    jobs: List[Tuple[Path, Path]] = []
+
+    for parent in ["a", "b"]:
+        (tmp_path / parent).mkdir()
+        copyfile(EXAMPLE_XLSX_FILEPATH, tmp_path / parent / "x_1.xlsx")
+
+        jobs.append((tmp_path / parent / "x_1.xlsx", get_json_filepath(tmp_path / parent / "x_1.xlsx", tmp_path / "out", DEFAULT_OUTPUT_TEMPLATE)))
+
+    results: List[Dict[str, Any]] = convert_many(jobs, dict(no_cache=True), workers=2)
+
+    assert [result["input"] for result in results] == [xlsx_filepath for xlsx_filepath, _ in jobs]
+    assert all("must be of one input" in result["error"] for result in results)
+    assert not (tmp_path / "out").exists()
+
+
+def test_failed_convert_closes_parser(tmp_path: Path, monkeypatch) -> None:
+    closed_parsers: List[XLSXParser] = []
+
+    def close(xlsx_parser: XLSXParser) -> None:
+        closed_parsers.append(xlsx_parser)
+        parser_close(xlsx_parser)
+
+    parser_close = XLSXParser.close
+    monkeypatch.setattr(XLSXParser, "close", close)
+
+    xlsx_filepath: Path = tmp_path / "school_1.xlsx"
+    copyfile(EXAMPLE_XLSX_FILEPATH, xlsx_filepath)
+
+    # The example has conflicts
+    result: Dict[str, Any] = convert(xlsx_filepath, tmp_path / "school_1.json", dict(no_cache=True, check=True))
+
+    assert "conflicts" in result["error"]
+    assert closed_parsers
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from conftest import parse_example
+
+from edu_xlsx import cache
+from edu_xlsx.cache import ParseCache
+
+
+def test_key_depends_on_cache_format_version(monkeypatch) -> None:
+    key: str = ParseCache.get_key(b"xlsx", "1", ("pydantic", ))
+
+    monkeypatch.setattr(cache, "CACHE_FORMAT_VERSION", cache.CACHE_FORMAT_VERSION + 1)
+
+    assert ParseCache.get_key(b"xlsx", "1", ("pydantic", )) != key
+
+
+def test_cached_parse_matches(example_parser, tmp_path: Path) -> None:
+    parse_cache: ParseCache = ParseCache(
+        cache_dir = tmp_path
+    )
+
+    for _ in range(2):
+        xlsx_parser = parse_example(
+            cache = parse_cache
+        )
+
+        assert b"".join(xlsx_parser.iter_json(json_encoder="json")) == b"".join(example_parser.iter_json(json_encoder="json"))
+
+    assert (parse_cache.misses, parse_cache.hits) == (1, 1)
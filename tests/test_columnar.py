@@ -0,0 +1,37 @@
+import pytest
+
+from conftest import parse_example
+
+from edu_xlsx.parser import ENGINE_OPENPYXL, ENGINE_OOXML, MODELS_PYDANTIC, MODELS_LIGHT, STORE_COLUMNAR, XLSXParser
+
+from typing import Optional
+
+
+@pytest.mark.parametrize("json_indent", [None, 4])
+@pytest.mark.parametrize("models", [MODELS_PYDANTIC, MODELS_LIGHT])
+@pytest.mark.parametrize("engine", [ENGINE_OPENPYXL, ENGINE_OOXML])
+def test_columnar_json_matches_objects(example_parser, engine: str, models: str, json_indent: Optional[int]) -> None:
+    xlsx_parser: XLSXParser = parse_example(
+        engine = engine,
+        models = models,
+        store = STORE_COLUMNAR
+    )
+
+    assert b"".join(xlsx_parser.iter_json(
+        json_indent = json_indent,
+        json_encoder = "json"
+    )) == b"".join(example_parser.iter_json(
+        json_indent = json_indent,
+        json_encoder = "json"
+    ))
+
+
+def test_columnar_lookups_match_objects(example_parser) -> None:
+    xlsx_parser: XLSXParser = parse_example(
+        store = STORE_COLUMNAR
+    )
+
+    for lesson in example_parser._lessons:
+        assert xlsx_parser._lessons_from_id[lesson.id].dict() == lesson.dict()
+
+    assert [card.dict() for card in xlsx_parser._cards] == [card.dict() for card in example_parser._cards]
@@ -0,0 +1,38 @@
+from conftest import parse_example
+
+from edu_xlsx.conflicts import CONFLICT_CLASSROOM, find_conflicts
+
+from typing import List, Dict, Any
+
+
+def test_conflicts_have_distinct_cards(example_parser) -> None:
+    conflicts: List[Dict[str, Any]] = find_conflicts(example_parser)
+
+    assert conflicts
+
+    for conflict in conflicts:
+        assert len(set(conflict["cardids"])) == len(conflict["cardids"]) >= 2
+
+
+def test_repeated_classroom_is_not_a_conflict() -> None:
+    xlsx_parser = parse_example()
+
+    conflicting_cardids: List[str] = [
+        cardid
+        for conflict in find_conflicts(xlsx_parser)
+        for cardid in conflict["cardids"]
+    ]
+
+    card = next(
+        card
+        for card in xlsx_parser._cards
+        if card.classroomids and card.id not in conflicting_cardids
+    )
+
+    card.classroomids = card.classroomids * 2
+
+    assert not [
+        conflict
+        for conflict in find_conflicts(xlsx_parser)
+        if conflict["kind"] == CONFLICT_CLASSROOM and card.id in conflict["cardids"]
+    ]
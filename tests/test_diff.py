@@ -0,0 +1,97 @@
+from pathlib import Path
+
+from conftest import EXAMPLE_TIMETABLE_NUMBER, parse_example, write_example
+
+from edu_xlsx.diff import diff_timetables
+from edu_xlsx.parser import XLSXParser
+from edu_xlsx.utils import get_column_slots
+
+from typing import List, Dict, Any
+
+
+FIRST_CLASS_ROW: int = 5
+SECOND_CLASS_ROW: int = 9
+
+# Monday's periods 2-4 and 7 of the first class, the 8th period is free in both first classes
+TEACHER_COLUMN: int = 3
+CLASSROOM_COLUMN: int = 4
+REMOVED_COLUMN: int = 5
+MOVED_COLUMN: int = 8
+FREE_COLUMN: int = 9
+
+
+def edit_timetable(sheet: Any) -> None:
+    # Free periods are merged cells
+    for merged_cells_range in list(sheet.merged_cells.ranges):
+        if merged_cells_range.min_col == FREE_COLUMN and merged_cells_range.min_row in (FIRST_CLASS_ROW, SECOND_CLASS_ROW):
+            sheet.unmerge_cells(str(merged_cells_range))
+
+    sheet.cell(FIRST_CLASS_ROW + 3, TEACHER_COLUMN).value = "Новый учитель"
+    sheet.cell(FIRST_CLASS_ROW + 2, CLASSROOM_COLUMN).value = "999"
+
+    for row_offset in range(4):
+        sheet.cell(FIRST_CLASS_ROW + row_offset, REMOVED_COLUMN).value = None
+
+        sheet.cell(FIRST_CLASS_ROW + row_offset, FREE_COLUMN).value = sheet.cell(FIRST_CLASS_ROW + row_offset, MOVED_COLUMN).value
+        sheet.cell(FIRST_CLASS_ROW + row_offset, MOVED_COLUMN).value = None
+
+    for row_offset, value in enumerate(["Новый предмет", "8 Ә", "101", "Новый учитель"]):
+        sheet.cell(SECOND_CLASS_ROW + row_offset, FREE_COLUMN).value = value
+
+
+def get_slot(column: int) -> Dict[str, str]:
+    period, _, days = get_column_slots(EXAMPLE_TIMETABLE_NUMBER, column)[column]
+
+    return dict(
+        days = days,
+        period = period
+    )
+
+
+def test_diff(tmp_path: Path, example_parser: XLSXParser) -> None:
+    changes: Dict[str, List[Dict[str, Any]]] = diff_timetables(
+        old = example_parser,
+        new = parse_example(write_example(tmp_path / "edited_1.xlsx", edit_timetable))
+    )
+
+    assert changes == dict(
+        added = [
+            dict(class_name="8 Ә", **get_slot(FREE_COLUMN), subject="Новый предмет", teachers=["Новый учитель"], classrooms=["101"])
+        ],
+        removed = [
+            dict(class_name="8 А", **get_slot(REMOVED_COLUMN), subject="Шетел тілі", teachers=["Нәси А.Е.", "Исабекова Т.М."], classrooms=["318", "319"])
+        ],
+        moved = [
+            dict(
+                class_name = "8 А",
+                **get_slot(FREE_COLUMN),
+                subject = "Орыс тілі мен әдебиеті",
+                teachers = ["Карпыкбаева А.С."],
+                classrooms = ["520"],
+                old_days = get_slot(MOVED_COLUMN)["days"],
+                old_period = get_slot(MOVED_COLUMN)["period"],
+                old_classrooms = ["520"]
+            )
+        ],
+        teachers_changes = [
+            dict(class_name="8 А", **get_slot(TEACHER_COLUMN), subject="География ТК", teachers=["Новый учитель"], classrooms=["406"], old_teachers=["Саханова А.Р."])
+        ],
+        classrooms_changes = [
+            dict(class_name="8 А", **get_slot(CLASSROOM_COLUMN), subject="Дене шынықтыру", teachers=["Нурсолтанов Н.Н."], classrooms=["999"], old_classrooms=["СЗ Б1"])
+        ]
+    )
+
+
+def test_diff_of_json_and_parser(tmp_path: Path, example_parser: XLSXParser) -> None:
+    json_filepath: Path = tmp_path / "school_1.json"
+
+    example_parser.save(
+        json_filepath = json_filepath,
+        json_encoder = "json"
+    )
+
+    edited_xlsx_parser: XLSXParser = parse_example(write_example(tmp_path / "edited_1.xlsx", edit_timetable))
+
+    assert diff_timetables(json_filepath, edited_xlsx_parser) == diff_timetables(example_parser, edited_xlsx_parser)
+
+    assert not any(diff_timetables(json_filepath, example_parser).values())
@@ -0,0 +1,29 @@
+from json import loads as json_loads
+
+import pytest
+
+from edu_xlsx.encoders import JSON_ENCODERS, JSON_ENCODERS_FROM_NAME, StdlibJSONEncoder
+
+from typing import Optional
+
+
+@pytest.mark.parametrize("json_indent", [None, 2, 4])
+@pytest.mark.parametrize("json_encoder", [
+    json_encoder.name
+    for json_encoder in JSON_ENCODERS
+    if json_encoder.is_available()
+])
+def test_encoders_match_stdlib(example_parser, json_encoder: str, json_indent: Optional[int]) -> None:
+    if not JSON_ENCODERS_FROM_NAME[json_encoder].supports_indent(json_indent):
+        pytest.skip("{json_encoder} does not support indent {json_indent}".format(
+            json_encoder = json_encoder,
+            json_indent = json_indent
+        ))
+
+    # Colors are derived from names by default, so every output has the same ones
+    assert json_loads(b"".join(example_parser.iter_json(
+        json_indent = json_indent,
+        json_encoder = json_encoder
+    ))) == json_loads(b"".join(example_parser.iter_json(
+        json_encoder = StdlibJSONEncoder.name
+    )))
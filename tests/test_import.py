@@ -0,0 +1,37 @@
+from pathlib import Path
+from subprocess import run
+from json import loads as json_loads
+
+import sys
+
+from typing import List
+
+
+HEAVY_MODULES: List[str] = ["openpyxl", "pydantic", "prettytable", "orjson", "ujson"]
+
+IMPORT_SCRIPT: str = """
+import json, sys
+
+import edu_xlsx
+import edu_xlsx.encoders
+
+print(json.dumps([
+    module_name
+    for module_name in {modules!r}
+    if module_name in sys.modules
+]))
+""".format(
+    modules = HEAVY_MODULES
+)
+
+
+def test_import_is_light() -> None:
+    # A fresh interpreter, other tests have imported the parser already
+    loaded_modules: List[str] = json_loads(run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd = Path(__file__).parent.parent,
+        capture_output = True,
+        check = True
+    ).stdout)
+
+    assert loaded_modules == []
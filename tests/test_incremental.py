@@ -0,0 +1,118 @@
+from pathlib import Path
+from collections import Counter
+from shutil import copyfile
+
+import pytest
+
+from conftest import EXAMPLE_XLSX_FILEPATH, EXAMPLE_TIMETABLE_NUMBER, parse_example, write_example, get_timetable_by_names
+
+from edu_xlsx.parser import XLSXParser, SHEET_FIRST_ROW, SHEET_BLOCK_ROWS, STORE_OBJECTS, STORE_COLUMNAR
+from edu_xlsx.cache import ParseCache
+
+from typing import List, Any
+
+
+# Second class block
+EDITED_BLOCK_INDEX: int = 1
+EDITED_SUBJECT_NAME: str = "Новый предмет"
+
+
+def edit_subject(sheet: Any) -> None:
+    sheet.cell(SHEET_FIRST_ROW + EDITED_BLOCK_INDEX * SHEET_BLOCK_ROWS, 2).value = EDITED_SUBJECT_NAME
+
+
+def remove_rarest_subject(sheet: Any) -> None:
+    subject_cells: List[Any] = [
+        cell
+        for row in sheet.iter_rows(min_row=SHEET_FIRST_ROW, min_col=2)
+        for cell in row
+        if (cell.row - SHEET_FIRST_ROW) % SHEET_BLOCK_ROWS == 0 and cell.value
+    ]
+
+    subject_name: str = min(
+        Counter([cell.value for cell in subject_cells]).items(),
+        key = lambda item: item[1]
+    )[0]
+
+    for cell in subject_cells:
+        if cell.value == subject_name:
+            # Classes row stays, it names the class
+            for row_offset in (0, 2, 3):
+                sheet.cell(cell.row + row_offset, cell.column).value = None
+
+
+def parse_incrementally(tmp_path: Path, edited_xlsx_filepath: Path, **kwargs: Any) -> XLSXParser:
+    xlsx_filepath: Path = tmp_path / "school_1.xlsx"
+    copyfile(EXAMPLE_XLSX_FILEPATH, xlsx_filepath)
+
+    xlsx_parser: XLSXParser = XLSXParser(
+        xlsx_filepath = xlsx_filepath,
+        timetable_number = EXAMPLE_TIMETABLE_NUMBER,
+        **kwargs
+    )
+
+    xlsx_parser.parse(incremental=True)
+
+    copyfile(edited_xlsx_filepath, xlsx_filepath)
+
+    xlsx_parser.parse(incremental=True)
+    xlsx_parser.close()
+
+    return xlsx_parser
+
+
+def test_unchanged(tmp_path: Path, example_parser: XLSXParser) -> None:
+    xlsx_parser: XLSXParser = parse_incrementally(tmp_path, EXAMPLE_XLSX_FILEPATH)
+
+    assert xlsx_parser.changed_sheet_blocks == []
+    assert b"".join(xlsx_parser.iter_json(json_encoder="json")) == b"".join(example_parser.iter_json(json_encoder="json"))
+
+
+@pytest.mark.parametrize("store", [STORE_OBJECTS, STORE_COLUMNAR])
+def test_edited(tmp_path: Path, store: str) -> None:
+    edited_xlsx_filepath: Path = write_example(tmp_path / "edited_1.xlsx", edit_subject)
+
+    xlsx_parser: XLSXParser = parse_incrementally(tmp_path, edited_xlsx_filepath, store=store)
+
+    if store == STORE_OBJECTS:
+        assert xlsx_parser.changed_sheet_blocks == [EDITED_BLOCK_INDEX]
+
+    assert get_timetable_by_names(xlsx_parser) == get_timetable_by_names(parse_example(edited_xlsx_filepath, store=store))
+
+
+def test_removed(tmp_path: Path) -> None:
+    removed_xlsx_filepath: Path = write_example(tmp_path / "removed_1.xlsx", remove_rarest_subject)
+
+    xlsx_parser: XLSXParser = parse_incrementally(tmp_path, removed_xlsx_filepath)
+    full_xlsx_parser: XLSXParser = parse_example(removed_xlsx_filepath)
+
+    assert len(full_xlsx_parser._subjects) < len(parse_example()._subjects)
+    assert get_timetable_by_names(xlsx_parser) == get_timetable_by_names(full_xlsx_parser)
+
+    # Kept entities keep their IDs, new ones don't take them
+    for registry in (xlsx_parser._subjects, xlsx_parser._classrooms, xlsx_parser._teachers):
+        assert len({item.id for item in registry}) == len(registry)
+
+
+def test_not_cached(tmp_path: Path) -> None:
+    parse_cache: ParseCache = ParseCache(
+        cache_dir = tmp_path / "cache"
+    )
+
+    edited_xlsx_filepath: Path = write_example(tmp_path / "edited_1.xlsx", edit_subject)
+
+    parse_incrementally(tmp_path, edited_xlsx_filepath, cache=parse_cache)
+
+    # Only the first, fresh parse was stored
+    assert (parse_cache.hits, parse_cache.misses) == (0, 1)
+
+    xlsx_parser: XLSXParser = XLSXParser(
+        xlsx_filepath = EXAMPLE_XLSX_FILEPATH,
+        timetable_number = EXAMPLE_TIMETABLE_NUMBER,
+        cache = parse_cache
+    )
+
+    xlsx_parser.parse(incremental=True)
+
+    assert parse_cache.hits == 1
+    assert xlsx_parser.changed_sheet_blocks == []
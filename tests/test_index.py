@@ -0,0 +1,66 @@
+from edu_xlsx.parser import XLSXParser
+from edu_xlsx.index import TimetableIndex
+
+from typing import List, Set, Tuple, Optional
+
+
+def get_card_ids(cards: List) -> List[Tuple[str, str, str]]:
+    return [
+        (card.lessonid, card.days, card.period)
+        for card in cards
+    ]
+
+
+def test_lookups_match_scan(example_parser: XLSXParser) -> None:
+    index: TimetableIndex = example_parser.index
+
+    lessons_from_id = {
+        lesson.id: lesson
+        for lesson in example_parser._lessons
+    }
+
+    slots: Set[Tuple[str, str]] = {
+        (card.days, card.period)
+        for card in example_parser._cards
+    }
+
+    # With filters of a slot the example has, and of one it doesn't
+    filters: List[Tuple[Optional[str], Optional[str]]] = [(None, None), ("01000", None), (None, "3"), ("00100", "2"), ("11111", "9")]
+
+    for teacher in example_parser._teachers:
+        for days, period in filters:
+            assert get_card_ids(index.get_teacher_cards(teacher.id, days, period)) == get_card_ids([
+                card
+                for card in example_parser._cards
+                if teacher.id in lessons_from_id[card.lessonid].teacherids and (days is None or card.days == days) and (period is None or card.period == period)
+            ])
+
+    for classroom in example_parser._classrooms:
+        for days, period in filters:
+            assert get_card_ids(index.get_classroom_cards(classroom.id, days, period)) == get_card_ids([
+                card
+                for card in example_parser._cards
+                if classroom.id in card.classroomids and (days is None or card.days == days) and (period is None or card.period == period)
+            ])
+
+    for class_ in example_parser._classes:
+        assert get_card_ids(index.get_class_cards(class_.id)) == get_card_ids([
+            card
+            for card in example_parser._cards
+            if class_.id in lessons_from_id[card.lessonid].classids
+        ])
+
+    for days, period in slots:
+        assert get_card_ids(index.get_slot_cards(days, int(period))) == get_card_ids([
+            card
+            for card in example_parser._cards
+            if (card.days, card.period) == (days, period)
+        ])
+
+
+def test_unknown_ids(example_parser: XLSXParser) -> None:
+    index: TimetableIndex = example_parser.index
+
+    assert index.get_teacher_cards("") == []
+    assert index.get_classroom_cards("*0") == []
+    assert index.get_class_cards("*0") == []
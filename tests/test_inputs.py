@@ -0,0 +1,62 @@
+from pathlib import Path
+from io import BytesIO
+
+import pytest
+
+from conftest import EXAMPLE_XLSX_FILEPATH, EXAMPLE_TIMETABLE_NUMBER
+
+from edu_xlsx.parser import XLSXParser, ENGINE_OPENPYXL, ENGINE_OOXML
+from edu_xlsx.cache import ParseCache
+
+from typing import Dict, Callable, Any
+
+
+XLSX_DATA: bytes = EXAMPLE_XLSX_FILEPATH.read_bytes()
+
+# In-memory inputs are read in the constructor, so they are built per parse
+INPUT_PARSER_FACTORIES: Dict[str, Callable[..., XLSXParser]] = {
+    "str": lambda **kwargs: XLSXParser(str(EXAMPLE_XLSX_FILEPATH), EXAMPLE_TIMETABLE_NUMBER, **kwargs),
+    "bytes": lambda **kwargs: XLSXParser.from_bytes(XLSX_DATA, EXAMPLE_TIMETABLE_NUMBER, **kwargs),
+    "bytearray": lambda **kwargs: XLSXParser.from_bytes(bytearray(XLSX_DATA), EXAMPLE_TIMETABLE_NUMBER, **kwargs),
+    "memoryview": lambda **kwargs: XLSXParser.from_bytes(memoryview(XLSX_DATA), EXAMPLE_TIMETABLE_NUMBER, **kwargs),
+    "stream": lambda **kwargs: XLSXParser.from_stream(BytesIO(XLSX_DATA), EXAMPLE_TIMETABLE_NUMBER, **kwargs)
+}
+
+
+def parse(create_parser: Callable[..., XLSXParser], **kwargs: Any) -> bytes:
+    xlsx_parser: XLSXParser = create_parser(**kwargs)
+
+    try:
+        xlsx_parser.parse()
+
+    finally:
+        xlsx_parser.close()
+
+    return b"".join(xlsx_parser.iter_json(json_encoder="json"))
+
+
+@pytest.mark.parametrize("engine", [ENGINE_OPENPYXL, ENGINE_OOXML])
+@pytest.mark.parametrize("input_kind", list(INPUT_PARSER_FACTORIES))
+def test_input_matches_path(example_parser: XLSXParser, input_kind: str, engine: str) -> None:
+    assert parse(INPUT_PARSER_FACTORIES[input_kind], engine=engine) == b"".join(example_parser.iter_json(json_encoder="json"))
+
+
+@pytest.mark.parametrize("input_kind", ["bytes", "memoryview", "stream"])
+def test_cache_key_of_input_matches_path(tmp_path: Path, example_parser: XLSXParser, input_kind: str) -> None:
+    parse_cache: ParseCache = ParseCache(
+        cache_dir = tmp_path
+    )
+
+    parse(
+        lambda **kwargs: XLSXParser(EXAMPLE_XLSX_FILEPATH, EXAMPLE_TIMETABLE_NUMBER, **kwargs),
+        cache = parse_cache
+    )
+
+    # Stored by the path parse, found by content
+    assert parse(INPUT_PARSER_FACTORIES[input_kind], cache=parse_cache) == b"".join(example_parser.iter_json(json_encoder="json"))
+    assert (parse_cache.misses, parse_cache.hits) == (1, 1)
+
+
+def test_not_xlsx_data() -> None:
+    with pytest.raises(ValueError, match="must be a .XLSX file"):
+        XLSXParser.from_stream(BytesIO(b"not a workbook"), EXAMPLE_TIMETABLE_NUMBER)
@@ -0,0 +1,91 @@
+from io import BytesIO
+from pathlib import Path
+
+from conftest import parse_example
+
+from edu_xlsx.parser import XLSXParser, STORE_COLUMNAR
+from edu_xlsx.metrics import ParseMetrics, get_percentiles
+from edu_xlsx.cache import ParseCache
+
+from typing import List
+
+
+def test_parse_fills_phases_and_counts(example_parser: XLSXParser) -> None:
+    notified_metrics: List[ParseMetrics] = []
+
+    metrics: ParseMetrics = ParseMetrics(
+        trace_memory = True,
+        callback = notified_metrics.append
+    )
+
+    try:
+        xlsx_parser: XLSXParser = parse_example(
+            metrics = metrics
+        )
+
+    finally:
+        metrics.stop()
+
+    assert set(metrics.seconds) == {"load", "read_sheet", "classes", "sheet_blocks"}
+    assert all(seconds > 0 for seconds in metrics.seconds.values())
+    assert set(metrics.peak_memory_bytes) == set(metrics.seconds)
+
+    classes_len: int = len(example_parser._classes)
+
+    # The last call finds the rows are over
+    assert metrics.calls == dict(
+        load = 1,
+        read_sheet = classes_len + 1,
+        classes = classes_len,
+        sheet_blocks = classes_len
+    )
+
+    assert metrics.counts["classroom_cache_hits"] + metrics.counts["classroom_cache_misses"] > 0
+
+    assert {
+        name: count
+        for name, count in metrics.counts.items()
+        if not name.startswith("classroom_cache_")
+    } == dict(
+        classes = classes_len,
+        groups = len(example_parser._groups),
+        subjects = len(example_parser._subjects),
+        classrooms = len(example_parser._classrooms),
+        teachers = len(example_parser._teachers),
+        lessons = len(example_parser._lessons),
+        cards = len(example_parser._cards),
+        changed_sheet_blocks = classes_len
+    )
+
+    xlsx_parser.save(
+        json_filepath = BytesIO()
+    )
+
+    assert metrics.calls["save"] == 1
+    assert notified_metrics == [metrics, metrics]
+
+
+def test_columnar_and_cache_phases(tmp_path: Path) -> None:
+    parse_cache: ParseCache = ParseCache(
+        cache_dir = tmp_path
+    )
+
+    metrics_list: List[ParseMetrics] = [ParseMetrics(), ParseMetrics()]
+
+    for metrics in metrics_list:
+        parse_example(
+            store = STORE_COLUMNAR,
+            cache = parse_cache,
+            metrics = metrics
+        )
+
+    assert {"cache_load", "compact", "cache_store"} <= set(metrics_list[0].seconds)
+
+    # The second parse is loaded from the cache
+    assert set(metrics_list[1].seconds) == {"cache_load"}
+    assert metrics_list[1].counts["lessons"] == metrics_list[0].counts["lessons"] > 0
+
+
+def test_get_percentiles() -> None:
+    assert get_percentiles([]) == {}
+    assert get_percentiles(range(1, 101), (50, 99)) == dict(p50=50, p99=99)
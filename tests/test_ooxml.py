@@ -0,0 +1,31 @@
+from conftest import EXAMPLE_XLSX_FILEPATH, parse_example
+
+from edu_xlsx.ooxml import OOXMLSheetReader
+from edu_xlsx.parser import ENGINE_OOXML
+
+
+def test_iter_rows_matches_openpyxl() -> None:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(
+        filename = EXAMPLE_XLSX_FILEPATH
+    )
+
+    sheet_reader: OOXMLSheetReader = OOXMLSheetReader(
+        xlsx_file = EXAMPLE_XLSX_FILEPATH
+    )
+
+    try:
+        sheet = workbook.worksheets[0]
+
+        assert (sheet_reader.max_row, sheet_reader.max_column) == (sheet.max_row, sheet.max_column)
+
+        assert list(sheet_reader.iter_rows(min_row=2)) == list(sheet.iter_rows(min_row=2, values_only=True))
+
+    finally:
+        sheet_reader.close()
+        workbook.close()
+
+
+def test_parse_output_matches_openpyxl(example_parser) -> None:
+    assert b"".join(parse_example(engine=ENGINE_OOXML).iter_json(json_encoder="json")) == b"".join(example_parser.iter_json(json_encoder="json"))
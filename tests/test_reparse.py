@@ -0,0 +1,61 @@
+from pathlib import Path
+from shutil import copyfile
+
+import pytest
+
+from conftest import EXAMPLE_XLSX_FILEPATH, EXAMPLE_TIMETABLE_NUMBER, parse_example, write_example, get_timetable_by_names
+
+from edu_xlsx.parser import XLSXParser, SHEET_FIRST_ROW, SHEET_BLOCK_ROWS
+
+from typing import Set, Any
+
+
+RENAMED_CLASSROOM_NAME: str = "999"
+
+
+def rename_first_classroom(sheet: Any) -> None:
+    # The first classroom met gets the first ID, so every later classroom ID shifts
+    for row in sheet.iter_rows(min_row=SHEET_FIRST_ROW + 2, min_col=2):
+        if (row[0].row - SHEET_FIRST_ROW) % SHEET_BLOCK_ROWS != 2:
+            continue
+
+        for cell in row:
+            if cell.value:
+                cell.value = RENAMED_CLASSROOM_NAME
+                return
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_reparse_matches_fresh_parse(tmp_path: Path, incremental: bool) -> None:
+    renamed_xlsx_filepath: Path = write_example(tmp_path / "renamed_1.xlsx", rename_first_classroom)
+
+    xlsx_filepath: Path = tmp_path / "school_1.xlsx"
+    copyfile(EXAMPLE_XLSX_FILEPATH, xlsx_filepath)
+
+    xlsx_parser: XLSXParser = XLSXParser(
+        xlsx_filepath = xlsx_filepath,
+        timetable_number = EXAMPLE_TIMETABLE_NUMBER
+    )
+
+    xlsx_parser.parse(incremental=incremental)
+    # A full parse reads the open workbook again, so the file is read anew after closing it
+    xlsx_parser.close()
+
+    copyfile(renamed_xlsx_filepath, xlsx_filepath)
+
+    xlsx_parser.parse(incremental=incremental)
+    xlsx_parser.close()
+
+    fresh_xlsx_parser: XLSXParser = parse_example(renamed_xlsx_filepath)
+
+    classroom_ids: Set[str] = {
+        classroom.id
+        for classroom in xlsx_parser._classrooms
+    }
+
+    assert RENAMED_CLASSROOM_NAME in [classroom.name for classroom in fresh_xlsx_parser._classrooms]
+    assert all(set(card.classroomids) <= classroom_ids for card in xlsx_parser._cards)
+    assert get_timetable_by_names(xlsx_parser) == get_timetable_by_names(fresh_xlsx_parser)
+
+    if not incremental:
+        assert b"".join(xlsx_parser.iter_json(json_encoder="json")) == b"".join(fresh_xlsx_parser.iter_json(json_encoder="json"))
@@ -0,0 +1,108 @@
+from pathlib import Path
+from shutil import copyfile
+from subprocess import run
+from threading import Thread
+from http.client import HTTPConnection, HTTPResponse
+from json import loads as json_loads
+
+import sys
+
+import pytest
+
+from conftest import EXAMPLE_XLSX_FILEPATH, EXAMPLE_TIMETABLE_NUMBER
+
+from edu_xlsx.server import ConversionService, ConversionHTTPServer, CONVERT_PATH, HEALTH_PATH
+
+from typing import Dict, Tuple, Iterator, Any
+
+
+@pytest.fixture(scope="module")
+def http_server() -> Iterator[ConversionHTTPServer]:
+    service: ConversionService = ConversionService(
+        workers = 1,
+        json_encoder = "json"
+    )
+
+    http_server: ConversionHTTPServer = ConversionHTTPServer(
+        server_address = ("127.0.0.1", 0),
+        service = service,
+        log_requests = False
+    )
+
+    thread: Thread = Thread(
+        target = http_server.serve_forever,
+        daemon = True
+    )
+
+    thread.start()
+
+    try:
+        yield http_server
+
+    finally:
+        http_server.shutdown()
+        http_server.server_close()
+        service.close()
+
+
+def request(http_server: ConversionHTTPServer, method: str, path: str, body: bytes=b"") -> Tuple[int, bytes]:
+    connection: HTTPConnection = HTTPConnection(*http_server.server_address[:2], timeout=60)
+
+    try:
+        connection.request(method, path, body=body)
+        response: HTTPResponse = connection.getresponse()
+
+        return response.status, response.read()
+
+    finally:
+        connection.close()
+
+
+def test_convert_matches_cli(http_server: ConversionHTTPServer, tmp_path: Path) -> None:
+    status, json_data = request(
+        http_server,
+        "POST",
+        "{path}?timetable_number={timetable_number}".format(
+            path = CONVERT_PATH,
+            timetable_number = EXAMPLE_TIMETABLE_NUMBER
+        ),
+        EXAMPLE_XLSX_FILEPATH.read_bytes()
+    )
+
+    assert status == 200
+
+    # CLI takes the timetable number from the input name
+    xlsx_filepath: Path = tmp_path / "school_{}.xlsx".format(EXAMPLE_TIMETABLE_NUMBER)
+    copyfile(EXAMPLE_XLSX_FILEPATH, xlsx_filepath)
+
+    run(
+        [sys.executable, "-m", "edu_xlsx", str(xlsx_filepath), str(tmp_path / "school.json"), "--json-encoder", "json", "--no-cache"],
+        cwd = Path(__file__).parent.parent,
+        capture_output = True,
+        check = True
+    )
+
+    assert json_data == (tmp_path / "school.json").read_bytes()
+
+    health: Dict[str, Any] = json_loads(request(http_server, "GET", HEALTH_PATH)[1])
+
+    assert health["counts"]["succeeded"] >= 1
+
+
+def test_not_xlsx_body(http_server: ConversionHTTPServer) -> None:
+    status, json_data = request(
+        http_server,
+        "POST",
+        "{path}?timetable_number={timetable_number}".format(
+            path = CONVERT_PATH,
+            timetable_number = EXAMPLE_TIMETABLE_NUMBER
+        ),
+        b"timetable.xlsx"
+    )
+
+    assert status == 400
+    assert "error" in json_loads(json_data)
+
+
+def test_timetable_number_required(http_server: ConversionHTTPServer) -> None:
+    assert request(http_server, "POST", CONVERT_PATH, EXAMPLE_XLSX_FILEPATH.read_bytes())[0] == 400
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+from conftest import EXAMPLE_XLSX_FILEPATH
+
+from edu_xlsx.ooxml import get_sheet_index
+from edu_xlsx.parser import SHEET_FIRST_ROW
+from edu_xlsx.sheets import WorkbookParser, parse_sheets_config, resolve_sheets
+
+
+SHEET_1_SUBJECT_NAME: str = "Только на листе 1"
+
+
+def write_digit_named_sheets(xlsx_filepath: Path) -> Path:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(
+        filename = EXAMPLE_XLSX_FILEPATH
+    )
+
+    # Sheet "1" is the second one, so its name and its index differ
+    workbook.worksheets[0].title = "2"
+    sheet = workbook.copy_worksheet(workbook.worksheets[0])
+    sheet.title = "1"
+    sheet.cell(SHEET_FIRST_ROW, 2).value = SHEET_1_SUBJECT_NAME
+
+    workbook.save(xlsx_filepath)
+    workbook.close()
+
+    return xlsx_filepath
+
+
+def test_get_sheet_index() -> None:
+    sheetnames = ["2", "1", "Корпус Б"]
+
+    assert get_sheet_index(sheetnames, "1") == 1
+    assert get_sheet_index(sheetnames, "2") == 0
+    assert get_sheet_index(sheetnames, "Корпус Б") == 2
+    assert get_sheet_index(sheetnames, 2) == 2
+    assert get_sheet_index(["Смена 1", "Смена 2"], "1") == 1
+
+
+def test_digit_named_sheets() -> None:
+    sheetnames = ["2", "1"]
+
+    assert resolve_sheets(sheetnames, parse_sheets_config(["1=1", "2=2"])) == [("1", "1"), ("2", "2")]
+    assert resolve_sheets(sheetnames, parse_sheets_config(["1=2"])) == [("1", "2")]
+
+
+def test_digit_named_sheets_parse(tmp_path: Path) -> None:
+    workbook_parser: WorkbookParser = WorkbookParser(
+        xlsx_filepath = write_digit_named_sheets(tmp_path / "shifts.xlsx"),
+        sheets = parse_sheets_config(["1=1", "2=2"])
+    )
+
+    workbook_parser.parse()
+
+    assert [
+        (sheetname, xlsx_parser.sheet, xlsx_parser.timetable_number)
+        for sheetname, xlsx_parser in workbook_parser.parsers.items()
+    ] == [("1", "1", "1"), ("2", "2", "2")]
+
+    assert [
+        SHEET_1_SUBJECT_NAME in xlsx_parser._subjects_from_name
+        for xlsx_parser in workbook_parser.parsers.values()
+    ] == [True, False]
@@ -0,0 +1,72 @@
+from types import ModuleType
+
+import pytest
+
+from openpyxl.utils import get_column_letter, column_index_from_string
+
+from conftest import EXAMPLE_TIMETABLE_NUMBER
+
+from edu_xlsx.utils import T_COLUMN_SLOT, import_datas_module, parse_coordinate_ord, build_column_slots, get_column_slots
+
+from typing import List, Optional
+
+
+@pytest.mark.parametrize("coordinate, coordinate_ord", [
+    ("A1", 65),
+    ("B2", 66),
+    ("Z5", 90),
+    ("AA2", 91),
+    ("AZ10", 116),
+    ("BA2", 117),
+    ("AO184", 105)
+])
+def test_parse_coordinate_ord(coordinate: str, coordinate_ord: int) -> None:
+    assert parse_coordinate_ord(coordinate) == coordinate_ord
+
+
+def test_parse_coordinate_ord_matches_openpyxl() -> None:
+    for column in range(1, 1000):
+        assert parse_coordinate_ord("{}7".format(get_column_letter(column))) == 64 + column
+
+
+def test_column_slots_match_formula() -> None:
+    datas_module: ModuleType = import_datas_module(
+        timetable_number = EXAMPLE_TIMETABLE_NUMBER
+    )
+
+    periods_len: int = len(datas_module.periods)
+    daysdefs: List[dict] = datas_module.daysdefs
+
+    column_slots: List[Optional[T_COLUMN_SLOT]] = get_column_slots(EXAMPLE_TIMETABLE_NUMBER, 100)
+
+    assert column_slots == build_column_slots(periods_len, daysdefs, 100)
+    assert column_slots[:2] == [None, None]
+
+    # The per-lesson arithmetic the table replaced, by column letters
+    for column in range(2, 101):
+        coordinate_ord: int = parse_coordinate_ord("{}5".format(get_column_letter(column)))
+        daysdef_id_num: int = (coordinate_ord - 65 + periods_len - 1) // periods_len
+
+        if daysdef_id_num > len(daysdefs):
+            assert column_slots[column] is None
+            continue
+
+        assert column_slots[column] == (
+            str((coordinate_ord - 65) % periods_len or periods_len),
+            "*{}".format(daysdef_id_num),
+            daysdefs[daysdef_id_num - 1]["days"]
+        )
+
+
+@pytest.mark.parametrize("column_letters, column_slot", [
+    ("B", ("1", "*1", "10000")),
+    ("I", ("8", "*1", "10000")),
+    ("J", ("1", "*2", "01000")),
+    ("AA", ("2", "*4", "00010")),
+    ("AO", ("8", "*5", "00001")),
+    ("BA", ("4", "*7", "11111")),
+    ("BE", ("8", "*7", "11111")),
+    ("BF", None)
+])
+def test_column_slot_lookup(column_letters: str, column_slot: Optional[T_COLUMN_SLOT]) -> None:
+    assert get_column_slots(EXAMPLE_TIMETABLE_NUMBER, 100)[column_index_from_string(column_letters)] == column_slot
@@ -0,0 +1,109 @@
+from pathlib import Path
+from shutil import copyfile
+from threading import Timer
+
+import pytest
+
+from conftest import EXAMPLE_XLSX_FILEPATH, write_example
+
+from edu_xlsx.watch import Watcher, PollingWatcher, InotifyWatcher, create_watcher, watch
+
+from typing import List, Dict, Any
+
+
+POLL_INTERVAL: float = 0.05
+WAIT_TIMEOUT: float = 5.0
+
+inotify_only = pytest.mark.skipif(not InotifyWatcher.is_available(), reason="inotify is not available")
+
+
+class StopWatching(Exception):
+    pass
+
+
+@pytest.mark.parametrize("watcher_class", [
+    PollingWatcher,
+    pytest.param(InotifyWatcher, marks=inotify_only)
+])
+def test_watcher_sees_changes(tmp_path: Path, watcher_class: type) -> None:
+    xlsx_filepath: Path = tmp_path / "school_1.xlsx"
+    xlsx_filepath.write_bytes(b"first")
+
+    watcher: Watcher = watcher_class(
+        lambda: [(xlsx_filepath, tmp_path / "school_1.json")]
+    )
+
+    try:
+        assert not watcher.wait(POLL_INTERVAL * 2)
+
+        xlsx_filepath.write_bytes(b"changed")
+
+        assert watcher.wait(WAIT_TIMEOUT)
+
+    finally:
+        watcher.close()
+
+
+@inotify_only
+def test_missing_directory_falls_back_to_polling(tmp_path: Path) -> None:
+    with pytest.warns(RuntimeWarning, match="inotify_add_watch"):
+        watcher: Watcher = create_watcher(
+            get_jobs = lambda: [],
+            input_dirs = [tmp_path / "missing"]
+        )
+
+    assert isinstance(watcher, PollingWatcher)
+
+
+@inotify_only
+def test_failed_inotify_init_falls_back_to_polling(monkeypatch) -> None:
+    class FailingLibc:
+        @staticmethod
+        def inotify_init1(flags: int) -> int:
+            return -1
+
+    monkeypatch.setattr(InotifyWatcher, "_load_libc", staticmethod(lambda: FailingLibc()))
+
+    with pytest.warns(RuntimeWarning, match="inotify_init1"):
+        assert isinstance(create_watcher(lambda: []), PollingWatcher)
+
+
+@pytest.mark.parametrize("polling", [True, False])
+def test_watch_converts_again_on_change(tmp_path: Path, polling: bool) -> None:
+    xlsx_filepath: Path = tmp_path / "school_1.xlsx"
+    json_filepath: Path = tmp_path / "school_1.json"
+
+    copyfile(EXAMPLE_XLSX_FILEPATH, xlsx_filepath)
+
+    edited_xlsx_filepath: Path = write_example(
+        tmp_path / "edited.xlsx",
+        lambda sheet: setattr(sheet.cell(5, 2), "value", "Новый предмет")
+    )
+
+    conversions: List[Dict[str, Any]] = []
+
+    def on_results(results: List[Dict[str, Any]]) -> None:
+        conversions.extend(results)
+
+        if len(conversions) == 1:
+            # Written after watching starts
+            Timer(0.2, copyfile, (edited_xlsx_filepath, xlsx_filepath)).start()
+            return
+
+        raise StopWatching
+
+    with pytest.raises(StopWatching):
+        watch(
+            get_jobs = lambda: [(xlsx_filepath, json_filepath)],
+            options = dict(
+                no_cache = True,
+                json_encoder = "json"
+            ),
+            on_results = on_results,
+            debounce = 0.1,
+            poll_interval = POLL_INTERVAL,
+            polling = polling
+        )
+
+    assert [result["error"] for result in conversions] == [None, None]
+    assert "Новый предмет".encode("utf-8") in json_filepath.read_bytes()